@@ -13,6 +13,8 @@ from pathlib import Path
 from typing import cast
 
 import astroid
+from astroid import profiling
+from astroid.exceptions import AstroidError
 
 
 class Arguments(Namespace):
@@ -23,9 +25,21 @@ class ASTParserArguments(Arguments):
     file: str
 
 
-def parse_ast(args: ASTParserArguments) -> int:
-    if not ((file := Path(args.file)).is_file() and file.suffix in {".py", ".pyi"}):
+class ProfileArguments(Arguments):
+    file: str
+    limit: int
+    sort: str
+
+
+def _python_file(path: str) -> Path | None:
+    if not ((file := Path(path)).is_file() and file.suffix in {".py", ".pyi"}):
         print(f"error: '{file}' does not exist or isn't a Python file")
+        return None
+    return file
+
+
+def parse_ast(args: ASTParserArguments) -> int:
+    if (file := _python_file(args.file)) is None:
         return 1
 
     tree = astroid.parse(file.read_text(encoding="utf8"))
@@ -33,6 +47,21 @@ def parse_ast(args: ASTParserArguments) -> int:
     return 0
 
 
+def profile_inference(args: ProfileArguments) -> int:
+    if (file := _python_file(args.file)) is None:
+        return 1
+
+    with profiling.profile() as stats:
+        tree = astroid.MANAGER.ast_from_file(str(file))
+        for node in tree.nodes_of_class(astroid.nodes.NodeNG):
+            try:
+                list(node.infer())
+            except AstroidError:
+                pass
+    print(stats.report(limit=args.limit, sort=args.sort))
+    return 0
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     argv = argv or sys.argv[1:]
     parser = ArgumentParser(description="Command line interface for astroid")
@@ -42,6 +71,21 @@ def main(argv: Sequence[str] | None = None) -> int:
     ast_parser.set_defaults(func=parse_ast)
     ast_parser.add_argument("file", metavar="FILE", help="File to parse")
 
+    profile_parser = subparsers.add_parser(
+        "profile", help="Profile the inference of every node of a file"
+    )
+    profile_parser.set_defaults(func=profile_inference)
+    profile_parser.add_argument("file", metavar="FILE", help="File to infer")
+    profile_parser.add_argument(
+        "--limit", type=int, default=20, help="Number of entries of each table"
+    )
+    profile_parser.add_argument(
+        "--sort",
+        choices=["calls", "cumulative_time", "self_time"],
+        default="self_time",
+        help="Order of the entries",
+    )
+
     args = cast(Arguments, parser.parse_args(argv))
     if "func" not in args:
         parser.print_help()
@@ -0,0 +1,139 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Functions run by the worker processes building or inferring in parallel.
+
+Workers send back serialized trees, see :mod:`astroid.nodes.serialization`.
+They can only build trees the parent process would build the same way: a worker
+whose transforms differ from the ones of the parent, e.g. because a plugin
+registered a transform in the parent after the worker was started, builds
+nothing and lets the parent build the files itself.
+
+Workers inferring nodes are forked from the parent instead, and infer the nodes
+in the trees they inherit from it.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from astroid import nodes, util
+from astroid.builder import AstroidBuilder
+from astroid.manager import AstroidManager
+from astroid.nodes.serialization import (
+    _dumps,
+    _dumps_built_module,
+    _registered_inference_tips,
+)
+from astroid.persistent_cache import transforms_fingerprint
+
+_SETTINGS = (
+    "always_load_extensions",
+    "optimize_ast",
+    "max_inferable_values",
+    "extension_package_whitelist",
+    "module_denylist",
+    "prefer_stubs",
+    "lazy_function_bodies",
+    "project_roots",
+    "search_path",
+)
+
+_worker_can_build = False
+
+_nodes_to_infer: list[nodes.NodeNG] = []
+"""The nodes given to :meth:`AstroidManager.infer_many`, in a worker inferring them."""
+
+_inferring_manager: AstroidManager | None = None
+"""The manager :meth:`AstroidManager.infer_many` was called on, in a worker."""
+
+
+def manager_settings(manager: AstroidManager) -> dict[str, Any]:
+    """Get the settings of *manager* to apply in the workers."""
+    return {name: getattr(manager, name) for name in _SETTINGS}
+
+
+def initialize_worker(settings: dict[str, Any], fingerprint: str) -> None:
+    """Apply the settings of the parent to the manager of this worker."""
+    global _worker_can_build  # pylint: disable=global-statement
+    manager = AstroidManager()
+    for name, value in settings.items():
+        if isinstance(value, set):
+            # These sets are shared with the brain and updated in place.
+            current = getattr(manager, name)
+            current.clear()
+            current.update(value)
+        else:
+            setattr(manager, name, value)
+    _worker_can_build = transforms_fingerprint(manager) == fingerprint
+
+
+def initialize_inferring_worker(
+    nodes_to_infer: list[nodes.NodeNG], manager: AstroidManager
+) -> None:
+    """Keep the nodes to infer and their manager in this worker.
+
+    Workers are forked, so they are inherited from the call to
+    :meth:`AstroidManager.infer_many` which started them instead of being
+    serialized, and the parent process never sets them: calls made from
+    several threads at once each give their own to their workers.
+    """
+    global _nodes_to_infer, _inferring_manager  # pylint: disable=global-statement
+    _nodes_to_infer = nodes_to_infer
+    _inferring_manager = manager
+
+
+def build_serialized(filepath: str, modname: str) -> bytes | None:
+    """Build the module of a source file and serialize it.
+
+    :returns: ``None`` if the module cannot be built or serialized, in which case
+        the parent builds it again to report the error or store it itself.
+    """
+    if not _worker_can_build:
+        return None
+    manager = AstroidManager()
+    try:
+        module = AstroidBuilder(manager).file_build(filepath, modname)
+        return _dumps_built_module(module, manager=manager)
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def infer_serialized(start: int, stop: int) -> bytes | list[bytes | None] | None:
+    """Infer the nodes to infer from *start* to *stop* and serialize the results.
+
+    :returns: The results serialized together or, if some of them cannot be
+        serialized, one by one with ``None`` for those. ``None`` if inference
+        raised an unexpected error, which the parent raises itself then.
+    """
+    manager = _inferring_manager or AstroidManager()
+    try:
+        with manager.activate():
+            results = [util.safe_infer(node) for node in _nodes_to_infer[start:stop]]
+    except Exception:  # pylint: disable=broad-except
+        return None
+    inference_tips = _registered_inference_tips(manager)
+    try:
+        return _dumps(
+            results,
+            manager=manager,
+            inference_tips=inference_tips,
+            shared_trees=True,
+        )
+    except TypeError:
+        pass
+    serialized: list[bytes | None] = []
+    for result in results:
+        try:
+            serialized.append(
+                _dumps(
+                    (result,),
+                    manager=manager,
+                    inference_tips=inference_tips,
+                    shared_trees=True,
+                )
+            )
+        except TypeError:
+            serialized.append(None)
+    return serialized
@@ -5,7 +5,8 @@ It prevents a circular import that happened
 when the only possibility to import it was from astroid.__init__.py.
 
 This AstroidManager is a singleton/borg so it's possible to instantiate an
-AstroidManager() directly.
+AstroidManager() directly. AstroidManager.isolated() creates managers with a
+state of their own.
 """
 
 # Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
@@ -235,12 +235,12 @@ def register_builtin_transform(
         node: nodes.Call, context: InferenceContext | None = None
     ) -> Iterator:
         result = transform(node, context=context)
-        if result:
-            if not result.parent:
-                # Let the transformation function determine
-                # the parent for its result. Otherwise,
-                # we set it to be the node we transformed from.
-                result.parent = node
+        # Nodes of other trees, e.g. found by getattr(), are left as they are.
+        if result and not result.parent:
+            # Let the transformation function determine
+            # the parent for its result. Otherwise,
+            # we set it to be the node we transformed from.
+            result.parent = node
 
             if result.lineno is None:
                 result.lineno = node.lineno
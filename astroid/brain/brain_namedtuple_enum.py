@@ -14,7 +14,7 @@ from textwrap import dedent
 from typing import Final
 
 from astroid import arguments, bases, nodes, util
-from astroid.builder import AstroidBuilder, _extract_single_node, extract_node
+from astroid.builder import AstroidBuilder, extract_node
 from astroid.context import InferenceContext
 from astroid.exceptions import (
     AstroidError,
@@ -27,6 +27,7 @@ from astroid.exceptions import (
 from astroid.inference_tip import inference_tip
 from astroid.manager import AstroidManager
 from astroid.nodes.scoped_nodes.scoped_nodes import SYNTHETIC_ROOT
+from astroid.templates import Template
 
 ENUM_QNAME: Final[str] = "enum.Enum"
 TYPING_NAMEDTUPLE_QUALIFIED: Final = {
@@ -39,6 +40,51 @@ TYPING_NAMEDTUPLE_BASENAMES: Final = {
     "typing_extensions.NamedTuple",
 }
 
+_TUPLE_BASE = Template("tuple")
+_NAMEDTUPLE_FUNCTION = Template("import collections; collections.namedtuple")
+_ENUM_META = Template("""
+class EnumMeta(object):
+    'docstring'
+    def __call__(self, node):
+        class EnumAttribute(object):
+            name = ''
+            value = 0
+        return EnumAttribute()
+    def __iter__(self):
+        class EnumAttribute(object):
+            name = ''
+            value = 0
+        return [EnumAttribute()]
+    def __reversed__(self):
+        class EnumAttribute(object):
+            name = ''
+            value = 0
+        return (EnumAttribute, )
+    def __next__(self):
+        return next(iter(self))
+    def __getitem__(self, attr):
+        class Value(object):
+            @property
+            def name(self):
+                return ''
+            @property
+            def value(self):
+                return attr
+
+        return Value()
+    __members__ = ['']
+""")
+_ENUM_NAME_PROPERTY = Template('''
+@property
+def name(self):
+    """The name of the Enum member.
+
+    This is a reconstruction by astroid: enums are too dynamic to understand, but we at least
+    know 'name' should be a string, so this is astroid's best guess.
+    """
+    return ''
+''')
+
 
 def _infer_first(node, context):
     if isinstance(node, util.UninferableBase):
@@ -204,19 +250,51 @@ _looks_like_enum = functools.partial(_looks_like, name="Enum")
 _looks_like_typing_namedtuple = functools.partial(_looks_like, name="NamedTuple")
 
 
+@functools.lru_cache(maxsize=32)
+def _namedtuple_template(field_count: int) -> Template:
+    """Get the template of the class of the namedtuples with *field_count* fields.
+
+    Its placeholders are ``_NamedTuple`` for the name of the class, and
+    ``_field_0``, ``_field_1``... for the names of the fields, which ``_fields``
+    holds as strings.
+    """
+    fields = tuple(f"_field_{index}" for index in range(field_count))
+    replace_args = ", ".join(f"{field}=None" for field in fields)
+    field_def = (
+        "    {name} = property(lambda self: self[{index:d}], "
+        "doc='Alias for field number {index:d}')"
+    )
+    field_defs = "\n".join(
+        field_def.format(name=name, index=index) for index, name in enumerate(fields)
+    )
+    return Template(f"""
+class _NamedTuple(tuple):
+    __slots__ = ()
+    _fields = {fields!r}
+    def _asdict(self):
+        return self.__dict__
+    @classmethod
+    def _make(cls, iterable, new=tuple.__new__, len=len):
+        return new(cls, iterable)
+    def _replace(self, {replace_args}):
+        return self
+    def __getnewargs__(self):
+        return tuple(self)
+{field_defs}
+    """)
+
+
 def infer_named_tuple(
     node: nodes.Call, context: InferenceContext | None = None
 ) -> Iterator[nodes.ClassDef]:
     """Specific inference function for namedtuple Call node."""
-    tuple_base: nodes.Name = _extract_single_node("tuple")
+    tuple_base = _TUPLE_BASE.copy()
     class_node, name, attributes = infer_func_form(
         node, tuple_base, parent=SYNTHETIC_ROOT, context=context
     )
 
     call_site = arguments.CallSite.from_call(node, context=context)
-    func = util.safe_infer(
-        _extract_single_node("import collections; collections.namedtuple")
-    )
+    func = util.safe_infer(_NAMEDTUPLE_FUNCTION.copy())
     assert isinstance(func, nodes.NodeNG)
     try:
         rename_arg_bool_value = next(
@@ -245,41 +323,26 @@ def infer_named_tuple(
             fake_node.attrname = attr
             class_node.instance_attrs[attr] = [fake_node]
 
-    replace_args = ", ".join(f"{arg}=None" for arg in attributes)
-    field_def = (
-        "    {name} = property(lambda self: self[{index:d}], "
-        "doc='Alias for field number {index:d}')"
-    )
-    field_defs = "\n".join(
-        field_def.format(name=name, index=index)
-        for index, name in enumerate(attributes)
+    fake = _namedtuple_template(len(attributes)).copy(
+        names={
+            "_NamedTuple": name,
+            **{f"_field_{index}": attr for index, attr in enumerate(attributes)},
+        }
     )
-    fake = AstroidBuilder(AstroidManager()).string_build(f"""
-class {name}(tuple):
-    __slots__ = ()
-    _fields = {attributes!r}
-    def _asdict(self):
-        return self.__dict__
-    @classmethod
-    def _make(cls, iterable, new=tuple.__new__, len=len):
-        return new(cls, iterable)
-    def _replace(self, {replace_args}):
-        return self
-    def __getnewargs__(self):
-        return tuple(self)
-{field_defs}
-    """)
-    class_node.locals["_asdict"] = fake.body[0].locals["_asdict"]
-    class_node.locals["_make"] = fake.body[0].locals["_make"]
-    class_node.locals["_replace"] = fake.body[0].locals["_replace"]
-    class_node.locals["_fields"] = fake.body[0].locals["_fields"]
+    # The names of the fields are strings, which placeholders do not replace.
+    for field, attr in zip(fake.locals["_fields"][0].parent.value.elts, attributes):
+        field.value = attr
+    class_node.locals["_asdict"] = fake.locals["_asdict"]
+    class_node.locals["_make"] = fake.locals["_make"]
+    class_node.locals["_replace"] = fake.locals["_replace"]
+    class_node.locals["_fields"] = fake.locals["_fields"]
     for attr in attributes:
         # Python normalises identifiers to NFKC, so a field named "\u00b5" (MICRO SIGN)
         # is stored by the parser as "\u03bc" (GREEK SMALL LETTER MU). Looking the
         # attribute up under the name as written raises KeyError on a definition
         # namedtuple itself accepts, so use the name the parser actually used.
         normalized = unicodedata.normalize("NFKC", attr)
-        class_node.locals[normalized] = fake.body[0].locals[normalized]
+        class_node.locals[normalized] = fake.locals[normalized]
     # we use UseInferenceDefault, we can't be a generator so return an iterator
     return iter([class_node])
 
@@ -353,38 +416,7 @@ def infer_enum(
     ):
         raise UseInferenceDefault
 
-    enum_meta = _extract_single_node("""
-    class EnumMeta(object):
-        'docstring'
-        def __call__(self, node):
-            class EnumAttribute(object):
-                name = ''
-                value = 0
-            return EnumAttribute()
-        def __iter__(self):
-            class EnumAttribute(object):
-                name = ''
-                value = 0
-            return [EnumAttribute()]
-        def __reversed__(self):
-            class EnumAttribute(object):
-                name = ''
-                value = 0
-            return (EnumAttribute, )
-        def __next__(self):
-            return next(iter(self))
-        def __getitem__(self, attr):
-            class Value(object):
-                @property
-                def name(self):
-                    return ''
-                @property
-                def value(self):
-                    return attr
-
-            return Value()
-        __members__ = ['']
-    """)
+    enum_meta = _ENUM_META.copy()
 
     # FIXME arguably, the base here shouldn't be the EnumMeta class definition
     # itself, but a reference (Name) to it. Otherwise, the invariant that all
@@ -552,20 +584,7 @@ def infer_enum_class(node: nodes.ClassDef) -> nodes.ClassDef:
         # For "value", we have no idea what that should be, but for "name", we at least
         # know that it should be a string, so infer that as a guess.
         if "name" not in target_names:
-            code = dedent('''
-                @property
-                def name(self):
-                    """The name of the Enum member.
-
-                    This is a reconstruction by astroid: enums are too dynamic to understand, but we at least
-                    know 'name' should be a string, so this is astroid's best guess.
-                    """
-                    return ''
-                ''')
-            name_dynamicclassattr = AstroidBuilder(AstroidManager()).string_build(code)[
-                "name"
-            ]
-            node.locals["name"] = [name_dynamicclassattr]
+            node.locals["name"] = [_ENUM_NAME_PROPERTY.copy()]
         break
     return node
 
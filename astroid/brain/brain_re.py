@@ -6,10 +6,11 @@ from __future__ import annotations
 
 from astroid import context, nodes
 from astroid.brain.helpers import register_module_extender
-from astroid.builder import _extract_single_node, parse
+from astroid.builder import parse
 from astroid.const import PY311_PLUS
 from astroid.inference_tip import inference_tip
 from astroid.manager import AstroidManager
+from astroid.templates import Template
 
 
 def _re_transform() -> nodes.Module:
@@ -49,6 +50,8 @@ def __class_getitem__(cls, item):
     return cls
 """
 
+_CLASS_GETITEM = Template(CLASS_GETITEM_TEMPLATE)
+
 
 def _looks_like_pattern_or_match(node: nodes.Call) -> bool:
     """Check for re.Pattern or re.Match call in stdlib.
@@ -83,7 +86,7 @@ def infer_pattern_match(node: nodes.Call, ctx: context.InferenceContext | None =
         end_lineno=node.end_lineno,
         end_col_offset=node.end_col_offset,
     )
-    func_to_add = _extract_single_node(CLASS_GETITEM_TEMPLATE)
+    func_to_add = _CLASS_GETITEM.copy()
     class_def.locals["__class_getitem__"] = [func_to_add]
     return iter([class_def])
 
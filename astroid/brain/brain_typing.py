@@ -14,7 +14,7 @@ from typing import Final
 
 from astroid import context, nodes
 from astroid.brain.helpers import register_module_extender
-from astroid.builder import AstroidBuilder, _extract_single_node, extract_node
+from astroid.builder import AstroidBuilder
 from astroid.const import PY312_PLUS, PY313_PLUS, PY314_PLUS, PY315_PLUS
 from astroid.exceptions import (
     AstroidSyntaxError,
@@ -24,6 +24,7 @@ from astroid.exceptions import (
 )
 from astroid.inference_tip import inference_tip
 from astroid.manager import AstroidManager
+from astroid.templates import Template
 
 TYPING_TYPEVARS = {"TypeVar", "NewType"}
 TYPING_TYPEVARS_QUALIFIED: Final = {
@@ -97,6 +98,10 @@ def __class_getitem__(cls, item):
     return cls
 """
 
+_TYPING_TYPE = Template(TYPING_TYPE_TEMPLATE.format("_Type"))
+_CLASS_GETITEM = Template(CLASS_GETITEM_TEMPLATE)
+_DICT = Template("dict")
+
 
 def looks_like_typing_typevar_or_newtype(node) -> bool:
     func = node.func
@@ -129,8 +134,9 @@ def infer_typing_typevar_or_newtype(
         # ``typing`` accepts any string as a name, so don't splice it into the
         # template: a crafted value such as ``"T(Base): #"`` would break out of
         # the identifier position and inject bases and a body into the class.
-        # Build the class with a fixed name and assign the real one afterwards.
-        node = extract_node(TYPING_TYPE_TEMPLATE.format("_TypeVar"))
+        # Copy the class of the template, with its fixed name, and assign the real
+        # one afterwards.
+        node = _TYPING_TYPE.copy()
     except AstroidSyntaxError as exc:
         raise InferenceError from exc
     node.name = typename
@@ -178,7 +184,7 @@ def infer_typing_attr(
         # typing.Generic and typing.Annotated (PY39) are subscriptable
         # through __class_getitem__. Since astroid can't easily
         # infer the native methods, replace them for an easy inference tip
-        func_to_add = _extract_single_node(CLASS_GETITEM_TEMPLATE)
+        func_to_add = _CLASS_GETITEM.copy()
         value.locals["__class_getitem__"] = [func_to_add]
         if (
             isinstance(node.parent, nodes.ClassDef)
@@ -194,7 +200,7 @@ def infer_typing_attr(
         node._explicit_inference = lambda node, context: iter([value])
         return iter([value])
 
-    node = extract_node(TYPING_TYPE_TEMPLATE.format(value.qname().split(".")[-1]))
+    node = _TYPING_TYPE.copy(names={"_Type": value.qname().split(".")[-1]})
     return node.infer(context=ctx)
 
 
@@ -207,7 +213,7 @@ def infer_typing_generic_class_pep695(
     node: nodes.ClassDef, ctx: context.InferenceContext | None = None
 ) -> Iterator[nodes.ClassDef]:
     """Add __class_getitem__ for generic classes. Python 3.12+."""
-    func_to_add = _extract_single_node(CLASS_GETITEM_TEMPLATE)
+    func_to_add = _CLASS_GETITEM.copy()
     node.locals["__class_getitem__"] = [func_to_add]
     return iter([node])
 
@@ -231,14 +237,14 @@ def infer_typedDict(  # pylint: disable=invalid-name
         end_lineno=node.end_lineno,
         end_col_offset=node.end_col_offset,
     )
-    class_def.postinit(bases=[extract_node("dict")], body=[], decorators=None)
-    func_to_add = _extract_single_node("dict")
+    class_def.postinit(bases=[_DICT.copy()], body=[], decorators=None)
+    func_to_add = _DICT.copy()
     class_def.locals["__call__"] = [func_to_add]
     # TypedDict subclasses have ``__required_keys__`` and ``__optional_keys__``
     # class attributes at runtime (e.g. ``MyDict.__required_keys__``), even
     # though the annotation-only body never declares them.
     for attr in ("__required_keys__", "__optional_keys__"):
-        func_to_add = _extract_single_node("dict")
+        func_to_add = _DICT.copy()
         class_def.locals[attr] = [func_to_add]
     return iter([class_def])
 
@@ -331,7 +337,7 @@ def infer_typing_alias(
     maybe_type_var = node.args[1]
     if isinstance(maybe_type_var, nodes.Const) and maybe_type_var.value > 0:
         # If typing alias is subscriptable, add `__class_getitem__` to ClassDef
-        func_to_add = _extract_single_node(CLASS_GETITEM_TEMPLATE)
+        func_to_add = _CLASS_GETITEM.copy()
         class_def.locals["__class_getitem__"] = [func_to_add]
     else:
         # If not, make sure that `__class_getitem__` access is forbidden.
@@ -399,7 +405,7 @@ def infer_special_alias(
         end_col_offset=assign_name.end_col_offset,
     )
     class_def.postinit(bases=[res], body=[], decorators=None)
-    func_to_add = _extract_single_node(CLASS_GETITEM_TEMPLATE)
+    func_to_add = _CLASS_GETITEM.copy()
     class_def.locals["__class_getitem__"] = [func_to_add]
     # Avoid re-instantiating this class every time it's seen
     node._explicit_inference = lambda node, context: iter([class_def])
@@ -16,6 +16,7 @@ import re
 import textwrap
 import types
 import warnings
+import weakref
 from collections.abc import Collection, Iterator, Sequence
 from io import TextIOWrapper
 from tokenize import detect_encoding
@@ -24,6 +25,7 @@ from typing import TYPE_CHECKING, cast
 from astroid import bases, modutils, nodes, raw_building, rebuilder, util
 from astroid.const import PY312_PLUS, PY314_PLUS
 from astroid.exceptions import AstroidBuildingError, AstroidSyntaxError, InferenceError
+from astroid.import_graph import imported_module_names
 
 if TYPE_CHECKING:
     from astroid.manager import AstroidManager
@@ -37,6 +39,22 @@ _TRANSIENT_FUNCTION = "__"
 # when calling extract_node.
 _STATEMENT_SELECTOR = "#@"
 
+# The attribute assignments of each module registered on objects of other modules,
+# with these objects.
+_FOREIGN_ASSIGNMENTS: weakref.WeakKeyDictionary[
+    nodes.Module, list[tuple[nodes.AssignAttr, nodes.NodeNG]]
+] = weakref.WeakKeyDictionary()
+
+
+def _foreign_assignments(
+    module: nodes.Module,
+) -> list[tuple[nodes.AssignAttr, nodes.NodeNG]]:
+    """Get the attribute assignments of *module* registered on objects of other
+    modules, with these objects.
+    """
+    return _FOREIGN_ASSIGNMENTS.get(module, [])
+
+
 if PY312_PLUS:
     warnings.filterwarnings("ignore", ".*invalid escape sequence", SyntaxWarning)
 if PY314_PLUS:
@@ -99,13 +117,14 @@ class AstroidBuilder(raw_building.InspectBuilder):
             if ext in {".py", ".pyc", ".pyo"} and os.path.exists(path_ + ".py"):
                 node = self.file_build(path_ + ".py", modname)
         if node is None:
-            # this is a built-in module
-            # get a partial representation by introspection
-            node = self.inspect_build(module, modname=modname, path=path)
-            if self._apply_transforms:
-                # We have to handle transformation by ourselves since the
-                # rebuilder isn't called for builtin nodes
-                node = self._manager.visit_transforms(node)
+            with self._manager._build_lock:
+                # this is a built-in module
+                # get a partial representation by introspection
+                node = self.inspect_build(module, modname=modname, path=path)
+                if self._apply_transforms:
+                    # We have to handle transformation by ourselves since the
+                    # rebuilder isn't called for builtin nodes
+                    node = self._manager.visit_transforms(node)
         assert isinstance(node, nodes.Module)
         return node
 
@@ -158,9 +177,32 @@ class AstroidBuilder(raw_building.InspectBuilder):
     def _post_build(
         self, module: nodes.Module, builder: rebuilder.TreeRebuilder, encoding: str
     ) -> nodes.Module:
-        """Handles encoding and delayed nodes after a module has been built."""
+        """Handles encoding and delayed nodes after a module has been built.
+
+        The module is only added to the cache while holding the build lock of the
+        manager, which is released once its transforms are applied.
+        """
+        with self._manager._build_lock:
+            return self._post_build_locked(module, builder, encoding)
+
+    def _post_build_locked(
+        self, module: nodes.Module, builder: rebuilder.TreeRebuilder, encoding: str
+    ) -> nodes.Module:
         module.file_encoding = encoding
         self._manager.cache_module(module)
+        # Another module of the same name may have been cached first, whose
+        # imports are already recorded.
+        if self._manager.astroid_cache.get(module.name) is module:
+            self._manager.import_graph.add_module(
+                module.name,
+                imported_module_names(
+                    module,
+                    [
+                        *builder._import_nodes,
+                        *(node for node, _ in builder._import_from_nodes),
+                    ],
+                ),
+            )
         # post tree building steps after we stored the module in the cache:
         for from_node, global_names in builder._import_from_nodes:
             if from_node.modname == "__future__":
@@ -173,7 +215,12 @@ class AstroidBuilder(raw_building.InspectBuilder):
 
         # Visit the transforms
         if self._apply_transforms:
+            lazy_bodies = builder._lazy_bodies
+            if lazy_bodies is not None:
+                lazy_bodies.start_transforms(self._manager.visit_transforms)
             module = self._manager.visit_transforms(module)
+            if lazy_bodies is not None:
+                lazy_bodies.finish_transforms()
         return module
 
     def _data_build(
@@ -181,7 +228,9 @@ class AstroidBuilder(raw_building.InspectBuilder):
     ) -> tuple[nodes.Module, rebuilder.TreeRebuilder]:
         """Build tree node from data and add some informations."""
         try:
-            node = _parse_string(data, type_comments=True, modname=modname)
+            node, type_comments = _parse_source(
+                data, type_comments=True, modname=modname
+            )
         except (TypeError, ValueError, SyntaxError, MemoryError) as exc:
             raise AstroidSyntaxError(
                 "Parsing Python code failed:\n{error}",
@@ -203,7 +252,13 @@ class AstroidBuilder(raw_building.InspectBuilder):
                 path is not None
                 and os.path.splitext(os.path.basename(path))[0] == "__init__"
             )
-        builder = rebuilder.TreeRebuilder(self._manager, data)
+        builder = rebuilder.TreeRebuilder(
+            self._manager,
+            data,
+            lazy_function_bodies=self._manager.lazy_function_bodies
+            or self._manager.builds_interface(path),
+            type_comments=type_comments,
+        )
         module = builder.visit_module(node, modname, node_file, package)
         return module, builder
 
@@ -277,6 +332,9 @@ class AstroidBuilder(raw_building.InspectBuilder):
                 if node in values:
                     continue
                 values.append(node)
+                root = node.root()
+                if inferred.root() is not root:
+                    _FOREIGN_ASSIGNMENTS.setdefault(root, []).append((node, inferred))
         except InferenceError:
             pass
 
@@ -491,6 +549,13 @@ def _extract_single_node(code: str, module_name: str = "") -> nodes.NodeNG:
 def _parse_string(
     data: str, type_comments: bool = True, modname: str | None = None
 ) -> ast.Module:
+    return _parse_source(data, type_comments, modname)[0]
+
+
+def _parse_source(
+    data: str, type_comments: bool = True, modname: str | None = None
+) -> tuple[ast.Module, bool]:
+    """Parse *data*, and tell whether its type comments were parsed."""
     try:
         parsed = ast.parse(
             data + "\n", filename=modname or "<unknown>", type_comments=type_comments
@@ -504,5 +569,5 @@ def _parse_string(
         if not (type_annot_related and type_comments):
             raise
 
-        parsed = ast.parse(data + "\n", type_comments=False)
-    return parsed
+        return ast.parse(data + "\n", type_comments=False), False
+    return parsed, type_comments
@@ -0,0 +1,152 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Results computed from the hierarchy of classes, kept per class.
+
+Computing the MRO or the ancestors of a class infers each of its bases, and
+those of its ancestors, every time. The results are kept here instead, until
+the module of the class or the module of one of the classes they depend on is
+invalidated, or until one of these classes gains an attribute.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Collection, Iterable
+from typing import TYPE_CHECKING, Any
+
+from astroid.context import _tree_root
+
+if TYPE_CHECKING:
+    from astroid import nodes
+
+_ClassCacheKey = tuple["nodes.ClassDef", str]
+
+
+class ClassCache:
+    """Results of each kind, such as ``"mro"``, computed for classes.
+
+    Entries are partitioned by the module of their class, through weak
+    references to the roots of the trees, and remember the modules of the
+    classes they were computed from.
+    """
+
+    def __init__(self) -> None:
+        self._partitions: dict[
+            weakref.ref[nodes.NodeNG],
+            dict[_ClassCacheKey, tuple[Any, frozenset[str]]],
+        ] = {}
+        self._dependents: dict[nodes.NodeNG, set[_ClassCacheKey]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        """Number of lookups which found a cached result."""
+        self.misses = 0
+        """Number of lookups which did not find a cached result."""
+
+    def get(self, cls: nodes.ClassDef, kind: str) -> Any:
+        """Get the result of *kind* cached for *cls*, or ``None``.
+
+        The lookup is counted as a hit or a miss.
+        """
+        root = weakref.ref(_tree_root(cls))
+        with self._lock:
+            partition = self._partitions.get(root)
+            if partition is not None:
+                entry = partition.get((cls, kind))
+                if entry is not None:
+                    self.hits += 1
+                    return entry[0]
+            self.misses += 1
+            return None
+
+    def set(
+        self,
+        cls: nodes.ClassDef,
+        kind: str,
+        value: Any,
+        depends_on: Iterable[nodes.NodeNG] = (),
+    ) -> None:
+        """Cache the result of *kind* for *cls*, computed from the given classes."""
+        depends_on = (cls, *depends_on)
+        modnames = frozenset(
+            getattr(_tree_root(node), "name", "") for node in depends_on
+        )
+        root = weakref.ref(_tree_root(cls))
+        with self._lock:
+            partition = self._partitions.get(root)
+            if partition is None:
+                partition = self._partitions[root] = {}
+            partition[cls, kind] = (value, modnames)
+            for node in depends_on:
+                self._dependents.setdefault(node, set()).add((cls, kind))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(partition) for partition in self._partitions.values())
+
+    def invalidate_class(self, cls: nodes.ClassDef) -> None:
+        """Drop the results computed from *cls*, e.g. after it gained an attribute."""
+        with self._lock:
+            for key in self._dependents.pop(cls, ()):
+                partition = self._partitions.get(weakref.ref(_tree_root(key[0])))
+                if partition is not None:
+                    partition.pop(key, None)
+
+    def invalidate_root(self, root: nodes.NodeNG) -> None:
+        """Drop the results of the classes of the tree rooted at *root*."""
+        with self._lock:
+            self._forget(self._partitions.pop(weakref.ref(root), {}))
+            for node in list(self._dependents):
+                if _tree_root(node) is root:
+                    del self._dependents[node]
+
+    def invalidate(self, modnames: Collection[str]) -> None:
+        """Drop the results computed from classes of the given modules."""
+        with self._lock:
+            for node in list(self._dependents):
+                if getattr(_tree_root(node), "name", "") in modnames:
+                    del self._dependents[node]
+            dropped: list[_ClassCacheKey] = []
+            for root in list(self._partitions):
+                if getattr(root(), "name", "") in modnames:
+                    dropped.extend(self._partitions.pop(root))
+                    continue
+                partition = self._partitions[root]
+                for key, (_, depends_on) in list(partition.items()):
+                    if not depends_on.isdisjoint(modnames):
+                        del partition[key]
+                        dropped.append(key)
+            self._forget(dropped)
+
+    def _forget(self, keys: Iterable[_ClassCacheKey]) -> None:
+        """Stop tracking the classes the dropped results were computed from.
+
+        Otherwise the classes of other modules they depend on, e.g. ``object``,
+        would keep the classes of the results alive.
+        """
+        keys = set(keys)
+        if not keys:
+            return
+        for node, dependents in list(self._dependents.items()):
+            dependents -= keys
+            if not dependents:
+                del self._dependents[node]
+
+    def clear(self) -> None:
+        """Drop all the results and reset the counters."""
+        with self._lock:
+            self._partitions.clear()
+            self._dependents.clear()
+            self.hits = self.misses = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} of {len(self)} entries in "
+            f"{len(self._partitions)} modules, {self.hits} hits, "
+            f"{self.misses} misses>"
+        )
+
+
+_CLASS_CACHE = ClassCache()
@@ -6,8 +6,11 @@
 
 from __future__ import annotations
 
+import collections
 import contextlib
-from collections.abc import Iterator, Sequence
+import threading
+import weakref
+from collections.abc import Callable, Collection, Iterator, Sequence
 from typing import TYPE_CHECKING
 
 from astroid.typing import InferenceResult, SuccessfulInferenceResult
@@ -15,15 +18,205 @@ from astroid.typing import InferenceResult, SuccessfulInferenceResult
 if TYPE_CHECKING:
     from astroid import constraint, nodes
 
-_InferenceCache = dict[
-    tuple["nodes.NodeNG", str | None, str | None, str | None], Sequence["nodes.NodeNG"]
+_InferenceCacheKey = tuple[
+    "nodes.NodeNG", str | None, "CallContext | None", "SuccessfulInferenceResult | None"
 ]
 
-_INFERENCE_CACHE: _InferenceCache = {}
 
+def _tree_root(node: nodes.NodeNG) -> nodes.NodeNG:
+    """Get the root of the tree of *node*, which is not a module for detached nodes."""
+    while (parent := node.parent) is not None and parent is not node:
+        node = parent
+    return node
 
-def _invalidate_cache() -> None:
-    _INFERENCE_CACHE.clear()
+
+class InferenceCache:
+    """The results of past inferences, partitioned by the module of the inferred node.
+
+    Keys are ``(node, lookupname, callcontext, boundnode)`` and values are the
+    tuples of the inferred results. Each module gets its own partition, which
+    holds at most *max_entries_per_module* entries, evicting the least recently
+    used ones beyond that, so that the modules inferred the most cannot push out
+    the results of the others. All the partitions together hold at most
+    *max_entries* entries, evicting those of the least recently used partition
+    beyond that. ``None`` lifts a limit.
+
+    Partitions are keyed by weak references to the roots of the trees, so that
+    they never keep a module alive by themselves.
+    """
+
+    def __init__(
+        self,
+        max_entries_per_module: int | None = 20_000,
+        max_entries: int | None = 500_000,
+    ) -> None:
+        # In order of use, the least recently used partition first.
+        self._partitions: collections.OrderedDict[
+            weakref.ref[nodes.NodeNG],
+            collections.OrderedDict[_InferenceCacheKey, Sequence[InferenceResult]],
+        ] = collections.OrderedDict()
+        self._size = 0
+        # Every operation holds the lock, so that threads inferring at the same
+        # time never see a partition in the middle of an update or an eviction.
+        self._lock = threading.Lock()
+        self.max_entries_per_module = max_entries_per_module
+        self.max_entries = max_entries
+        self.hits = 0
+        """Number of lookups which found cached results."""
+        self.misses = 0
+        """Number of lookups which did not find cached results."""
+        self.evictions = 0
+        """Number of entries evicted to stay within the size limits."""
+
+    def get(self, key: _InferenceCacheKey) -> Sequence[InferenceResult] | None:
+        """Get the results cached for *key*, counting the lookup as a hit or a miss."""
+        root = weakref.ref(_tree_root(key[0]))
+        with self._lock:
+            partition = self._partitions.get(root)
+            if partition is not None:
+                results = partition.get(key)
+                if results is not None:
+                    partition.move_to_end(key)
+                    self._partitions.move_to_end(root)
+                    self.hits += 1
+                    return results
+            self.misses += 1
+            return None
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            root = weakref.ref(_tree_root(key[0]))  # type: ignore[index]
+            with self._lock:
+                return key in self._partitions[root]
+        except (KeyError, TypeError, AttributeError):
+            return False
+
+    def __getitem__(self, key: _InferenceCacheKey) -> Sequence[InferenceResult]:
+        results = self.get(key)
+        if results is None:
+            raise KeyError(key)
+        return results
+
+    def __setitem__(
+        self, key: _InferenceCacheKey, results: Sequence[InferenceResult]
+    ) -> None:
+        root = weakref.ref(_tree_root(key[0]))
+        with self._lock:
+            partition = self._partitions.get(root)
+            if partition is None:
+                partition = self._partitions[root] = collections.OrderedDict()
+            else:
+                self._partitions.move_to_end(root)
+            if key not in partition:
+                self._size += 1
+            partition[key] = results
+            partition.move_to_end(key)
+            if (
+                self.max_entries_per_module is not None
+                and len(partition) > self.max_entries_per_module
+            ):
+                partition.popitem(last=False)
+                self._size -= 1
+                self.evictions += 1
+            if self.max_entries is not None:
+                while self._size > self.max_entries:
+                    oldest_root, oldest = next(iter(self._partitions.items()))
+                    oldest.popitem(last=False)
+                    if not oldest:
+                        del self._partitions[oldest_root]
+                    self._size -= 1
+                    self.evictions += 1
+
+    def __iter__(self) -> Iterator[_InferenceCacheKey]:
+        with self._lock:
+            keys = [key for partition in self._partitions.values() for key in partition]
+        yield from keys
+
+    def __len__(self) -> int:
+        return self._size
+
+    def sizes(self) -> dict[str, int]:
+        """Get the number of entries of each module, by module name."""
+        sizes: dict[str, int] = collections.Counter()
+        with self._lock:
+            for root, partition in self._partitions.items():
+                sizes[getattr(root(), "name", "")] += len(partition)
+        return dict(sizes)
+
+    def invalidate_root(self, root: nodes.NodeNG) -> None:
+        """Drop the entries of the nodes of the tree rooted at *root*."""
+        with self._lock:
+            self._size -= len(self._partitions.pop(weakref.ref(root), ()))
+
+    def invalidate(self, modnames: Collection[str]) -> None:
+        """Drop the entries involving the given modules.
+
+        An entry involves a module if the inferred node, the bound node or one of
+        the inference results belongs to it.
+        """
+        self._invalidate(lambda value: _in_modules(value, modnames))
+
+    def invalidate_trees(self, roots: Collection[nodes.NodeNG]) -> None:
+        """Drop the entries involving the trees rooted at the given nodes.
+
+        Unlike :meth:`invalidate`, other modules of the same names are kept.
+        """
+        self._invalidate(lambda value: _in_trees(value, roots))
+
+    def _invalidate(self, involved: Callable[[object], bool]) -> None:
+        with self._lock:
+            for root in list(self._partitions):
+                if involved(root()):
+                    self._size -= len(self._partitions.pop(root))
+                    continue
+                partition = self._partitions[root]
+                for key, results in list(partition.items()):
+                    if involved(key[3]) or any(involved(result) for result in results):
+                        del partition[key]
+                        self._size -= 1
+                if not partition:
+                    del self._partitions[root]
+
+    def clear(self) -> None:
+        """Drop all the entries and reset the counters."""
+        with self._lock:
+            self._partitions.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} of {len(self)} entries in "
+            f"{len(self._partitions)} modules, {self.hits} hits, "
+            f"{self.misses} misses, {self.evictions} evictions>"
+        )
+
+
+_INFERENCE_CACHE = InferenceCache()
+
+
+def _invalidate_cache(modnames: Collection[str] | None = None) -> None:
+    """Clear the inference cache, or only the entries involving the given modules."""
+    if modnames is None:
+        _INFERENCE_CACHE.clear()
+    else:
+        _INFERENCE_CACHE.invalidate(modnames)
+
+
+def _in_modules(value: object, modnames: Collection[str]) -> bool:
+    """Check whether *value*, a node or an inference result, belongs to the modules."""
+    try:
+        return _tree_root(value).name in modnames  # type: ignore[arg-type,attr-defined]
+    except AttributeError:
+        return False
+
+
+def _in_trees(value: object, roots: Collection[nodes.NodeNG]) -> bool:
+    """Check whether *value*, a node or an inference result, belongs to the trees."""
+    try:
+        return _tree_root(value) in roots  # type: ignore[arg-type]
+    except AttributeError:
+        return False
 
 
 class InferenceContext:
@@ -95,7 +288,7 @@ class InferenceContext:
         self._nodes_inferred[0] = value
 
     @property
-    def inferred(self) -> _InferenceCache:
+    def inferred(self) -> InferenceCache:
         """
         Inferred node contexts to their mapped results.
 
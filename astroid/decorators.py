@@ -11,9 +11,10 @@ import inspect
 import sys
 import warnings
 from collections.abc import Callable, Generator
-from typing import ParamSpec, TypeVar
+from typing import Any, ParamSpec, TypeVar
 
 from astroid import util
+from astroid.const import PY312_PLUS
 from astroid.context import InferenceContext
 from astroid.exceptions import InferenceError
 from astroid.typing import InferenceResult
@@ -22,6 +23,30 @@ _R = TypeVar("_R")
 _P = ParamSpec("_P")
 
 
+if PY312_PLUS:
+    cached_property = functools.cached_property
+else:
+
+    class cached_property(functools.cached_property[_R]):  # type: ignore[no-redef]
+        """``functools.cached_property`` without the lock it holds before Python 3.12.
+
+        That lock is shared by all the instances of a class. A thread computing
+        the property of a node, which may wait for another thread to build the
+        body of a function, would deadlock with it if the other thread needs
+        the same property of another node meanwhile.
+        """
+
+        def __get__(self, instance: Any, owner: type[Any] | None = None) -> Any:
+            if instance is None:
+                return self
+            cache = instance.__dict__
+            try:
+                return cache[self.attrname]
+            except KeyError:
+                value = cache[self.attrname] = self.func(instance)
+                return value
+
+
 def path_wrapper(func):
     """Return the given infer function wrapped to handle the path.
 
@@ -10,15 +10,105 @@ It is not considered public.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import bisect
+from typing import TYPE_CHECKING, NamedTuple
 
 from astroid import nodes
+from astroid.memo import MEMO_PREFIX
 from astroid.typing import SuccessfulInferenceResult
 
 if TYPE_CHECKING:
     from astroid.nodes import _base_nodes
 
 
+class _StatementIndex(NamedTuple):
+    """The statements of the assignments of a name in a frame."""
+
+    stmts: list[nodes.NodeNG]
+    """The assignments, as found in the locals of the frame."""
+    size: int
+    last: nodes.NodeNG | None
+    statements: list[_base_nodes.Statement]
+    max_linenos: list[int]
+    """The highest line at which each statement or a previous one starts."""
+    ordered: bool
+    """Whether the statements are sorted by the line at which they start."""
+    except_handlers: bool
+    """Whether the name is bound by several except handlers and nothing else."""
+
+
+def _statement_index(
+    frame: nodes.LocalsDictNodeNG, stmts: list[nodes.NodeNG]
+) -> _StatementIndex:
+    """Get the index of the assignments *stmts* of a name in *frame*.
+
+    The index is kept on the frame until the list of assignments changes.
+    It is found by the id of the list, which it holds, so that the id cannot
+    be given to another list while the index is kept.
+    """
+    indexes: dict[int, _StatementIndex] = frame.__dict__.setdefault(
+        MEMO_PREFIX + "statement_indexes", {}
+    )
+    index = indexes.get(id(stmts))
+    last = stmts[-1] if stmts else None
+    if (
+        index is not None
+        and index.stmts is stmts
+        and index.size == len(stmts)
+        and index.last is last
+    ):
+        return index
+
+    statements = [node.statement() for node in stmts]
+    max_linenos = []
+    max_lineno = 0
+    ordered = True
+    for stmt in statements:
+        if not stmt.fromlineno or stmt.fromlineno < max_lineno:
+            ordered = False
+        max_lineno = max(max_lineno, stmt.fromlineno or 0)
+        max_linenos.append(max_lineno)
+    index = indexes[id(stmts)] = _StatementIndex(
+        stmts,
+        len(stmts),
+        last,
+        statements,
+        max_linenos,
+        ordered,
+        len(statements) > 1
+        and all(isinstance(stmt, nodes.ExceptHandler) for stmt in statements),
+    )
+    return index
+
+
+def _last_overriding_assignment(
+    base_node: nodes.NodeNG,
+    mystmt: _base_nodes.Statement,
+    index: _StatementIndex,
+    end: int,
+) -> int:
+    """Get the position of the last of the first *end* assignments which
+    overrides all the previous ones when looking up *base_node*, or 0.
+
+    Such an assignment is a plain ``name = ...`` statement of the block of
+    *mystmt*, found on an earlier line. The assignments are in the order of
+    their lines, so none of those before it can stop the filtering.
+    """
+    if not index.ordered:
+        return 0
+    for position in range(end - 1, 0, -1):
+        stmt = index.statements[position]
+        if (
+            type(stmt) is nodes.Assign
+            and stmt.parent is mystmt.parent
+            and stmt.fromlineno < mystmt.fromlineno
+            and isinstance(index.stmts[position], nodes.AssignName)
+            and not nodes.are_exclusive(base_node, index.stmts[position])
+        ):
+            return position
+    return 0
+
+
 def _get_filtered_node_statements(
     base_node: nodes.NodeNG, stmt_nodes: list[nodes.NodeNG]
 ) -> list[tuple[nodes.NodeNG, _base_nodes.Statement]]:
@@ -109,7 +199,18 @@ def _filter_stmts(
 
     _stmts: list[nodes.NodeNG] = []
     _stmt_parents = []
-    statements = _get_filtered_node_statements(base_node, stmts)
+    index = _statement_index(frame, stmts)
+    if index.except_handlers:
+        statements = _get_filtered_node_statements(base_node, stmts)
+    else:
+        # Only the statements from the last one overriding all the previous
+        # ones, up to the first one after our location, are considered below.
+        start, end = 0, len(stmts)
+        if mylineno > 0:
+            assert mystmt is not None
+            end = bisect.bisect_right(index.max_linenos, mylineno)
+            start = _last_overriding_assignment(base_node, mystmt, index, end)
+        statements = list(zip(stmts[start:end], index.statements[start:end]))
     for node, stmt in statements:
         # line filtering is on and we have reached our location, break
         if stmt.fromlineno and stmt.fromlineno > mylineno > 0:
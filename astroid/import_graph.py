@@ -0,0 +1,199 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""The graph of the imports between the modules built by the manager."""
+
+from __future__ import annotations
+
+import collections
+import threading
+from collections.abc import Callable, Iterable, Iterator
+
+from astroid import nodes
+from astroid.exceptions import TooManyLevelsError
+
+
+def imported_module_names(
+    module: nodes.Module,
+    import_nodes: Iterable[nodes.Import | nodes.ImportFrom] | None = None,
+) -> set[str]:
+    """Get the absolute names of the modules and packages imported by *module*.
+
+    Names imported from a module are included too, as they may be submodules.
+
+    :param import_nodes: The import statements of the module, found by walking
+        its tree if not given.
+    """
+    if import_nodes is None:
+        import_nodes = module.nodes_of_class((nodes.Import, nodes.ImportFrom))
+    names: set[str] = set()
+    for node in import_nodes:
+        if isinstance(node, nodes.Import):
+            imported = [name for name, _ in node.names]
+        else:
+            try:
+                base = module.relative_to_absolute_name(node.modname, node.level)
+            except TooManyLevelsError:
+                continue
+            imported = [base, *(f"{base}.{name}" for name, _ in node.names)]
+        for name in imported:
+            parts = name.split(".")
+            names.update(".".join(parts[:index]) for index in range(1, len(parts) + 1))
+    return names
+
+
+class ImportGraph:
+    """Import edges between modules, indexed in both directions.
+
+    Edges are recorded for every module added to the graph, towards the names it
+    imports. Queries only report the modules of the graph, so that names which
+    turned out not to be modules, or modules never built, are left out.
+
+    Modules can be added and removed from several threads at once.
+    """
+
+    def __init__(self) -> None:
+        self._imports: dict[str, frozenset[str]] = {}
+        self._importers: collections.defaultdict[str, set[str]] = (
+            collections.defaultdict(set)
+        )
+        self._lock = threading.RLock()
+
+    def __contains__(self, modname: object) -> bool:
+        return modname in self._imports
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._imports))
+
+    def __len__(self) -> int:
+        return len(self._imports)
+
+    def add_module(self, modname: str, imported: Iterable[str]) -> None:
+        """Record the names imported by *modname*, replacing the previous ones.
+
+        Modules without a name, like the ones built from strings, are ignored.
+        """
+        if not modname:
+            return
+        imported = frozenset(imported) - {modname}
+        with self._lock:
+            self.remove_module(modname)
+            self._imports[modname] = imported
+            for name in imported:
+                self._importers[name].add(modname)
+
+    def remove_module(self, modname: str) -> None:
+        """Forget the imports of *modname*.
+
+        The imports of *modname* by other modules are kept.
+        """
+        with self._lock:
+            for name in self._imports.pop(modname, ()):
+                importers = self._importers[name]
+                importers.discard(modname)
+                if not importers:
+                    del self._importers[name]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._imports.clear()
+            self._importers.clear()
+
+    def imports(self, modname: str) -> frozenset[str]:
+        """Get the modules of the graph directly imported by *modname*."""
+        return frozenset(
+            name for name in self._imports.get(modname, ()) if name in self._imports
+        )
+
+    def importers(self, modname: str) -> frozenset[str]:
+        """Get the modules of the graph directly importing *modname*."""
+        with self._lock:
+            return frozenset(self._importers.get(modname, ()))
+
+    def dependencies(self, modname: str) -> set[str]:
+        """Get the modules of the graph imported by *modname*, directly or not."""
+        return self._reachable(modname, self.imports)
+
+    def dependents(self, modname: str) -> set[str]:
+        """Get the modules of the graph importing *modname*, directly or not."""
+        return self._reachable(modname, self.importers)
+
+    @staticmethod
+    def _reachable(
+        modname: str, neighbors: Callable[[str], frozenset[str]]
+    ) -> set[str]:
+        reached: set[str] = set()
+        stack = [modname]
+        while stack:
+            for name in neighbors(stack.pop()):
+                if name not in reached and name != modname:
+                    reached.add(name)
+                    stack.append(name)
+        return reached
+
+    def strongly_connected_components(self) -> list[frozenset[str]]:
+        """Get the groups of modules importing each other, directly or not.
+
+        Every module of the graph is in exactly one component. Components come
+        after the components they import.
+        """
+        # Iterative version of Tarjan's algorithm.
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        components: list[frozenset[str]] = []
+        for root in list(self._imports):
+            if root in index:
+                continue
+            work = [(root, iter(self.imports(root)))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                modname, children = work[-1]
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.imports(child))))
+                        break
+                    if child in on_stack:
+                        lowlink[modname] = min(lowlink[modname], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[modname])
+                    if lowlink[modname] == index[modname]:
+                        component = set()
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.add(member)
+                            if member == modname:
+                                break
+                        components.append(frozenset(component))
+        return components
+
+    def topological_order(self, modnames: Iterable[str] | None = None) -> list[str]:
+        """Order modules so that they come after the modules they import.
+
+        Modules importing each other are next to each other, in no particular
+        order.
+
+        :param modnames: The modules to order, all the modules of the graph by
+            default. Modules which are not in the graph come first.
+        """
+        order = [
+            modname
+            for component in self.strongly_connected_components()
+            for modname in sorted(component)
+        ]
+        if modnames is None:
+            return order
+        selected = set(modnames)
+        unknown = sorted(selected.difference(self._imports))
+        return unknown + [modname for modname in order if modname in selected]
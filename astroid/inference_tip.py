@@ -6,11 +6,13 @@
 
 from __future__ import annotations
 
+import functools
+import threading
 from collections import OrderedDict
-from collections.abc import Generator
+from collections.abc import Collection, Generator
 from typing import Any, TypeVar
 
-from astroid.context import InferenceContext
+from astroid.context import InferenceContext, _in_modules, _in_trees
 from astroid.exceptions import InferenceOverwriteError, UseInferenceDefault
 from astroid.nodes import NodeNG
 from astroid.typing import (
@@ -22,15 +24,42 @@ from astroid.typing import (
 _cache: OrderedDict[
     tuple[InferFn[Any], NodeNG, InferenceContext | None], list[InferenceResult]
 ] = OrderedDict()
+_cache_lock = threading.Lock()
 
-_CURRENTLY_INFERRING: set[tuple[InferFn[Any], NodeNG]] = set()
+
+class _InferringState(threading.local):
+    """The inference tips being inferred, which are only seen by their thread."""
+
+    def __init__(self) -> None:
+        self.currently_inferring: set[tuple[InferFn[Any], NodeNG]] = set()
+
+
+_STATE = _InferringState()
 
 _NodesT = TypeVar("_NodesT", bound=NodeNG)
 
 
-def clear_inference_tip_cache() -> None:
-    """Clear the inference tips cache."""
-    _cache.clear()
+def clear_inference_tip_cache(
+    modnames: Collection[str] | None = None,
+    *,
+    trees: Collection[NodeNG] | None = None,
+) -> None:
+    """Clear the inference tips cache, or only the entries of the given modules.
+
+    The modules are given by name, or by the roots of their *trees*.
+    """
+    if trees is not None:
+        involved = functools.partial(_in_trees, roots=trees)
+    elif modnames is not None:
+        involved = functools.partial(_in_modules, modnames=modnames)
+    else:
+        with _cache_lock:
+            _cache.clear()
+        return
+    with _cache_lock:
+        for key, results in list(_cache.items()):
+            if involved(key[1]) or any(involved(result) for result in results):
+                del _cache[key]
 
 
 def _inference_tip_cached(func: InferFn[_NodesT]) -> InferFn[_NodesT]:
@@ -40,44 +69,52 @@ def _inference_tip_cached(func: InferFn[_NodesT]) -> InferFn[_NodesT]:
         node: _NodesT,
         context: InferenceContext | None = None,
     ) -> Generator[InferenceResult]:
+        currently_inferring = _STATE.currently_inferring
         partial_cache_key = (func, node)
-        if partial_cache_key in _CURRENTLY_INFERRING:
+        if partial_cache_key in currently_inferring:
             # If through recursion we end up trying to infer the same
             # func + node we raise here.
-            _CURRENTLY_INFERRING.remove(partial_cache_key)
+            currently_inferring.remove(partial_cache_key)
             raise UseInferenceDefault
         if context is not None and context.is_empty():
             # Fresh, empty contexts will defeat the cache.
             context = None
         try:
-            yield from _cache[func, node, context]
-            return
+            with _cache_lock:
+                cached = _cache[func, node, context]
         except KeyError:
             # Recursion guard with a partial cache key.
             # Using the full key causes a recursion error on PyPy.
             # It's a pragmatic compromise to avoid so much recursive inference
             # with slightly different contexts while still passing the simple
             # test cases included with this commit.
-            _CURRENTLY_INFERRING.add(partial_cache_key)
+            currently_inferring.add(partial_cache_key)
             try:
                 # May raise UseInferenceDefault
-                result = _cache[func, node, context] = list(func(node, context))
+                result = list(func(node, context))
             except Exception as e:
                 # Suppress the KeyError from the cache miss.
                 raise e from None
             finally:
                 # Remove recursion guard.
                 try:
-                    _CURRENTLY_INFERRING.remove(partial_cache_key)
+                    currently_inferring.remove(partial_cache_key)
                 except KeyError:
                     pass  # Recursion may beat us to the punch.
 
+            with _cache_lock:
+                _cache[func, node, context] = result
                 if len(_cache) > 64:
                     _cache.popitem(last=False)
+        else:
+            yield from cached
+            return
 
         # https://github.com/pylint-dev/pylint/issues/8686
         yield from result  # pylint: disable=used-before-assignment
 
+    # Lets the persistent cache store the tip by its inference function.
+    inner._inference_tip_function = func  # type: ignore[attr-defined]
     return inner
 
 
@@ -120,4 +157,5 @@ def inference_tip(
         node._explicit_inference = _inference_tip_cached(infer_function)
         return node
 
+    transform._inference_tip_function = infer_function  # type: ignore[attr-defined]
     return transform
@@ -12,6 +12,7 @@ import importlib.util
 import os
 import pathlib
 import sys
+import time
 import types
 import warnings
 import zipimport
@@ -63,6 +64,68 @@ _EditableFinderClasses: set[str] = {
 }
 
 
+class _DirectoryListing(NamedTuple):
+    """The names of the files and directories of a directory."""
+
+    mtime: int
+    """Modification time of the directory when it was listed, in nanoseconds."""
+    racy: bool
+    """Whether the directory changed less than a second before it was listed."""
+    files: frozenset[str]
+    directories: frozenset[str]
+
+
+_EMPTY_LISTING = _DirectoryListing(0, False, frozenset(), frozenset())
+
+_RACY_DELAY = 1_000_000_000
+"""Delay after a change in which another change may leave the mtime unchanged."""
+
+_DIRECTORY_LISTINGS: dict[str, _DirectoryListing] = {}
+
+
+def _list_directory(path: str) -> _DirectoryListing:
+    """List the directory *path*, again only once it was modified.
+
+    Modification times may be as coarse as one second, so a directory listed
+    less than a second after it changed is listed again the next time.
+    """
+    path = os.path.abspath(path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return _EMPTY_LISTING
+    listing = _DIRECTORY_LISTINGS.get(path)
+    if listing is not None and listing.mtime == mtime and not listing.racy:
+        return listing
+    listed_at = time.time_ns()
+    files: set[str] = set()
+    directories: set[str] = set()
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        directories.add(entry.name)
+                    elif entry.is_file():
+                        files.add(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        return _EMPTY_LISTING
+    listing = _DIRECTORY_LISTINGS[path] = _DirectoryListing(
+        mtime,
+        listed_at - mtime < _RACY_DELAY,
+        frozenset(files),
+        frozenset(directories),
+    )
+    return listing
+
+
+def clear_directory_listings() -> None:
+    """Forget the directories listed to find modules."""
+    _DIRECTORY_LISTINGS.clear()
+
+
 class ModuleSpec(NamedTuple):
     """Defines a class similar to PEP 420's ModuleSpec.
 
@@ -131,9 +194,6 @@ class ImportlibFinder(Finder):
         processed: tuple[str, ...],
         submodule_path: tuple[str, ...] | None,
     ) -> ModuleSpec | None:
-        # pylint: disable-next=import-outside-toplevel
-        from astroid.modutils import cached_os_path_isfile
-
         # Although we should be able to use `find_spec` this doesn't work on PyPy for builtins.
         # Therefore, we use the `builtin_module_nams` heuristic for these.
         if submodule_path is None and modname in sys.builtin_module_names:
@@ -148,13 +208,15 @@ class ImportlibFinder(Finder):
         else:
             search_paths = sys.path
 
+        # Each directory is listed once, rather than looking for each of the
+        # files the module could be in.
         suffixes = (".py", ".pyi", importlib.machinery.BYTECODE_SUFFIXES[0])
         for entry in search_paths:
-            package_directory = os.path.join(entry, modname)
-            for suffix in suffixes:
-                package_file_name = "__init__" + suffix
-                file_path = os.path.join(package_directory, package_file_name)
-                if cached_os_path_isfile(file_path):
+            listing = _list_directory(entry)
+            if modname in listing.directories:
+                package_directory = os.path.join(entry, modname)
+                package_files = _list_directory(package_directory).files
+                if any("__init__" + suffix in package_files for suffix in suffixes):
                     return ModuleSpec(
                         name=modname,
                         location=package_directory,
@@ -162,9 +224,12 @@ class ImportlibFinder(Finder):
                     )
             for suffix, type_ in ImportlibFinder._SUFFIXES:
                 file_name = modname + suffix
-                file_path = os.path.join(entry, file_name)
-                if cached_os_path_isfile(file_path):
-                    return ModuleSpec(name=modname, location=file_path, type=type_)
+                if file_name in listing.files:
+                    return ModuleSpec(
+                        name=modname,
+                        location=os.path.join(entry, file_name),
+                        type=type_,
+                    )
 
         # If the module name matches a stdlib module name, check whether this is a frozen
         # module. Note that `find_spec` actually imports parent modules, so we want to make
@@ -25,9 +25,10 @@ from __future__ import annotations
 
 import itertools
 import os
+import threading
 import types
-from collections.abc import Iterator
-from functools import lru_cache
+import weakref
+from collections.abc import Callable, Iterator
 from typing import TYPE_CHECKING, Any, Literal
 
 import astroid
@@ -35,7 +36,9 @@ from astroid import bases, nodes, util
 from astroid.context import InferenceContext, copy_context
 from astroid.exceptions import AttributeInferenceError, InferenceError, NoDefault
 from astroid.manager import AstroidManager
+from astroid.memo import memoize
 from astroid.nodes import node_classes
+from astroid.templates import Template
 from astroid.typing import InferenceResult, SuccessfulInferenceResult
 
 if TYPE_CHECKING:
@@ -44,6 +47,12 @@ if TYPE_CHECKING:
 IMPL_PREFIX = "attr_"
 LEN_OF_IMPL_PREFIX = len(IMPL_PREFIX)
 
+_OBJECT_NEW = Template("def __new__(self, cls): return cls()")
+# The *args and **kwargs are necessary not to trigger warnings about missing
+# or extra parameters for '__init__' methods we don't infer correctly.
+# This BoundMethod is the fallback value for those.
+_OBJECT_INIT = Template("def __init__(self, *args, **kwargs): return None")
+
 
 def _dunder_dict(instance, attributes):
     obj = node_classes.Dict(
@@ -76,9 +85,41 @@ def _get_bound_node(model: ObjectModel) -> Any:
         return model._instance
 
 
+def _no_instance() -> None:
+    return None
+
+
+class _ModelInstance(threading.local):
+    """The object a model was last accessed through, in the current thread."""
+
+    def __init__(self) -> None:
+        self.reference: Callable[[], Any] = _no_instance
+
+
+def _reference(obj: Any) -> Callable[[], Any]:
+    """Reference *obj* weakly, unless it does not support it."""
+    try:
+        return weakref.ref(obj)
+    except TypeError:
+        return lambda: obj
+
+
 class ObjectModel:
     def __init__(self):
-        self._instance = None
+        self._instance_reference = _ModelInstance()
+
+    @property
+    def _instance(self):
+        # Models are shared by all the objects of a class, so the object they
+        # were last accessed through is kept for each thread. The objects are
+        # weakly referenced, not to keep their trees alive.
+        return self._instance_reference.reference()
+
+    @_instance.setter
+    def _instance(self, instance) -> None:
+        self._instance_reference.reference = (
+            _no_instance if instance is None else _reference(instance)
+        )
 
     def __repr__(self):
         import pprint  # pylint: disable=import-outside-toplevel
@@ -121,7 +162,7 @@ class ObjectModel:
     def __contains__(self, name) -> bool:
         return name in self.attributes()
 
-    @lru_cache  # noqa
+    @memoize("object_model_attributes")
     def attributes(self) -> list[str]:
         """Get the attributes which are exported by this object model."""
         return [o[LEN_OF_IMPL_PREFIX:] for o in dir(self) if o.startswith(IMPL_PREFIX)]
@@ -139,31 +180,18 @@ class ObjectModel:
     @property
     def attr___new__(self) -> bases.BoundMethod:
         """Calling cls.__new__(type) on an object returns an instance of 'type'."""
-        from astroid import builder  # pylint: disable=import-outside-toplevel
-
-        node: nodes.FunctionDef = builder.extract_node(
-            """def __new__(self, cls): return cls()"""
-        )
         # We set the parent as being the ClassDef of 'object' as that
         # triggers correct inference as a call to __new__ in bases.py
-        node.parent = AstroidManager().builtins_module["object"]
+        node = _OBJECT_NEW.copy(parent=AstroidManager().builtins_module["object"])
 
         return bases.BoundMethod(proxy=node, bound=_get_bound_node(self))
 
     @property
     def attr___init__(self) -> bases.BoundMethod:
         """Calling cls.__init__() normally returns None."""
-        from astroid import builder  # pylint: disable=import-outside-toplevel
-
-        # The *args and **kwargs are necessary not to trigger warnings about missing
-        # or extra parameters for '__init__' methods we don't infer correctly.
-        # This BoundMethod is the fallback value for those.
-        node: nodes.FunctionDef = builder.extract_node(
-            """def __init__(self, *args, **kwargs): return None"""
-        )
         # We set the parent as being the ClassDef of 'object' as that
         # is where this method originally comes from
-        node.parent = AstroidManager().builtins_module["object"]
+        node = _OBJECT_INIT.copy(parent=AstroidManager().builtins_module["object"])
 
         return bases.BoundMethod(proxy=node, bound=_get_bound_node(self))
 
@@ -579,6 +607,9 @@ class ClassModel(ObjectModel):
     @property
     def attr_mro(self):
         other_self = self
+        # The model may have been accessed through another class by the time
+        # the method is called.
+        instance = self._instance
 
         # Cls.mro is a method and we need to return one in order to have a proper inference.
         # The method we're returning is capable of inferring the underlying MRO though.
@@ -588,7 +619,7 @@ class ClassModel(ObjectModel):
                 caller: SuccessfulInferenceResult | None,
                 context: InferenceContext | None = None,
             ) -> Iterator[node_classes.Tuple]:
-                yield other_self.attr___mro__
+                yield other_self(instance).attr___mro__
 
         implicit_metaclass = self._instance.implicit_metaclass()
         mro_method = implicit_metaclass.locals["mro"][0]
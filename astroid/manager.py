@@ -10,21 +10,50 @@ from various source and using a cache of built modules)
 from __future__ import annotations
 
 import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
+import multiprocessing
 import os
+import sys
+import threading
 import types
+import warnings
+import weakref
 import zipimport
-from collections.abc import Callable, Iterator, Sequence
-from typing import Any, ClassVar
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from astroid import nodes
-from astroid.builder import AstroidBuilder, build_namespace_package_module
-from astroid.context import InferenceContext, _invalidate_cache
-from astroid.exceptions import AstroidBuildingError, AstroidImportError
+from astroid.builder import (
+    _FOREIGN_ASSIGNMENTS,
+    AstroidBuilder,
+    build_namespace_package_module,
+)
+from astroid.class_cache import _CLASS_CACHE, ClassCache
+from astroid.context import (
+    _INFERENCE_CACHE,
+    InferenceCache,
+    InferenceContext,
+    _invalidate_cache,
+)
+from astroid.exceptions import (
+    AstroidBuildingError,
+    AstroidError,
+    AstroidImportError,
+)
+from astroid.import_graph import ImportGraph
 from astroid.interpreter._import import spec, util
+from astroid.memo import _MEMOS, NodeMemo, memos
+from astroid.module_cache import ModuleCache
 from astroid.modutils import (
+    EXT_LIB_DIRS,
+    STD_LIB_DIRS,
     NoSourceFile,
     _cache_normalize_path_,
     _has_init,
+    _is_subpath,
     cached_os_path_isfile,
     file_info_from_modpath,
     get_source_file,
@@ -36,9 +65,15 @@ from astroid.modutils import (
 )
 from astroid.transforms import TransformVisitor
 from astroid.typing import AstroidManagerBrain, InferenceResult
+from astroid.util import safe_infer
+
+if TYPE_CHECKING:
+    from astroid.persistent_cache import PersistentModuleCache
 
 ZIP_IMPORT_EXTS = (".zip", ".egg", ".whl", ".pyz", ".pyzw")
 
+_NOT_INFERRED = object()
+
 
 def safe_repr(obj: Any) -> str:
     try:
@@ -47,15 +82,103 @@ def safe_repr(obj: Any) -> str:
         return "???"
 
 
-class AstroidManager:
-    """Responsible to build astroid from files or modules.
+def _modname_from_file(filepath: str) -> str:
+    try:
+        return ".".join(modpath_from_file(filepath))
+    except ImportError:
+        return filepath
+
 
-    Use the Borg (singleton) pattern.
+def _forget_attribute_assignments(
+    module: nodes.Module, importers: Iterable[nodes.Module]
+) -> None:
+    """Unregister the attributes *module* assigned to objects of other modules,
+    and forget the ones *importers* assigned to its objects.
     """
+    for node, target in _FOREIGN_ASSIGNMENTS.pop(module, ()):
+        for attributes in (
+            getattr(target, "instance_attrs", None),
+            getattr(target, "locals", None),
+        ):
+            if attributes and node in attributes.get(node.attrname, ()):
+                attributes[node.attrname].remove(node)
+                if not attributes[node.attrname]:
+                    del attributes[node.attrname]
+                    _CLASS_CACHE.invalidate_class(target)
+    for importer in importers:
+        if assignments := _FOREIGN_ASSIGNMENTS.get(importer):
+            assignments[:] = [
+                (node, target)
+                for node, target in assignments
+                if target.root() is not module
+            ]
 
-    name = "astroid loader"
-    brain: ClassVar[AstroidManagerBrain] = {
-        "astroid_cache": {},
+
+def _installation_path() -> list[str]:
+    """Get the directories of ``sys.path`` holding the standard library and the
+    installed packages.
+    """
+    directories = (*STD_LIB_DIRS, *EXT_LIB_DIRS)
+    return [
+        entry
+        for entry in sys.path
+        if entry
+        and any(
+            _is_subpath(os.path.abspath(entry), directory) for directory in directories
+        )
+    ]
+
+
+def _resolve_relative_entries(
+    path: list[str] | None, contextfile: str
+) -> list[str] | None:
+    """Resolve the relative entries of *path*, or of ``sys.path`` if it is
+    ``None``, against the directory of *contextfile*.
+
+    An import made from *contextfile* finds the modules of ``''`` and of the other
+    relative entries in the directory of that file.
+    """
+    entries = sys.path if path is None else path
+    if all(entry and os.path.isabs(entry) for entry in entries):
+        return path
+    directory = os.path.abspath(os.path.dirname(contextfile))
+    return [
+        (
+            entry
+            if os.path.isabs(entry)
+            else os.path.normpath(os.path.join(directory, entry))
+        )
+        for entry in entries
+    ]
+
+
+def _can_fork() -> bool:
+    """Whether worker processes can be forked from this process.
+
+    Forking while other threads run could give the workers locks which one of
+    these threads holds, such as the build lock of a manager or the lock of a
+    cache, and which are then never released in the workers.
+    """
+    return (
+        "fork" in multiprocessing.get_all_start_methods()
+        and threading.active_count() == 1
+    )
+
+
+@functools.cache
+def _brains_transforms_fingerprint() -> str:
+    """Get the digest of the transforms of a manager which only has the brains."""
+    # pylint: disable-next=import-outside-toplevel
+    from astroid.persistent_cache import transforms_fingerprint
+
+    return transforms_fingerprint(AstroidManager.isolated())
+
+
+def _new_brain() -> AstroidManagerBrain:
+    """Get the state of a manager which has built nothing yet."""
+    brain: AstroidManagerBrain = {
+        "astroid_cache": ModuleCache(),
+        "import_graph": ImportGraph(),
         "_mod_file_cache": {},
         "_failed_import_hooks": [],
         "always_load_extensions": False,
@@ -64,44 +187,139 @@ class AstroidManager:
         "extension_package_whitelist": set(),
         "module_denylist": set(),
         "_transform": TransformVisitor(),
+        "_build_lock": threading.RLock(),
         "prefer_stubs": False,
+        "lazy_function_bodies": False,
+        "project_roots": (),
+        "search_path": None,
+        "persistent_cache": None,
     }
+    # Evicted modules leave the import graph once they are garbage collected.
+    brain["astroid_cache"].on_discard = brain[  # type: ignore[attr-defined]
+        "import_graph"
+    ].remove_module
+    return brain
+
+
+_ACTIVE_BRAIN: contextvars.ContextVar[AstroidManagerBrain | None] = (
+    contextvars.ContextVar("astroid_active_brain", default=None)
+)
+"""The state of the active manager, ``None`` while the default one is active."""
+
+_OWNERS: weakref.WeakKeyDictionary[nodes.Module, AstroidManagerBrain] = (
+    weakref.WeakKeyDictionary()
+)
+"""The state of the manager which built each module."""
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _activated(method: _Method) -> _Method:
+    """Make the manager active while *method* runs."""
+
+    @functools.wraps(method)
+    def wrapper(self: AstroidManager, *args: Any, **kwargs: Any) -> Any:
+        if (_ACTIVE_BRAIN.get() or AstroidManager.brain) is self._brain:
+            return method(self, *args, **kwargs)
+        token = _ACTIVE_BRAIN.set(self._brain)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _ACTIVE_BRAIN.reset(token)
+
+    return wrapper  # type: ignore[return-value]
+
+
+class AstroidManager:
+    """Responsible to build astroid from files or modules.
 
-    def __init__(self) -> None:
+    Use the Borg (singleton) pattern: ``AstroidManager()`` shares the state of
+    the active manager, the default one unless another was activated with
+    :meth:`activate`. Managers created by :meth:`isolated` have a state of their
+    own instead: their cache, import graph, transforms and settings. Only the
+    builtins module, built once, is shared between all the managers.
+    """
+
+    name = "astroid loader"
+    brain: ClassVar[AstroidManagerBrain] = _new_brain()
+    """The state of the default manager, shared by all the ``AstroidManager()``
+    created while no other manager is active."""
+
+    def __init__(self, brain: AstroidManagerBrain | None = None) -> None:
+        if brain is None:
+            brain = _ACTIVE_BRAIN.get() or AstroidManager.brain
+        self._brain = brain
         # NOTE: cache entries are added by the [re]builder
-        self.astroid_cache = AstroidManager.brain["astroid_cache"]
-        self._mod_file_cache = AstroidManager.brain["_mod_file_cache"]
-        self._failed_import_hooks = AstroidManager.brain["_failed_import_hooks"]
-        self.extension_package_whitelist = AstroidManager.brain[
-            "extension_package_whitelist"
-        ]
-        self.module_denylist = AstroidManager.brain["module_denylist"]
-        self._transform = AstroidManager.brain["_transform"]
-        self.prefer_stubs = AstroidManager.brain["prefer_stubs"]
+        self.astroid_cache = self._brain["astroid_cache"]
+        self._mod_file_cache = self._brain["_mod_file_cache"]
+        self._failed_import_hooks = self._brain["_failed_import_hooks"]
+        self.extension_package_whitelist = self._brain["extension_package_whitelist"]
+        self.module_denylist = self._brain["module_denylist"]
+        self._transform = self._brain["_transform"]
+        # Held while modules are looked up, built and transformed, and while the
+        # bodies of functions are built lazily. Modules are cached before they
+        # are fully built, so threads only look them up while holding it: they
+        # never build a module twice nor see a tree before it is transformed.
+        self._build_lock = self._brain["_build_lock"]
+        self.prefer_stubs = self._brain["prefer_stubs"]
+
+    @classmethod
+    def isolated(cls) -> AstroidManager:
+        """Create a manager with a state of its own and the default settings.
+
+        Its modules are cached, and its transforms registered, independently
+        of the other managers, so that each of them stays warm while the
+        others are used. The brain plugins are registered on it.
+
+        ``AstroidManager()``, as used by inference, refers to the active
+        manager. This manager is active while its methods building modules run;
+        infer the nodes of its modules within :meth:`activate`.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from astroid.brain.helpers import register_all_brains
+
+        manager = cls(_new_brain())
+        manager.bootstrap()
+        register_all_brains(manager)
+        return manager
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[AstroidManager]:
+        """Make ``AstroidManager()`` share the state of this manager, within the
+        context.
+
+        The active manager is kept in a context variable: other threads, and
+        other asynchronous tasks, are not affected.
+        """
+        token = _ACTIVE_BRAIN.set(self._brain)
+        try:
+            yield self
+        finally:
+            _ACTIVE_BRAIN.reset(token)
 
     @property
     def always_load_extensions(self) -> bool:
-        return AstroidManager.brain["always_load_extensions"]
+        return self._brain["always_load_extensions"]
 
     @always_load_extensions.setter
     def always_load_extensions(self, value: bool) -> None:
-        AstroidManager.brain["always_load_extensions"] = value
+        self._brain["always_load_extensions"] = value
 
     @property
     def optimize_ast(self) -> bool:
-        return AstroidManager.brain["optimize_ast"]
+        return self._brain["optimize_ast"]
 
     @optimize_ast.setter
     def optimize_ast(self, value: bool) -> None:
-        AstroidManager.brain["optimize_ast"] = value
+        self._brain["optimize_ast"] = value
 
     @property
     def max_inferable_values(self) -> int:
-        return AstroidManager.brain["max_inferable_values"]
+        return self._brain["max_inferable_values"]
 
     @max_inferable_values.setter
     def max_inferable_values(self, value: int) -> None:
-        AstroidManager.brain["max_inferable_values"] = value
+        self._brain["max_inferable_values"] = value
 
     @property
     def register_transform(self):
@@ -112,22 +330,127 @@ class AstroidManager:
     def unregister_transform(self):
         return self._transform.unregister_transform
 
+    @property
+    def import_graph(self) -> ImportGraph:
+        """The imports between the modules built by the manager."""
+        return self._brain["import_graph"]
+
+    @property
+    def inference_cache(self) -> InferenceCache:
+        """The results of past inferences, with their hit and miss counters."""
+        return _INFERENCE_CACHE
+
+    @property
+    def class_cache(self) -> ClassCache:
+        """The MROs, ancestors and attribute tables of classes, with hit counters."""
+        return _CLASS_CACHE
+
+    @property
+    def memos(self) -> dict[str, NodeMemo]:
+        """The memos of ``lookup`` and other hot methods, with hit counters."""
+        return memos()
+
     @property
     def builtins_module(self) -> nodes.Module:
         return self.astroid_cache["builtins"]
 
     @property
     def prefer_stubs(self) -> bool:
-        return AstroidManager.brain["prefer_stubs"]
+        return self._brain["prefer_stubs"]
 
     @prefer_stubs.setter
     def prefer_stubs(self, value: bool) -> None:
-        AstroidManager.brain["prefer_stubs"] = value
+        self._brain["prefer_stubs"] = value
+
+    @property
+    def lazy_function_bodies(self) -> bool:
+        """Whether the bodies of functions are built on first access.
+
+        Until then, a function body is left as source, or as ``ast`` statements
+        when the source is not available. This applies to bodies which register
+        nothing outside of them: those without ``global`` statements, imports
+        or assignments to attributes. The transforms of a body are applied once
+        it is built, when the rest of its module may be transformed already.
+        """
+        return self._brain["lazy_function_bodies"]
+
+    @lazy_function_bodies.setter
+    def lazy_function_bodies(self, value: bool) -> None:
+        self._brain["lazy_function_bodies"] = value
+
+    @property
+    def project_roots(self) -> tuple[str, ...]:
+        """The directories of the project being analysed.
+
+        Modules of files outside of them, such as the installed dependencies,
+        are built as interfaces: see :meth:`builds_interface`. All the modules
+        are fully built while there are no project roots.
+        """
+        return self._brain["project_roots"]
+
+    @project_roots.setter
+    def project_roots(self, value: Iterable[str]) -> None:
+        self._brain["project_roots"] = tuple(os.path.abspath(root) for root in value)
+
+    @property
+    def search_path(self) -> tuple[str, ...] | None:
+        """The directories in which modules are searched for by name.
+
+        ``None`` (the default) for the directories of ``sys.path``. Otherwise,
+        modules which are not found in these directories are searched for in
+        the directories of ``sys.path`` holding the standard library and the
+        installed packages.
+        """
+        return self._brain["search_path"]
+
+    @search_path.setter
+    def search_path(self, value: Iterable[str] | None) -> None:
+        self._brain["search_path"] = tuple(value) if value is not None else None
+        self._mod_file_cache.clear()
+
+    def builds_interface(self, path: str | None) -> bool:
+        """Whether the module of the file *path* is built as an interface.
+
+        An interface has its module-level names, classes, signatures,
+        decorators and annotations built, while the bodies of its functions
+        are built on first access, as with :attr:`lazy_function_bodies`.
+        Modules of files outside of :attr:`project_roots` are interfaces.
+        """
+        roots = self.project_roots
+        if not roots or path is None:
+            return False
+        path = os.path.abspath(path)
+        return not any(_is_subpath(path, root) for root in roots)
+
+    @property
+    def persistent_cache(self) -> PersistentModuleCache | None:
+        """The on-disk cache of modules built from source files, if enabled."""
+        return self._brain["persistent_cache"]
+
+    @property
+    def persistent_cache_dir(self) -> str | None:
+        """The directory of the on-disk module cache.
+
+        Set it to reuse modules built from source files across processes, or
+        to ``None`` (the default) to disable the cache.
+        """
+        cache = self._brain["persistent_cache"]
+        return cache.directory if cache is not None else None
+
+    @persistent_cache_dir.setter
+    def persistent_cache_dir(self, value: str | os.PathLike[str] | None) -> None:
+        # pylint: disable-next=import-outside-toplevel
+        from astroid.persistent_cache import PersistentModuleCache
+
+        self._brain["persistent_cache"] = (
+            PersistentModuleCache(value) if value is not None else None
+        )
 
     def visit_transforms(self, node: nodes.NodeNG) -> InferenceResult:
         """Visit the transforms and apply them to the given *node*."""
         return self._transform.visit(node)
 
+    @_activated
     def ast_from_file(
         self,
         filepath: str,
@@ -137,36 +460,215 @@ class AstroidManager:
     ) -> nodes.Module:
         """Given a module name, return the astroid object."""
         if modname is None:
+            modname = _modname_from_file(filepath)
+        with self._build_lock:
+            cached = self.astroid_cache.get(modname)
+            if cached is not None and cached.file == filepath:
+                return cached
+            # Call get_source_file() only after a cache miss,
+            # since it calls os.path.exists().
             try:
-                modname = ".".join(modpath_from_file(filepath))
-            except ImportError:
-                modname = filepath
-        if (
-            modname in self.astroid_cache
-            and self.astroid_cache[modname].file == filepath
-        ):
-            return self.astroid_cache[modname]
-        # Call get_source_file() only after a cache miss,
-        # since it calls os.path.exists().
-        try:
-            filepath = get_source_file(
-                filepath, include_no_ext=True, prefer_stubs=self.prefer_stubs
-            )
-            source = True
-        except NoSourceFile:
-            pass
-        # Second attempt on the cache after get_source_file().
-        if (
-            modname in self.astroid_cache
-            and self.astroid_cache[modname].file == filepath
-        ):
-            return self.astroid_cache[modname]
-        if source:
-            return AstroidBuilder(self).file_build(filepath, modname)
+                filepath = get_source_file(
+                    filepath, include_no_ext=True, prefer_stubs=self.prefer_stubs
+                )
+                source = True
+            except NoSourceFile:
+                pass
+            # Second attempt on the cache after get_source_file().
+            cached = self.astroid_cache.get(modname)
+            if cached is not None and cached.file == filepath:
+                return cached
+            if source:
+                if (persistent_cache := self.persistent_cache) is None:
+                    return AstroidBuilder(self).file_build(filepath, modname)
+                module = persistent_cache.load(self, filepath, modname)
+                if module is None:
+                    module = AstroidBuilder(self).file_build(filepath, modname)
+                    persistent_cache.store(self, module)
+                return module
         if fallback and modname:
             return self.ast_from_module_name(modname)
         raise AstroidBuildingError("Unable to build an AST for {path}.", path=filepath)
 
+    @_activated
+    def ast_from_files(
+        self, filepaths: Iterable[str], workers: int | None = None
+    ) -> list[nodes.Module]:
+        """Build the modules of many files, parsing them in parallel processes.
+
+        Source files are parsed and rebuilt by a pool of *workers* processes,
+        ``os.cpu_count()`` by default, which send the trees back serialized.
+        The modules are then added to the cache, so that imports between the
+        files resolve to them. Other files, and files the workers fail to
+        build, are built by :meth:`ast_from_file` in this process.
+
+        The workers are forked when this process can be forked safely, see
+        :meth:`infer_many`. Otherwise, they are started afresh and only know the
+        transforms of the brains: the files are then all built in this process,
+        with a warning, if other transforms are registered on the manager.
+
+        :returns: The modules, in the order of *filepaths*.
+        """
+        filepaths = list(filepaths)
+        modules: list[nodes.Module | None] = [None] * len(filepaths)
+        pending: list[tuple[int, str, str]] = []
+        for index, filepath in enumerate(filepaths):
+            modname = _modname_from_file(filepath)
+            try:
+                source_path = get_source_file(
+                    filepath, include_no_ext=True, prefer_stubs=self.prefer_stubs
+                )
+            except NoSourceFile:
+                continue
+            with self._build_lock:
+                cached = self.astroid_cache.get(modname)
+            if cached is not None and cached.file in {filepath, source_path}:
+                modules[index] = cached
+            elif self.persistent_cache is not None:
+                modules[index] = self.persistent_cache.load(self, source_path, modname)
+            if modules[index] is None:
+                pending.append((index, source_path, modname))
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and len(pending) > 1:
+            self._build_in_workers(pending, modules, min(workers, len(pending)))
+
+        return [
+            self.ast_from_file(filepath) if module is None else module
+            for filepath, module in zip(filepaths, modules)
+        ]
+
+    def _build_in_workers(
+        self,
+        pending: list[tuple[int, str, str]],
+        modules: list[nodes.Module | None],
+        workers: int,
+    ) -> None:
+        # pylint: disable=import-outside-toplevel
+        from astroid import _parallel
+        from astroid.nodes.serialization import _load_built_module
+        from astroid.persistent_cache import transforms_fingerprint
+
+        fingerprint = transforms_fingerprint(self)
+        if _can_fork():
+            # Forked workers inherit the transforms registered in this process.
+            mp_context = multiprocessing.get_context("fork")
+        elif fingerprint == _brains_transforms_fingerprint():
+            mp_context = multiprocessing.get_context(
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+        else:
+            # Started afresh, the workers would only know the transforms of the
+            # brains, and build nothing.
+            warnings.warn(
+                "Building the files in this process: worker processes cannot "
+                "apply the transforms registered on the manager in addition to "
+                "the brains, unless they are forked, which is unavailable on "
+                "this platform or while other threads run.",
+                UserWarning,
+                stacklevel=4,
+            )
+            return
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_parallel.initialize_worker,
+            initargs=(_parallel.manager_settings(self), fingerprint),
+        ) as executor:
+            results = executor.map(
+                _parallel.build_serialized,
+                [filepath for _, filepath, _ in pending],
+                [modname for _, _, modname in pending],
+                chunksize=max(1, len(pending) // (workers * 4)),
+            )
+            for (index, _, _), data in zip(pending, results):
+                if data is None:
+                    continue
+                try:
+                    module = _load_built_module(data, manager=self)
+                except ValueError:
+                    continue
+                modules[index] = module
+                if self.persistent_cache is not None:
+                    self.persistent_cache.store(self, module)
+
+    @_activated
+    def infer_many(
+        self, nodes_to_infer: Iterable[nodes.NodeNG], workers: int | None = None
+    ) -> list[InferenceResult | None]:
+        """Infer many nodes as :func:`astroid.util.safe_infer` does, in parallel
+        processes.
+
+        The nodes are split in small chunks, which a pool of *workers* processes,
+        ``os.cpu_count()`` by default, take one after the other as they become
+        idle. The workers are forked, so that they share the trees built so far
+        with this process, and send the results back serialized. Nodes of the
+        modules of the cache are sent as references to them, so the results are
+        the ones inferring the nodes in this process gives, unless they depend
+        on what was inferred before. This process infers the nodes itself when
+        it cannot be forked, or while other threads run, as the workers would
+        inherit the locks held by these threads without the threads to release
+        them. It also infers the nodes the workers fail to infer or to send
+        back.
+
+        :returns: The results, in the order of the nodes.
+        """
+        nodes_to_infer = list(nodes_to_infer)
+        results: list[Any] = [_NOT_INFERRED] * len(nodes_to_infer)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and len(nodes_to_infer) > 1 and _can_fork():
+            self._infer_in_workers(
+                nodes_to_infer, results, min(workers, len(nodes_to_infer))
+            )
+        return [
+            safe_infer(node) if result is _NOT_INFERRED else result
+            for node, result in zip(nodes_to_infer, results)
+        ]
+
+    def _infer_in_workers(
+        self, nodes_to_infer: list[nodes.NodeNG], results: list[Any], workers: int
+    ) -> None:
+        # pylint: disable=import-outside-toplevel
+        from astroid import _parallel
+        from astroid.nodes.serialization import _loads
+
+        chunksize = max(1, len(nodes_to_infer) // (workers * 8))
+        starts = range(0, len(nodes_to_infer), chunksize)
+        # The workers are forked, so the arguments of the initializer are
+        # inherited rather than serialized.
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_parallel.initialize_inferring_worker,
+            initargs=(nodes_to_infer, self),
+        ) as executor:
+            chunks = executor.map(
+                _parallel.infer_serialized,
+                starts,
+                [start + chunksize for start in starts],
+            )
+            for start, chunk in zip(starts, chunks):
+                if chunk is None:
+                    continue
+                for index, data in enumerate(
+                    [chunk] if isinstance(chunk, bytes) else chunk
+                ):
+                    if data is None:
+                        continue
+                    try:
+                        values = _loads(data, manager=self)
+                    except (ValueError, AstroidError):
+                        continue
+                    if isinstance(chunk, bytes):
+                        results[start : start + len(values)] = values
+                    else:
+                        results[start + index] = values[0]
+
+    @_activated
     def ast_from_string(
         self, data: str, modname: str = "", filepath: str | None = None
     ) -> nodes.Module:
@@ -192,6 +694,7 @@ class AstroidManager:
             modname, self.extension_package_whitelist
         )
 
+    @_activated
     def ast_from_module_name(  # noqa: C901
         self,
         modname: str | None,
@@ -207,63 +710,72 @@ class AstroidManager:
         # module.
         if modname in self.module_denylist:
             raise AstroidImportError(f"Skipping ignored module {modname!r}")
-        if modname in self.astroid_cache and use_cache:
-            return self.astroid_cache[modname]
-        if modname == "__main__":
-            return self._build_stub_module(modname)
-        if context_file:
-            old_cwd = os.getcwd()
-            os.chdir(os.path.dirname(context_file))
+        with self._build_lock:
+            if use_cache and (cached := self.astroid_cache.get(modname)) is not None:
+                return cached
+            if modname == "__main__":
+                return self._build_stub_module(modname)
         try:
+            # Finding the module only reads the file system, other threads keep
+            # building meanwhile. The directory of the context file is searched
+            # first, the current directory is left alone.
             found_spec = self.file_from_module_name(modname, context_file)
-            if found_spec.type == spec.ModuleType.PY_ZIPMODULE:
-                module = self.zip_import_data(found_spec.location)
-                if module is not None:
-                    return module
-
-            elif found_spec.type in (
-                spec.ModuleType.C_BUILTIN,
-                spec.ModuleType.C_EXTENSION,
-            ):
+            with self._build_lock:
                 if (
-                    found_spec.type == spec.ModuleType.C_EXTENSION
-                    and not self._can_load_extension(modname)
+                    use_cache
+                    and (cached := self.astroid_cache.get(modname)) is not None
                 ):
-                    return self._build_stub_module(modname)
-                try:
-                    named_module = load_module_from_name(modname)
-                except Exception as e:
+                    return cached
+                if found_spec.type == spec.ModuleType.PY_ZIPMODULE:
+                    module = self.zip_import_data(found_spec.location)
+                    if module is not None:
+                        return module
+
+                elif found_spec.type in (
+                    spec.ModuleType.C_BUILTIN,
+                    spec.ModuleType.C_EXTENSION,
+                ):
+                    if (
+                        found_spec.type == spec.ModuleType.C_EXTENSION
+                        and not self._can_load_extension(modname)
+                    ):
+                        return self._build_stub_module(modname)
+                    try:
+                        named_module = load_module_from_name(modname)
+                    except Exception as e:
+                        raise AstroidImportError(
+                            "Loading {modname} failed with:\n{error}",
+                            modname=modname,
+                            path=found_spec.location,
+                        ) from e
+                    return self.ast_from_module(named_module, modname)
+
+                elif found_spec.type == spec.ModuleType.PY_COMPILED:
                     raise AstroidImportError(
-                        "Loading {modname} failed with:\n{error}",
+                        "Unable to load compiled module {modname}.",
                         modname=modname,
                         path=found_spec.location,
-                    ) from e
-                return self.ast_from_module(named_module, modname)
+                    )
 
-            elif found_spec.type == spec.ModuleType.PY_COMPILED:
-                raise AstroidImportError(
-                    "Unable to load compiled module {modname}.",
-                    modname=modname,
-                    path=found_spec.location,
-                )
+                elif found_spec.type == spec.ModuleType.PY_NAMESPACE:
+                    return self._build_namespace_module(
+                        modname, found_spec.submodule_search_locations or []
+                    )
+                elif found_spec.type == spec.ModuleType.PY_FROZEN:
+                    if found_spec.location is None:
+                        return self._build_stub_module(modname)
+                    # For stdlib frozen modules we can determine the location and
+                    # can therefore create a module from the source file
+                    return self.ast_from_file(
+                        found_spec.location, modname, fallback=False
+                    )
 
-            elif found_spec.type == spec.ModuleType.PY_NAMESPACE:
-                return self._build_namespace_module(
-                    modname, found_spec.submodule_search_locations or []
-                )
-            elif found_spec.type == spec.ModuleType.PY_FROZEN:
                 if found_spec.location is None:
-                    return self._build_stub_module(modname)
-                # For stdlib frozen modules we can determine the location and
-                # can therefore create a module from the source file
-                return self.ast_from_file(found_spec.location, modname, fallback=False)
-
-            if found_spec.location is None:
-                raise AstroidImportError(
-                    "Can't find a file for module {modname}.", modname=modname
-                )
+                    raise AstroidImportError(
+                        "Can't find a file for module {modname}.", modname=modname
+                    )
 
-            return self.ast_from_file(found_spec.location, modname, fallback=False)
+                return self.ast_from_file(found_spec.location, modname, fallback=False)
         except AstroidBuildingError as e:
             for hook in self._failed_import_hooks:
                 try:
@@ -271,9 +783,6 @@ class AstroidManager:
                 except AstroidBuildingError:
                     pass
             raise e
-        finally:
-            if context_file:
-                os.chdir(old_cwd)
 
     def zip_import_data(self, filepath: str) -> nodes.Module | None:
         if zipimport is None:
@@ -301,43 +810,81 @@ class AstroidManager:
     def file_from_module_name(
         self, modname: str, contextfile: str | None
     ) -> spec.ModuleSpec:
+        """Find the module *modname*, as imported from the file *contextfile*.
+
+        When the persistent cache is enabled, the modules that names resolved
+        to, and the names that could not be resolved, are reused from the
+        previous processes.
+        """
         try:
             value = self._mod_file_cache[(modname, contextfile)]
         except KeyError:
-            try:
-                value = file_info_from_modpath(
-                    modname.split("."), context_file=contextfile
+            modpath = modname.split(".")
+            search_path = self.search_path
+            if modpath[0] in sys.builtin_module_names:
+                # Built-in modules are only found without a search path.
+                search_path = None
+            persistent_cache = self.persistent_cache
+            found: spec.ModuleSpec | ImportError | None = None
+            if persistent_cache is not None:
+                found = persistent_cache.load_import(search_path, modname, contextfile)
+            if found is None:
+                path = (
+                    [*search_path, *_installation_path()]
+                    if search_path is not None
+                    else None
                 )
-            except ImportError as e:
+                if (
+                    contextfile is not None
+                    and modpath[0] not in sys.builtin_module_names
+                ):
+                    path = _resolve_relative_entries(path, contextfile)
+                try:
+                    found = file_info_from_modpath(
+                        modpath, path=path, context_file=contextfile
+                    )
+                except ImportError as e:
+                    found = e
+                if persistent_cache is not None:
+                    persistent_cache.store_import(
+                        search_path, modname, contextfile, found
+                    )
+            if isinstance(found, ImportError):
                 value = AstroidImportError(
                     "Failed to import module {modname} with error:\n{error}.",
                     modname=modname,
                     # we remove the traceback here to save on memory usage (since these exceptions are cached)
-                    error=e.with_traceback(None),
+                    error=found.with_traceback(None),
                 )
+            else:
+                value = found
             self._mod_file_cache[(modname, contextfile)] = value
         if isinstance(value, AstroidBuildingError):
             # we remove the traceback here to save on memory usage (since these exceptions are cached)
             raise value.with_traceback(None)  # pylint: disable=no-member
         return value
 
+    @_activated
     def ast_from_module(
         self, module: types.ModuleType, modname: str | None = None
     ) -> nodes.Module:
         """Given an imported module, return the astroid object."""
         modname = modname or module.__name__
-        if modname in self.astroid_cache:
-            return self.astroid_cache[modname]
-        try:
-            # some builtin modules don't have __file__ attribute
-            filepath = module.__file__
-            if is_python_source(filepath):
-                # Type is checked in is_python_source
-                return self.ast_from_file(filepath, modname)  # type: ignore[arg-type]
-        except AttributeError:
-            pass
+        with self._build_lock:
+            if (cached := self.astroid_cache.get(modname)) is not None:
+                return cached
+            try:
+                # some builtin modules don't have __file__ attribute
+                filepath = module.__file__
+                if is_python_source(filepath):
+                    # Type is checked in is_python_source
+                    return self.ast_from_file(
+                        filepath, modname  # type: ignore[arg-type]
+                    )
+            except AttributeError:
+                pass
 
-        return AstroidBuilder(self).module_build(module, modname)
+            return AstroidBuilder(self).module_build(module, modname)
 
     def ast_from_class(self, klass: type, modname: str | None = None) -> nodes.ClassDef:
         """Get astroid for the given class."""
@@ -418,22 +965,116 @@ class AstroidManager:
         self._failed_import_hooks.append(hook)
 
     def cache_module(self, module: nodes.Module) -> None:
-        """Cache a module if no module with the same name is known yet."""
+        """Cache a module if no module with the same name is known yet.
+
+        The module is recorded as built by this manager in any case, see
+        :meth:`owner_of`.
+        """
+        _OWNERS[module] = self._brain
         self.astroid_cache.setdefault(module.name, module)
 
+    @classmethod
+    def owner_of(cls, module: nodes.Module) -> AstroidManager:
+        """Get the manager which built *module*.
+
+        The nodes of a module import the other modules through it, whichever
+        manager is active. The active manager is returned for the modules which
+        were not built by a manager.
+        """
+        return cls(_OWNERS.get(module))
+
+    @_activated
+    def invalidate_module(self, modname: str) -> None:
+        """Forget the module *modname* and what was inferred from it.
+
+        The module is removed from the cache, to be built again the next time it
+        is needed, along with the inference results and class hierarchies
+        involving it or the modules importing it, directly or not. The
+        attributes it assigned to classes of other modules are unregistered,
+        without inferring them again. Other caches are left warm.
+        """
+        # pylint: disable=import-outside-toplevel
+        from astroid.inference_tip import clear_inference_tip_cache
+
+        with self._build_lock:
+            module = self.astroid_cache.get(modname)
+            if module is None:
+                return
+            affected = {modname, *self.import_graph.dependents(modname)}
+            _forget_attribute_assignments(
+                module,
+                [
+                    self.astroid_cache[importer]
+                    for importer in self.import_graph.importers(modname)
+                    if importer in self.astroid_cache
+                ],
+            )
+            roots = [
+                self.astroid_cache[name]
+                for name in affected
+                if name in self.astroid_cache
+            ]
+            del self.astroid_cache[modname]
+            self.import_graph.remove_module(modname)
+            _invalidate_cache(affected)
+            _CLASS_CACHE.invalidate(affected)
+            clear_inference_tip_cache(affected)
+            _MEMOS["lookup"].invalidate(roots)
+            _MEMOS["metaclass_lookup_attribute"].invalidate(roots)
+
+    @_activated
+    def reload_file(self, filepath: str) -> nodes.Module:
+        """Build the module of *filepath* again, after it changed.
+
+        .. seealso:: :meth:`invalidate_module`
+
+        The attributes the modules importing it assign to its classes are
+        registered again.
+        """
+        modname = _modname_from_file(filepath)
+        importers = self.import_graph.importers(modname)
+        self.invalidate_module(modname)
+        module = self.ast_from_file(filepath, modname)
+        builder = AstroidBuilder(self, apply_transforms=False)
+        for importer in importers:
+            if importer not in self.astroid_cache:
+                continue
+            for node in self.astroid_cache[importer].nodes_of_class(nodes.AssignAttr):
+                if not isinstance(node.parent, nodes.ExceptHandler):
+                    builder.delayed_assattr(node)
+        return module
+
+    @_activated
     def bootstrap(self) -> None:
         """Bootstrap the required AST modules needed for the manager to work.
 
         The bootstrap usually involves building the AST for the builtins
         module, which is required by the rest of astroid to work correctly.
+        When the persistent cache is enabled, the builtins module is loaded
+        from the snapshot it holds. Managers created by :meth:`isolated` reuse
+        the builtins module of the default manager, bootstrapping it first if
+        needed.
         """
         from astroid import raw_building  # pylint: disable=import-outside-toplevel
 
-        raw_building._astroid_bootstrapping()
+        if self._brain is not AstroidManager.brain:
+            default = AstroidManager(AstroidManager.brain)
+            if "builtins" not in default.astroid_cache:
+                default.bootstrap()
+            self.astroid_cache["builtins"] = default.builtins_module
+            return
+        raw_building._astroid_bootstrapping(self.persistent_cache)
 
+    @_activated
     def clear_cache(self) -> None:
         """Clear the underlying caches, bootstrap the builtins module and
         re-register transforms.
+
+        The inference results and class hierarchies are shared by all the
+        managers. Clearing the cache of the default manager drops all of them,
+        and builds the builtins module again: the managers created by
+        :meth:`isolated` should then be cleared as well. Clearing the cache of
+        another manager only drops the results involving its own modules.
         """
         # import here because of cyclic imports
         # pylint: disable=import-outside-toplevel
@@ -443,27 +1084,38 @@ class AstroidManager:
             _find_spec,
             _is_setuptools_namespace,
         )
-        from astroid.interpreter.objectmodel import ObjectModel
-        from astroid.nodes._base_nodes import LookupMixIn
-        from astroid.nodes.scoped_nodes import ClassDef
 
-        clear_inference_tip_cache()
-        _invalidate_cache()  # inference context cache
+        if self._brain is AstroidManager.brain:
+            clear_inference_tip_cache()
+            _invalidate_cache()  # inference context cache
+            _CLASS_CACHE.clear()
+            for memo in _MEMOS.values():
+                memo.clear()
+        else:
+            # The trees of the other managers never refer to these modules, but
+            # the results of the shared builtins module may, e.g. as bound nodes.
+            modules = {
+                module
+                for module, brain in list(_OWNERS.items())
+                if brain is self._brain
+            }
+            clear_inference_tip_cache(trees=modules)
+            _INFERENCE_CACHE.invalidate_trees(modules)
+            for module in modules:
+                _CLASS_CACHE.invalidate_root(module)
 
         self.astroid_cache.clear()
+        self.import_graph.clear()
         self._mod_file_cache.clear()
 
         # NB: not a new TransformVisitor()
-        AstroidManager.brain["_transform"].transforms = collections.defaultdict(list)
+        self._brain["_transform"].transforms = collections.defaultdict(list)
 
         for lru_cache in (
-            LookupMixIn.lookup,
             _cache_normalize_path_,
             _has_init,
             cached_os_path_isfile,
             util.is_namespace,
-            ObjectModel.attributes,
-            ClassDef._metaclass_lookup_attribute,
             _find_spec,
             _is_setuptools_namespace,
         ):
@@ -471,6 +1123,9 @@ class AstroidManager:
 
         for finder in spec._SPEC_FINDERS:
             finder.find_module.cache_clear()
+        spec.clear_directory_listings()
+        if self.persistent_cache is not None:
+            self.persistent_cache.forget_imports()
 
         self.bootstrap()
 
@@ -0,0 +1,169 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Results of methods memoized on the objects they are called on.
+
+Unlike ``functools.lru_cache``, which keeps every object it was called on alive
+and evicts results once it holds a fixed number of them, a :class:`NodeMemo`
+stores the results on the object itself, in its ``_memo_results`` slot. They
+are released along with the tree of the object, whatever the size of the
+workload.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import weakref
+from collections.abc import Callable, Collection, Hashable
+from typing import Any, NamedTuple, TypeVar
+
+_T = TypeVar("_T")
+
+MEMO_PREFIX = "_memo_"
+"""Prefix of the attributes holding memoized results, which are never serialized."""
+
+MEMO_RESULTS = MEMO_PREFIX + "results"
+"""The attribute holding the results memoized on an object by all the memos.
+
+It maps each memo to the generation of its results, and ``(memo, key)`` to
+each result, so that an object holds a single dict whatever it memoizes.
+"""
+
+_MISSING = object()
+
+
+class MemoInfo(NamedTuple):
+    """Statistics of a :class:`NodeMemo`."""
+
+    hits: int
+    misses: int
+
+
+def _tree_root(obj: Any) -> Any:
+    """Get the root of the tree of *obj*, or ``None`` if it is not a node."""
+    if not hasattr(obj, "parent"):
+        return None
+    while (parent := obj.parent) is not None and parent is not obj:
+        obj = parent
+    return obj
+
+
+class NodeMemo:
+    """Results of a method, stored on the objects it is called on.
+
+    Clearing the memo does not visit the objects: it starts a new generation,
+    and the results stored by the previous ones are ignored from then on, and
+    dropped once the object memoizes a new one. The nodes holding results are
+    also tracked by the root of their tree, so that the results of some trees
+    can be dropped alone.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._generation = 0
+        self._holders: weakref.WeakKeyDictionary[Any, weakref.WeakSet[Any]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        """Guards the counters and the holders of results."""
+        self.hits = 0
+        """Number of calls which found a memoized result."""
+        self.misses = 0
+        """Number of calls which did not find a memoized result."""
+
+    def get(self, obj: Any, key: Hashable) -> Any:
+        """Get the result memoized on *obj* for *key*, or ``_MISSING``.
+
+        The lookup is counted as a hit or a miss.
+        """
+        results = getattr(obj, MEMO_RESULTS, None)
+        if results is not None and results.get(self) == self._generation:
+            value = results.get((self, key), _MISSING)
+            if value is not _MISSING:
+                with self._lock:
+                    self.hits += 1
+                return value
+        with self._lock:
+            self.misses += 1
+        return _MISSING
+
+    def set(self, obj: Any, key: Hashable, value: Any) -> None:
+        """Memoize *value* on *obj* for *key*."""
+        results = getattr(obj, MEMO_RESULTS, None)
+        if results is None:
+            results = {}
+            setattr(obj, MEMO_RESULTS, results)
+        if results.get(self) != self._generation:
+            for item in list(results):
+                if type(item) is tuple and item[0] is self:
+                    results.pop(item, None)
+            results[self] = self._generation
+            root = _tree_root(obj)
+            if root is not None:
+                with self._lock:
+                    self._holders.setdefault(root, weakref.WeakSet()).add(obj)
+        results[self, key] = value
+
+    def invalidate(self, roots: Collection[Any] | None = None) -> None:
+        """Ignore the results memoized so far.
+
+        :param roots: If given, only the results memoized on the nodes of the
+            trees of these roots are dropped.
+        """
+        with self._lock:
+            if roots is None:
+                self._generation += 1
+                self._holders.clear()
+                return
+            holders = [obj for root in roots for obj in self._holders.pop(root, ())]
+        for obj in holders:
+            # The results themselves are dropped when the next one is memoized.
+            getattr(obj, MEMO_RESULTS).pop(self, None)
+
+    def clear(self) -> None:
+        """Ignore the results memoized so far and reset the counters."""
+        self.invalidate()
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def info(self) -> MemoInfo:
+        return MemoInfo(self.hits, self.misses)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} {self.name!r}, {self.hits} hits, "
+            f"{self.misses} misses>"
+        )
+
+
+_MEMOS: dict[str, NodeMemo] = {}
+
+
+def memoize(name: str) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    """Memoize a method on the objects it is called on, as the memo *name*.
+
+    The arguments of the method, other than the object, make up the key of
+    its results. The memo is available as the ``memo`` attribute of the method.
+    """
+    memo = _MEMOS[name] = NodeMemo(name)
+
+    def decorator(method: Callable[..., _T]) -> Callable[..., _T]:
+        @functools.wraps(method)
+        def wrapper(self: Any, *args: Any) -> _T:
+            value = memo.get(self, args)
+            if value is _MISSING:
+                value = method(self, *args)
+                memo.set(self, args, value)
+            return value
+
+        wrapper.memo = memo  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def memos() -> dict[str, NodeMemo]:
+    """Get the memos of the methods memoized with :func:`memoize`, by name."""
+    return dict(_MEMOS)
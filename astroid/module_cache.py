@@ -0,0 +1,224 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""A bounded cache of modules, used as the ``astroid_cache`` of the manager."""
+
+from __future__ import annotations
+
+import collections
+import threading
+import weakref
+from collections.abc import Callable, Iterator, MutableMapping
+from typing import TYPE_CHECKING
+
+from astroid.class_cache import _CLASS_CACHE
+from astroid.context import _INFERENCE_CACHE
+
+if TYPE_CHECKING:
+    from astroid import nodes
+
+_BYTES_PER_LINE = 1200
+"""Rough memory footprint of a line of source once built into a tree."""
+
+_ALWAYS_PINNED = frozenset({"builtins"})
+
+
+def estimate_module_size(module: nodes.Module) -> int:
+    """Roughly estimate the memory used by the tree of a module, in bytes."""
+    lines = module.tolineno or 0
+    return max(lines, len(module.locals)) * _BYTES_PER_LINE
+
+
+class ModuleCache(MutableMapping[str, "nodes.Module"]):
+    """A mapping of module names to modules, evicting the least recently used.
+
+    The cache is unbounded by default. When *max_entries* or *max_memory*, in
+    bytes as estimated by :func:`estimate_module_size`, is set, adding a module
+    evicts the least recently used modules beyond the budget.
+
+    Evicted modules are only weakly referenced afterwards, and the results
+    inferred from their nodes and cached for their classes are dropped: a module
+    that is still referenced from a live tree, e.g. by a node of another module,
+    stays in the cache until it is garbage collected, so that it is never built
+    twice.
+    ``builtins`` and the modules passed to :meth:`pin` are never evicted.
+
+    *on_discard* is called with the name of each module which leaves the cache
+    for good: removed, or evicted and garbage collected.
+
+    The cache can be used from several threads at once.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_memory: int | None = None,
+        on_discard: Callable[[str], None] | None = None,
+    ) -> None:
+        self._modules: collections.OrderedDict[str, nodes.Module] = (
+            collections.OrderedDict()
+        )
+        self._sizes: dict[str, int] = {}
+        self._evicted: weakref.WeakValueDictionary[str, nodes.Module] = (
+            weakref.WeakValueDictionary()
+        )
+        self._watched: weakref.WeakSet[nodes.Module] = weakref.WeakSet()
+        self._pinned: set[str] = set(_ALWAYS_PINNED)
+        # Reentrant, as modules may be garbage collected, and discarded, while
+        # the cache is being updated.
+        self._lock = threading.RLock()
+        self._memory = 0
+        self._max_entries = max_entries
+        self._max_memory = max_memory
+        self.evictions = 0
+        """Number of modules evicted since the cache was created."""
+        self.on_discard = on_discard
+
+    @property
+    def max_entries(self) -> int | None:
+        """Maximum number of modules held by the cache, ``None`` for no limit."""
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int | None) -> None:
+        with self._lock:
+            self._max_entries = value
+            self._evict()
+
+    @property
+    def max_memory(self) -> int | None:
+        """Maximum estimated memory of the modules held, ``None`` for no limit."""
+        return self._max_memory
+
+    @max_memory.setter
+    def max_memory(self, value: int | None) -> None:
+        with self._lock:
+            self._max_memory = value
+            self._evict()
+
+    @property
+    def memory(self) -> int:
+        """Estimated memory used by the modules held by the cache, in bytes."""
+        return self._memory
+
+    def pin(self, name: str) -> None:
+        """Never evict the module *name*."""
+        with self._lock:
+            self._pinned.add(name)
+
+    def unpin(self, name: str) -> None:
+        """Allow the module *name* to be evicted again."""
+        if name not in _ALWAYS_PINNED:
+            with self._lock:
+                self._pinned.discard(name)
+
+    def _revive(self, name: str) -> nodes.Module | None:
+        """Hold an evicted module again if it is still alive."""
+        module = self._evicted.pop(name, None)
+        if module is not None:
+            self._add(name, module)
+        return module
+
+    def _add(self, name: str, module: nodes.Module) -> None:
+        size = estimate_module_size(module)
+        self._modules[name] = module
+        self._sizes[name] = size
+        self._memory += size
+        self._evict()
+
+    def _evict(self) -> None:
+        """Evict the least recently used modules until the cache fits its budget."""
+        if self._max_entries is None and self._max_memory is None:
+            return
+        for name in list(self._modules):
+            if not self._over_budget():
+                return
+            if name in self._pinned:
+                continue
+            module = self._modules.pop(name)
+            self._evicted[name] = module
+            self._memory -= self._sizes.pop(name)
+            self.evictions += 1
+            _INFERENCE_CACHE.invalidate_root(module)
+            _CLASS_CACHE.invalidate_root(module)
+            if module not in self._watched:
+                self._watched.add(module)
+                weakref.finalize(module, self._collected, name)
+
+    def _collected(self, name: str) -> None:
+        if self.on_discard is not None and name not in self:
+            self.on_discard(name)
+
+    def _over_budget(self) -> bool:
+        if self._max_entries is not None and len(self._modules) > self._max_entries:
+            return True
+        return self._max_memory is not None and self._memory > self._max_memory
+
+    def __getitem__(self, name: str) -> nodes.Module:
+        with self._lock:
+            try:
+                self._modules.move_to_end(name)
+            except KeyError:
+                module = self._revive(name)
+                if module is None:
+                    raise
+                return module
+            return self._modules[name]
+
+    def __contains__(self, name: object) -> bool:
+        with self._lock:
+            if name in self._modules:
+                return True
+            # Revived so that a following lookup finds it for sure.
+            return isinstance(name, str) and self._revive(name) is not None
+
+    def __setitem__(self, name: str, module: nodes.Module) -> None:
+        with self._lock:
+            self._evicted.pop(name, None)
+            if name in self._modules:
+                self._remove(name)
+            self._add(name, module)
+
+    def __delitem__(self, name: str) -> None:
+        with self._lock:
+            if name in self._modules:
+                self._remove(name)
+            else:
+                del self._evicted[name]
+        if self.on_discard is not None:
+            self.on_discard(name)
+
+    def _remove(self, name: str) -> None:
+        del self._modules[name]
+        self._memory -= self._sizes.pop(name)
+
+    def __iter__(self) -> Iterator[str]:
+        # The modules are kept alive until the iteration is over, in case they
+        # are evicted meanwhile.
+        with self._lock:
+            modules = [*self._modules.items(), *self._evicted.items()]
+        yield from (name for name, _ in modules)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._modules) + len(self._evicted)
+
+    def clear(self) -> None:
+        if self.on_discard is not None:
+            for name in self:
+                self.on_discard(name)
+        with self._lock:
+            self._modules.clear()
+            self._sizes.clear()
+            self._evicted.clear()
+            self._memory = 0
+
+    def copy(self) -> dict[str, nodes.Module]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} of {len(self._modules)} modules, "
+            f"{len(self._evicted)} evicted>"
+        )
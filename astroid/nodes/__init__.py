@@ -111,6 +111,7 @@ from astroid.nodes.scoped_nodes import (
     function_to_method,
     get_wrapping_class,
 )
+from astroid.nodes.serialization import dump, dumps, load, loads
 from astroid.nodes.utils import Position
 
 ALL_NODE_CLASSES = (
@@ -297,7 +298,11 @@ __all__ = (
     "are_exclusive",
     "builtin_lookup",
     "const_factory",
+    "dump",
+    "dumps",
     "function_to_method",
     "get_wrapping_class",
+    "load",
+    "loads",
     "unpack_infer",
 )
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import itertools
 from collections.abc import Callable, Generator, Iterator
-from functools import cached_property, lru_cache, partial
+from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from astroid import bases, nodes, util
@@ -20,11 +20,13 @@ from astroid.context import (
     InferenceContext,
     bind_context_to_node,
 )
+from astroid.decorators import cached_property
 from astroid.exceptions import (
     AttributeInferenceError,
     InferenceError,
 )
 from astroid.interpreter import dunder_lookup
+from astroid.memo import memoize
 from astroid.nodes.node_ng import NodeNG
 from astroid.typing import InferenceResult
 
@@ -51,6 +53,8 @@ class Statement(NodeNG):
     NOTE: This class is part of the public API of 'astroid.nodes'.
     """
 
+    __slots__ = ()
+
     is_statement = True
     """Whether this node indicates a statement."""
 
@@ -83,6 +87,8 @@ class Statement(NodeNG):
 class NoChildrenNode(NodeNG):
     """Base nodes for nodes with no children, e.g. Pass."""
 
+    __slots__ = ()
+
     def get_children(self) -> Iterator[NodeNG]:
         yield from ()
 
@@ -90,6 +96,8 @@ class NoChildrenNode(NodeNG):
 class FilterStmtsBaseNode(NodeNG):
     """Base node for statement filtering and assignment type."""
 
+    __slots__ = ()
+
     def _get_filtered_stmts(self, _, node, _stmts, mystmt: Statement | None):
         """Method used in _filter_stmts to get statements and trigger break."""
         if self.statement() is mystmt:
@@ -105,6 +113,8 @@ class FilterStmtsBaseNode(NodeNG):
 class AssignTypeNode(NodeNG):
     """Base node for nodes that can 'assign' such as AnnAssign."""
 
+    __slots__ = ()
+
     def assign_type(self):
         return self
 
@@ -122,6 +132,8 @@ class AssignTypeNode(NodeNG):
 class ParentAssignNode(AssignTypeNode):
     """Base node for nodes whose assign_type is determined by the parent node."""
 
+    __slots__ = ()
+
     def assign_type(self):
         return self.parent.assign_type()
 
@@ -129,6 +141,8 @@ class ParentAssignNode(AssignTypeNode):
 class ImportNode(FilterStmtsBaseNode, NoChildrenNode, Statement):
     """Base node for From and Import Nodes."""
 
+    __slots__ = ()
+
     modname: str | None
     """The module that is being imported from.
 
@@ -200,6 +214,8 @@ class MultiLineBlockNode(NodeNG):
     Assign nodes, etc.
     """
 
+    __slots__ = ()
+
     _multi_line_block_fields: ClassVar[tuple[str, ...]] = ()
 
     @cached_property
@@ -240,6 +256,8 @@ class MultiLineBlockNode(NodeNG):
 class MultiLineWithElseBlockNode(MultiLineBlockNode):
     """Base node for multi-line blocks that can have else statements."""
 
+    __slots__ = ()
+
     body: list[NodeNG]
     """The contents of the block."""
 
@@ -291,7 +309,9 @@ class MultiLineWithElseBlockNode(MultiLineBlockNode):
 class LookupMixIn(NodeNG):
     """Mixin to look up a name in the right scope."""
 
-    @lru_cache  # noqa
+    __slots__ = ()
+
+    @memoize("lookup")
     def lookup(self, name: str) -> tuple[LocalsDictNodeNG, list[NodeNG]]:
         """Lookup where the given variable is assigned.
 
@@ -355,6 +375,8 @@ AUGMENTED_OP_METHOD = {
 
 
 class OperatorNode(NodeNG):
+    __slots__ = ()
+
     @staticmethod
     def _filter_operation_errors(
         infer_callable: Callable[
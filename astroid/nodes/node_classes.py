@@ -14,13 +14,13 @@ import sys
 import typing
 import warnings
 from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
-from functools import cached_property
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Union
 
 from astroid import decorators, protocols, util
 from astroid.bases import Instance, _infer_stmts
 from astroid.const import _EMPTY_OBJECT_MARKER, PY314_PLUS, Context
 from astroid.context import CallContext, InferenceContext, copy_context
+from astroid.decorators import cached_property
 from astroid.exceptions import (
     AstroidBuildingError,
     AstroidError,
@@ -270,6 +270,8 @@ def _container_getitem(instance, elts, index, context: InferenceContext | None =
 class BaseContainer(_base_nodes.ParentAssignNode, Instance, metaclass=abc.ABCMeta):
     """Base class for Set, FrozenSet, Tuple and List."""
 
+    __slots__ = ("elts",)
+
     _astroid_fields = ("elts",)
 
     def __init__(
@@ -411,6 +413,8 @@ class AssignName(
     'variable'
     """
 
+    __slots__ = ("name",)
+
     _other_fields = ("name",)
 
     def __init__(
@@ -498,6 +502,8 @@ class DelName(
     'variable'
     """
 
+    __slots__ = ("name",)
+
     _other_fields = ("name",)
 
     def __init__(
@@ -538,6 +544,8 @@ class Name(_base_nodes.LookupMixIn, _base_nodes.NoChildrenNode):
     'range'
     """
 
+    __slots__ = ("name",)
+
     _other_fields = ("name",)
 
     def __init__(
@@ -614,6 +622,26 @@ class Arguments(
     <Arguments l.1 at 0x...>
     """
 
+    __slots__ = (
+        "annotations",
+        "args",
+        "defaults",
+        "kw_defaults",
+        "kwarg",
+        "kwarg_node",
+        "kwargannotation",
+        "kwonlyargs",
+        "kwonlyargs_annotations",
+        "posonlyargs",
+        "posonlyargs_annotations",
+        "type_comment_args",
+        "type_comment_kwonlyargs",
+        "type_comment_posonlyargs",
+        "vararg",
+        "vararg_node",
+        "varargannotation",
+    )
+
     # In the ast module, each argument is a new class, _ast.arg, which
     # exposes an 'annotation' attribute. In astroid though, arguments are
     # exposed as is in the Arguments node, so annotations are exposed
@@ -1133,6 +1161,8 @@ class AssignAttr(_base_nodes.LookupMixIn, _base_nodes.ParentAssignNode):
     'self.attribute'
     """
 
+    __slots__ = ("attrname", "expr")
+
     expr: NodeNG
 
     _astroid_fields = ("expr",)
@@ -1203,6 +1233,8 @@ class Assert(_base_nodes.Statement):
     <Assert l.1 at 0x...>
     """
 
+    __slots__ = ("fail", "test")
+
     _astroid_fields = ("test", "fail")
 
     test: NodeNG
@@ -1234,6 +1266,8 @@ class Assign(_base_nodes.AssignTypeNode, _base_nodes.Statement):
     <Assign l.1 at 0x...>
     """
 
+    __slots__ = ("targets", "type_annotation", "value")
+
     targets: list[NodeNG]
     """What is being assigned to."""
 
@@ -1288,6 +1322,8 @@ class AnnAssign(_base_nodes.AssignTypeNode, _base_nodes.Statement):
     <AnnAssign l.1 at 0x...>
     """
 
+    __slots__ = ("annotation", "simple", "target", "value")
+
     _astroid_fields = ("target", "annotation", "value")
     _other_fields = ("simple",)
 
@@ -1341,6 +1377,8 @@ class AugAssign(
     <AugAssign l.1 at 0x...>
     """
 
+    __slots__ = ("op", "target", "value")
+
     _astroid_fields = ("target", "value")
     _other_fields = ("op",)
 
@@ -1467,6 +1505,8 @@ class BinOp(_base_nodes.OperatorNode):
     <BinOp l.1 at 0x...>
     """
 
+    __slots__ = ("left", "op", "right")
+
     _astroid_fields = ("left", "right")
     _other_fields = ("op",)
 
@@ -1582,6 +1622,8 @@ class BoolOp(NodeNG):
     <BoolOp l.1 at 0x...>
     """
 
+    __slots__ = ("op", "values")
+
     _astroid_fields = ("values",)
     _other_fields = ("op",)
 
@@ -1702,6 +1744,8 @@ class Break(_base_nodes.NoChildrenNode, _base_nodes.Statement):
     <Break l.1 at 0x...>
     """
 
+    __slots__ = ()
+
 
 class Call(NodeNG):
     """Class representing an :class:`ast.Call` node.
@@ -1714,6 +1758,8 @@ class Call(NodeNG):
     <Call l.1 at 0x...>
     """
 
+    __slots__ = ("args", "func", "keywords")
+
     _astroid_fields = ("func", "args", "keywords")
 
     func: NodeNG
@@ -1821,6 +1867,8 @@ class Compare(NodeNG):
     [('<=', <Name.b l.1 at 0x...>), ('<=', <Name.c l.1 at 0x...>)]
     """
 
+    __slots__ = ("left", "ops")
+
     _astroid_fields = ("left", "ops")
 
     left: NodeNG
@@ -1953,6 +2001,8 @@ class Comprehension(NodeNG):
     'for x in some_values'
     """
 
+    __slots__ = ("ifs", "is_async", "iter", "target")
+
     _astroid_fields = ("target", "iter", "ifs")
     _other_fields = ("is_async",)
 
@@ -2034,6 +2084,8 @@ class Const(_base_nodes.NoChildrenNode, Instance):
     <Const.bytes l.1 at 0x...>]
     """
 
+    __slots__ = ("kind", "value")
+
     _other_fields = ("value", "kind")
 
     def __init__(
@@ -2199,6 +2251,8 @@ class Continue(_base_nodes.NoChildrenNode, _base_nodes.Statement):
     <Continue l.1 at 0x...>
     """
 
+    __slots__ = ()
+
 
 class Decorators(NodeNG):
     """A node representing a list of decorators.
@@ -2218,6 +2272,8 @@ class Decorators(NodeNG):
     <Decorators l.2 at 0x...>
     """
 
+    __slots__ = ("nodes",)
+
     _astroid_fields = ("nodes",)
 
     nodes: list[NodeNG]
@@ -2263,6 +2319,8 @@ class DelAttr(_base_nodes.ParentAssignNode):
     <DelAttr.attr l.1 at 0x...>
     """
 
+    __slots__ = ("attrname", "expr")
+
     _astroid_fields = ("expr",)
     _other_fields = ("attrname",)
 
@@ -2308,6 +2366,8 @@ class Delete(_base_nodes.AssignTypeNode, _base_nodes.Statement):
     <Delete l.1 at 0x...>
     """
 
+    __slots__ = ("targets",)
+
     _astroid_fields = ("targets",)
 
     def __init__(
@@ -2348,6 +2408,8 @@ class Dict(NodeNG, Instance):
     <Dict.dict l.1 at 0x...>
     """
 
+    __slots__ = ("items",)
+
     _astroid_fields = ("items",)
 
     def __init__(
@@ -2537,6 +2599,8 @@ class Expr(_base_nodes.Statement):
     <Expr l.1 at 0x...>
     """
 
+    __slots__ = ("value",)
+
     _astroid_fields = ("value",)
 
     value: NodeNG
@@ -2560,6 +2624,8 @@ class Expr(_base_nodes.Statement):
 class EmptyNode(_base_nodes.NoChildrenNode):
     """Holds an arbitrary object in the :attr:`~astroid.nodes.LocalsDictNodeNG.locals`."""
 
+    __slots__ = ()
+
     object = None
 
     def __init__(
@@ -2618,6 +2684,8 @@ class ExceptHandler(
     [<ExceptHandler l.4 at 0x...>]
     """
 
+    __slots__ = ("body", "name", "type")
+
     _astroid_fields = ("type", "name", "body")
     _multi_line_block_fields = ("body",)
 
@@ -2689,6 +2757,8 @@ class For(
     <For l.1 at 0x...>
     """
 
+    __slots__ = ("body", "iter", "orelse", "target", "type_annotation")
+
     _astroid_fields = ("target", "iter", "body", "orelse")
     _other_other_fields = ("type_annotation",)
     _multi_line_block_fields = ("body", "orelse")
@@ -2767,6 +2837,8 @@ class AsyncFor(For):
     <AsyncFor l.3 at 0x...>
     """
 
+    __slots__ = ()
+
 
 class Await(NodeNG):
     """Class representing an :class:`ast.Await` node.
@@ -2786,6 +2858,8 @@ class Await(NodeNG):
     <Await l.3 at 0x...>
     """
 
+    __slots__ = ("value",)
+
     _astroid_fields = ("value",)
 
     value: NodeNG
@@ -2807,6 +2881,8 @@ class ImportFrom(_base_nodes.ImportNode):
     <ImportFrom l.1 at 0x...>
     """
 
+    __slots__ = ("is_lazy", "level", "modname", "names")
+
     _other_fields = ("modname", "names", "level", "is_lazy")
 
     def __init__(
@@ -2906,6 +2982,8 @@ class ImportFrom(_base_nodes.ImportNode):
 class Attribute(NodeNG):
     """Class representing an :class:`ast.Attribute` node."""
 
+    __slots__ = ("attrname", "expr")
+
     expr: NodeNG
 
     _astroid_fields = ("expr",)
@@ -2955,6 +3033,8 @@ class Global(_base_nodes.NoChildrenNode, _base_nodes.Statement):
     <Global l.1 at 0x...>
     """
 
+    __slots__ = ("names",)
+
     _other_fields = ("names",)
 
     def __init__(
@@ -3021,6 +3101,8 @@ class If(_base_nodes.MultiLineWithElseBlockNode, _base_nodes.Statement):
     <If l.1 at 0x...>
     """
 
+    __slots__ = ("body", "orelse", "test")
+
     _astroid_fields = ("test", "body", "orelse")
     _multi_line_block_fields = ("body", "orelse")
 
@@ -3074,6 +3156,8 @@ class IfExp(NodeNG):
     <IfExp l.1 at 0x...>
     """
 
+    __slots__ = ("body", "orelse", "test")
+
     _astroid_fields = ("test", "body", "orelse")
 
     test: NodeNG
@@ -3152,6 +3236,8 @@ class Import(_base_nodes.ImportNode):
     <Import l.1 at 0x...>
     """
 
+    __slots__ = ("is_lazy", "names")
+
     _other_fields = ("names", "is_lazy")
 
     def __init__(
@@ -3232,6 +3318,8 @@ class Keyword(NodeNG):
     [<Keyword l.1 at 0x...>]
     """
 
+    __slots__ = ("arg", "value")
+
     _astroid_fields = ("value",)
     _other_fields = ("arg",)
 
@@ -3275,6 +3363,8 @@ class List(BaseContainer):
     <List.list l.1 at 0x...>
     """
 
+    __slots__ = ("ctx",)
+
     _other_fields = ("ctx",)
 
     def __init__(
@@ -3351,6 +3441,8 @@ class Nonlocal(_base_nodes.NoChildrenNode, _base_nodes.Statement):
     <Nonlocal l.3 at 0x...>
     """
 
+    __slots__ = ("names",)
+
     _other_fields = ("names",)
 
     def __init__(
@@ -3402,6 +3494,8 @@ class ParamSpec(_base_nodes.AssignTypeNode):
     <ParamSpec l.1 at 0x...>
     """
 
+    __slots__ = ("default_value", "name")
+
     _astroid_fields = ("name", "default_value")
     name: AssignName
     default_value: NodeNG | None
@@ -3459,6 +3553,8 @@ class Pass(_base_nodes.NoChildrenNode, _base_nodes.Statement):
     <Pass l.1 at 0x...>
     """
 
+    __slots__ = ()
+
 
 class Raise(_base_nodes.Statement):
     """Class representing an :class:`ast.Raise` node.
@@ -3469,6 +3565,8 @@ class Raise(_base_nodes.Statement):
     <Raise l.1 at 0x...>
     """
 
+    __slots__ = ("cause", "exc")
+
     _astroid_fields = ("exc", "cause")
 
     exc: NodeNG | None
@@ -3513,6 +3611,8 @@ class Return(_base_nodes.Statement):
     <Return l.1 at 0x...>
     """
 
+    __slots__ = ("value",)
+
     _astroid_fields = ("value",)
 
     value: NodeNG | None
@@ -3541,6 +3641,8 @@ class Set(BaseContainer):
     <Set.set l.1 at 0x...>
     """
 
+    __slots__ = ()
+
     infer_unary_op = protocols.set_infer_unary_op
 
     def pytype(self) -> Literal["builtins.set"]:
@@ -3562,6 +3664,8 @@ class Slice(NodeNG):
     <Slice l.1 at 0x...>
     """
 
+    __slots__ = ("lower", "step", "upper")
+
     _astroid_fields = ("lower", "upper", "step")
 
     lower: NodeNG | None
@@ -3661,6 +3765,8 @@ class Starred(_base_nodes.ParentAssignNode):
     <Starred l.1 at 0x...>
     """
 
+    __slots__ = ("ctx", "value")
+
     _astroid_fields = ("value",)
     _other_fields = ("ctx",)
 
@@ -3709,6 +3815,8 @@ class Subscript(NodeNG):
     <Subscript l.1 at 0x...>
     """
 
+    __slots__ = ("ctx", "slice", "value")
+
     _SUBSCRIPT_SENTINEL = object()
     _astroid_fields = ("value", "slice")
     _other_fields = ("ctx",)
@@ -3834,6 +3942,8 @@ class Try(_base_nodes.MultiLineWithElseBlockNode, _base_nodes.Statement):
     <Try l.2 at 0x...>
     """
 
+    __slots__ = ("body", "finalbody", "handlers", "orelse")
+
     _astroid_fields = ("body", "handlers", "orelse", "finalbody")
     _multi_line_block_fields = ("body", "handlers", "orelse", "finalbody")
 
@@ -3932,6 +4042,8 @@ class Try(_base_nodes.MultiLineWithElseBlockNode, _base_nodes.Statement):
 class TryStar(_base_nodes.MultiLineWithElseBlockNode, _base_nodes.Statement):
     """Class representing an :class:`ast.TryStar` node."""
 
+    __slots__ = ("body", "finalbody", "handlers", "orelse")
+
     _astroid_fields = ("body", "handlers", "orelse", "finalbody")
     _multi_line_block_fields = ("body", "handlers", "orelse", "finalbody")
 
@@ -4032,6 +4144,8 @@ class Tuple(BaseContainer):
     <Tuple.tuple l.1 at 0x...>
     """
 
+    __slots__ = ("ctx",)
+
     _other_fields = ("ctx",)
 
     def __init__(
@@ -4103,6 +4217,8 @@ class TypeAlias(_base_nodes.AssignTypeNode, _base_nodes.Statement):
     <TypeAlias l.1 at 0x...>
     """
 
+    __slots__ = ("name", "type_params", "value")
+
     _astroid_fields = ("name", "type_params", "value")
 
     name: AssignName
@@ -4176,6 +4292,8 @@ class TypeVar(_base_nodes.AssignTypeNode):
     <TypeVar l.1 at 0x...>
     """
 
+    __slots__ = ("bound", "default_value", "name")
+
     _astroid_fields = ("name", "bound", "default_value")
     name: AssignName
     bound: NodeNG | None
@@ -4241,6 +4359,8 @@ class TypeVarTuple(_base_nodes.AssignTypeNode):
     <TypeVarTuple l.1 at 0x...>
     """
 
+    __slots__ = ("default_value", "name")
+
     _astroid_fields = ("name", "default_value")
     name: AssignName
     default_value: NodeNG | None
@@ -4308,6 +4428,8 @@ class UnaryOp(_base_nodes.OperatorNode):
     <UnaryOp l.1 at 0x...>
     """
 
+    __slots__ = ("op", "operand")
+
     _astroid_fields = ("operand",)
     _other_fields = ("op",)
 
@@ -4456,6 +4578,8 @@ class While(_base_nodes.MultiLineWithElseBlockNode, _base_nodes.Statement):
     <While l.2 at 0x...>
     """
 
+    __slots__ = ("body", "orelse", "test")
+
     _astroid_fields = ("test", "body", "orelse")
     _multi_line_block_fields = ("body", "orelse")
 
@@ -4519,6 +4643,8 @@ class With(
     <With l.2 at 0x...>
     """
 
+    __slots__ = ("body", "items", "type_annotation")
+
     _astroid_fields = ("items", "body")
     _other_other_fields = ("type_annotation",)
     _multi_line_block_fields = ("body",)
@@ -4610,6 +4736,8 @@ class With(
 class AsyncWith(With):
     """Asynchronous ``with`` built with the ``async`` keyword."""
 
+    __slots__ = ()
+
 
 class Yield(NodeNG):
     """Class representing an :class:`ast.Yield` node.
@@ -4620,6 +4748,8 @@ class Yield(NodeNG):
     <Yield l.1 at 0x...>
     """
 
+    __slots__ = ("value",)
+
     _astroid_fields = ("value",)
 
     value: NodeNG | None
@@ -4642,10 +4772,14 @@ class Yield(NodeNG):
 class YieldFrom(Yield):  # TODO value is required, not optional
     """Class representing an :class:`ast.YieldFrom` node."""
 
+    __slots__ = ()
+
 
 class DictUnpack(_base_nodes.NoChildrenNode):
     """Represents the unpacking of dicts into dicts using :pep:`448`."""
 
+    __slots__ = ()
+
 
 class FormattedValue(NodeNG):
     """Class representing an :class:`ast.FormattedValue` node.
@@ -4660,6 +4794,8 @@ class FormattedValue(NodeNG):
     [<Const.str l.1 at 0x...>, <FormattedValue l.1 at 0x...>]
     """
 
+    __slots__ = ("conversion", "format_spec", "value")
+
     _astroid_fields = ("value", "format_spec")
     _other_fields = ("conversion",)
 
@@ -4790,6 +4926,8 @@ class JoinedStr(NodeNG):
     <JoinedStr l.1 at 0x...>
     """
 
+    __slots__ = ("values",)
+
     _astroid_fields = ("values",)
 
     def __init__(
@@ -4906,6 +5044,8 @@ class NamedExpr(_base_nodes.AssignTypeNode):
     <NamedExpr l.1 at 0x...>
     """
 
+    __slots__ = ("target", "value")
+
     _astroid_fields = ("target", "value")
 
     optional_assign = True
@@ -5023,6 +5163,8 @@ class Unknown(_base_nodes.AssignTypeNode):
     introspection failed, and as a placeholder in ObjectModel.
     """
 
+    __slots__ = ()
+
     name = "Unknown"
 
     def __init__(
@@ -5060,6 +5202,8 @@ class EvaluatedObject(NodeNG):
     with the resulting class acting as the non-evaluated node.
     """
 
+    __slots__ = ("original", "value")
+
     name = "EvaluatedObject"
     _astroid_fields = ("original",)
     _other_fields = ("value",)
@@ -5105,6 +5249,8 @@ class Match(_base_nodes.Statement, _base_nodes.MultiLineBlockNode):
     <Match l.2 at 0x...>
     """
 
+    __slots__ = ("cases", "subject")
+
     _astroid_fields = ("subject", "cases")
     _multi_line_block_fields = ("cases",)
 
@@ -5140,6 +5286,8 @@ class Match(_base_nodes.Statement, _base_nodes.MultiLineBlockNode):
 class Pattern(NodeNG):
     """Base class for all Pattern nodes."""
 
+    __slots__ = ()
+
 
 class MatchCase(_base_nodes.MultiLineBlockNode):
     """Class representing a :class:`ast.match_case` node.
@@ -5154,6 +5302,8 @@ class MatchCase(_base_nodes.MultiLineBlockNode):
     <MatchCase l.3 at 0x...>
     """
 
+    __slots__ = ("body", "guard", "pattern")
+
     _astroid_fields = ("pattern", "guard", "body")
     _multi_line_block_fields = ("body",)
 
@@ -5199,6 +5349,8 @@ class MatchValue(Pattern):
     <MatchValue l.3 at 0x...>
     """
 
+    __slots__ = ("value",)
+
     _astroid_fields = ("value",)
 
     def __init__(
@@ -5244,6 +5396,8 @@ class MatchSingleton(Pattern):
     <MatchSingleton l.7 at 0x...>
     """
 
+    __slots__ = ("value",)
+
     _other_fields = ("value",)
 
     def __init__(
@@ -5283,6 +5437,8 @@ class MatchSequence(Pattern):
     <MatchSequence l.5 at 0x...>
     """
 
+    __slots__ = ("patterns",)
+
     _astroid_fields = ("patterns",)
 
     def __init__(
@@ -5320,6 +5476,8 @@ class MatchMapping(_base_nodes.AssignTypeNode, Pattern):
     <MatchMapping l.3 at 0x...>
     """
 
+    __slots__ = ("keys", "patterns", "rest")
+
     _astroid_fields = ("keys", "patterns", "rest")
 
     def __init__(
@@ -5376,6 +5534,8 @@ class MatchClass(Pattern):
     <MatchClass l.5 at 0x...>
     """
 
+    __slots__ = ("cls", "kwd_attrs", "kwd_patterns", "patterns")
+
     _astroid_fields = ("cls", "patterns", "kwd_patterns")
     _other_fields = ("kwd_attrs",)
 
@@ -5427,6 +5587,8 @@ class MatchStar(_base_nodes.AssignTypeNode, Pattern):
     <MatchStar l.3 at 0x...>
     """
 
+    __slots__ = ("name",)
+
     _astroid_fields = ("name",)
 
     def __init__(
@@ -5481,6 +5643,8 @@ class MatchAs(_base_nodes.AssignTypeNode, Pattern):
     <MatchAs l.9 at 0x...>
     """
 
+    __slots__ = ("name", "pattern")
+
     _astroid_fields = ("pattern", "name")
 
     def __init__(
@@ -5530,6 +5694,8 @@ class MatchOr(Pattern):
     <MatchOr l.3 at 0x...>
     """
 
+    __slots__ = ("patterns",)
+
     _astroid_fields = ("patterns",)
 
     def __init__(
@@ -5563,6 +5729,8 @@ class TemplateStr(NodeNG):
     <TemplateStr l.1 at 0x...>
     """
 
+    __slots__ = ("values",)
+
     _astroid_fields = ("values",)
 
     def __init__(
@@ -5603,6 +5771,8 @@ class Interpolation(NodeNG):
     <Interpolation l.1 at 0x...>
     """
 
+    __slots__ = ("conversion", "format_spec", "str", "value")
+
     _astroid_fields = ("value", "format_spec")
     _other_fields = ("str", "conversion")
 
@@ -4,12 +4,14 @@
 
 from __future__ import annotations
 
+import functools
 import sys
-from collections.abc import Generator, Iterator
-from functools import cached_property
+import unicodedata
+from collections.abc import Generator, Iterator, Mapping, Sequence
 from functools import singledispatch as _singledispatch
 from typing import (
     TYPE_CHECKING,
+    Any,
     ClassVar,
     TypeVar,
     cast,
@@ -17,7 +19,9 @@ from typing import (
 )
 
 from astroid import nodes, util
+from astroid.const import PY311_PLUS
 from astroid.context import InferenceContext
+from astroid.decorators import cached_property
 from astroid.exceptions import (
     AstroidError,
     InferenceError,
@@ -26,6 +30,7 @@ from astroid.exceptions import (
     UseInferenceDefault,
 )
 from astroid.manager import AstroidManager
+from astroid.memo import MEMO_PREFIX, MEMO_RESULTS
 from astroid.nodes.as_string import AsStringVisitor
 from astroid.nodes.const import OP_PRECEDENCE
 from astroid.nodes.utils import Position
@@ -56,6 +61,18 @@ class NodeNG:
     This is the base class for all Astroid node classes.
     """
 
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "_memo_results",
+        "col_offset",
+        "end_col_offset",
+        "end_lineno",
+        "lineno",
+        "parent",
+        "position",
+    )
+
     is_statement: ClassVar[bool] = False
     """Whether this node indicates a statement."""
     optional_assign: ClassVar[bool] = False  # True for For
@@ -148,8 +165,9 @@ class NodeNG:
                 pass
 
         key = (self, context.lookupname, context.callcontext, context.boundnode)
-        if key in context.inferred:
-            yield from context.inferred[key]
+        cached = context.inferred.get(key)
+        if cached is not None:
+            yield from cached
             return
 
         results = []
@@ -528,8 +546,9 @@ class NodeNG:
                 continue
             yield from child_node.nodes_of_class(klass, skip_klass)
 
-    @cached_property
+    @property
     def _assign_nodes_in_scope(self) -> list[nodes.Assign]:
+        # Not cached, so that nodes without assignments keep no __dict__.
         return []
 
     def _get_name_nodes(self):
@@ -599,6 +618,23 @@ class NodeNG:
     def eq(self, value) -> bool:
         return False
 
+    def clone(self, parent: NodeNG | None = None, deep: bool = True) -> Self:
+        """Get a copy of this node, keeping its position and its ``locals``.
+
+        The descendants of the node are copied too when *deep* is true, and the
+        ``locals``, ``instance_attrs`` and inference tips of the copies refer to
+        the copies of the nodes. Nodes outside of the copied tree are shared.
+        Otherwise the copy refers to the children of this node, which are left
+        unchanged. Results cached on the nodes, such as inferred values, are
+        not copied.
+
+        :param parent: The parent of the copy, instead of that of this node.
+        :param deep: Whether to copy the descendants of the node too.
+        """
+        # Also builds the lazy bodies of functions, which copies could not share.
+        originals = list(self.nodes_of_class(NodeNG)) if deep else [self]
+        return _copy_tree(originals, parent)
+
     def as_string(self) -> str:
         """Get the source code that this node represents."""
         return AsStringVisitor()(self)
@@ -771,3 +807,150 @@ class NodeNG:
     def op_left_associative(self) -> bool:
         # Everything is left associative except `**` and IfExp
         return True
+
+
+@functools.cache
+def _slots(cls: type) -> dict[str, Any]:
+    """Get the descriptors of the slots holding the attributes of *cls*, by name."""
+    slots = {}
+    for klass in reversed(cls.__mro__):
+        names = klass.__dict__.get("__slots__", ())
+        for name in (names,) if isinstance(names, str) else names:
+            if name not in {"__dict__", "__weakref__"}:
+                slots[name] = klass.__dict__[name]
+    return slots
+
+
+if PY311_PLUS:
+
+    def _instance_dict(obj: Any) -> dict[str, Any]:
+        # Unlike obj.__dict__, does not create the lazy __dict__ of slotted nodes.
+        state = object.__getstate__(obj)
+        if type(state) is tuple:
+            state = state[0]
+        return state or {}
+
+else:
+
+    def _instance_dict(obj: Any) -> dict[str, Any]:
+        return getattr(obj, "__dict__", {})
+
+
+# Attributes holding the name of a variable, an attribute or an argument.
+_IDENTIFIERS = ("name", "attrname", "arg", "vararg", "kwarg")
+
+# Attributes mapping names to the nodes defining them.
+_NAME_MAPPINGS = ("locals", "instance_attrs")
+
+# Types of the values a node and its copies share, since they cannot change.
+_SHARED_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes, Position})
+
+
+if PY311_PLUS:
+
+    def _state(obj: Any) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        """Get the ``__dict__`` of *obj*, or ``None``, and the values of its slots."""
+        state = object.__getstate__(obj)
+        if type(state) is tuple:
+            return state
+        return state, {}
+
+else:
+
+    def _state(obj: Any) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        """Get the ``__dict__`` of *obj*, or ``None``, and the values of its slots."""
+        slots = {}
+        for name, descriptor in _slots(type(obj)).items():
+            try:
+                slots[name] = descriptor.__get__(obj)
+            except AttributeError:
+                pass
+        return getattr(obj, "__dict__", None), slots
+
+
+@functools.cache
+def _cached_properties(cls: type) -> frozenset[str]:
+    """Get the names of the cached properties of *cls*, stored in ``__dict__``."""
+    return frozenset(
+        name
+        for klass in cls.__mro__
+        for name, value in vars(klass).items()
+        if isinstance(value, functools.cached_property)
+    )
+
+
+def _copy_tree(
+    originals: Sequence[NodeNG],
+    parent: NodeNG | None = None,
+    names: Mapping[str, str] | None = None,
+    index: int = 0,
+) -> Any:
+    """Copy the given nodes, the first of which is the root of the others, and
+    get the copy of the node at *index*.
+
+    Nodes outside of the copied ones are shared. Names of variables, attributes
+    and arguments equal to a key of *names* take its value, normalized to NFKC
+    as the parser does.
+    """
+    names = names or {}
+    copies = {id(node): node.__class__.__new__(node.__class__) for node in originals}
+    copy_of = copies.get
+
+    def copy_value(value: Any) -> Any:
+        value_type = value.__class__
+        if value_type in _SHARED_TYPES:
+            return value
+        if isinstance(value, NodeNG):
+            return copy_of(id(value), value)
+        if value_type is list:
+            return [copy_value(item) for item in value]
+        if value_type is tuple:
+            return tuple(copy_value(item) for item in value)
+        if value_type is dict:
+            return {key: copy_value(item) for key, item in value.items()}
+        if value_type is set:
+            return {copy_value(item) for item in value}
+        return value
+
+    identifiers = {
+        placeholder: unicodedata.normalize("NFKC", name)
+        for placeholder, name in names.items()
+    }
+    for node in originals:
+        copy = copies[id(node)]
+        state, slots = _state(node)
+        for name, value in slots.items():
+            if name == MEMO_RESULTS:
+                continue
+            value_type = value.__class__
+            if value_type is list:
+                value = [
+                    (
+                        copy_of(id(item), item)
+                        if isinstance(item, NodeNG)
+                        else copy_value(item)
+                    )
+                    for item in value
+                ]
+            elif value_type is str:
+                if identifiers and name in _IDENTIFIERS:
+                    value = identifiers.get(value, value)
+            elif value_type is dict and identifiers and name in _NAME_MAPPINGS:
+                value = {
+                    identifiers.get(key, key): copy_value(item)
+                    for key, item in value.items()
+                }
+            elif value_type not in _SHARED_TYPES:
+                value = copy_value(value)
+            setattr(copy, name, value)
+        if state:
+            cached = _cached_properties(node.__class__)
+            copy.__dict__.update(
+                (name, copy_value(value))
+                for name, value in state.items()
+                if not (name.startswith(MEMO_PREFIX) or name in cached)
+            )
+    copy = copies[id(originals[index])]
+    if parent is not None:
+        copy.parent = parent
+    return copy
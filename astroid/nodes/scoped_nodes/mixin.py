@@ -29,6 +29,8 @@ class LocalsDictNodeNG(_base_nodes.LookupMixIn):
     to locals information
     """
 
+    __slots__ = ()
+
     # attributes below are set by the builder module or by raw factories
     locals: dict[str, list[InferenceResult]]
     """A map of the name of a local variable to the node defining the local."""
@@ -199,6 +201,8 @@ class LocalsDictNodeNG(_base_nodes.LookupMixIn):
 class ComprehensionScope(LocalsDictNodeNG):
     """Scoping for different types of comprehensions."""
 
+    __slots__ = ()
+
     scope_lookup = LocalsDictNodeNG._scope_lookup
 
     generators: list[nodes.Comprehension]
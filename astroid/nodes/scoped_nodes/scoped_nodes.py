@@ -14,17 +14,19 @@ import io
 import itertools
 import os
 import sys
+import threading
 from collections.abc import Generator, Iterable, Iterator, Sequence
-from functools import cached_property, lru_cache
-from typing import TYPE_CHECKING, ClassVar, Literal, NoReturn
+from typing import IO, TYPE_CHECKING, Any, ClassVar, Literal, NoReturn
 
 from astroid import bases, protocols, util
+from astroid.class_cache import _CLASS_CACHE
 from astroid.context import (
     CallContext,
     InferenceContext,
     bind_context_to_node,
     copy_context,
 )
+from astroid.decorators import cached_property
 from astroid.exceptions import (
     AstroidBuildingError,
     AstroidTypeError,
@@ -40,6 +42,7 @@ from astroid.exceptions import (
 from astroid.interpreter.dunder_lookup import lookup
 from astroid.interpreter.objectmodel import ClassModel, FunctionModel, ModuleModel
 from astroid.manager import AstroidManager
+from astroid.memo import memoize
 from astroid.nodes import _base_nodes, node_classes
 from astroid.nodes.scoped_nodes.mixin import ComprehensionScope, LocalsDictNodeNG
 from astroid.nodes.scoped_nodes.utils import builtin_lookup
@@ -60,10 +63,21 @@ if TYPE_CHECKING:
     from astroid import nodes, objects
     from astroid.nodes import Arguments, Const, NodeNG
     from astroid.nodes._base_nodes import LookupMixIn
+    from astroid.rebuilder import _LazyBody
 
 
 ITER_METHODS = ("__iter__", "__getitem__")
 EXCEPTION_BASE_CLASSES = frozenset({"Exception", "BaseException"})
+
+
+class _AttributeTablesInProgress(threading.local):
+    """The attribute tables being built by the current thread."""
+
+    def __init__(self) -> None:
+        self.tables: set[tuple[ClassDef, str]] = set()
+
+
+_ATTRIBUTE_TABLES_IN_PROGRESS = _AttributeTablesInProgress()
 BUILTIN_DESCRIPTORS = frozenset(
     {"classmethod", "staticmethod", "builtins.classmethod", "builtins.staticmethod"}
 )
@@ -194,6 +208,19 @@ class Module(LocalsDictNodeNG):
     <Module l.0 at 0x...>
     """
 
+    __slots__ = (
+        "body",
+        "doc_node",
+        "file",
+        "future_imports",
+        "globals",
+        "locals",
+        "name",
+        "package",
+        "path",
+        "pure_python",
+    )
+
     _astroid_fields = ("doc_node", "body")
 
     doc_node: Const | None
@@ -296,6 +323,18 @@ class Module(LocalsDictNodeNG):
         """
         return self._get_stream()
 
+    def dump(self, fp: IO[bytes]) -> None:
+        """Serialize this module to the binary file *fp*.
+
+        The module can be loaded back with :func:`astroid.nodes.load`.
+
+        :raises TypeError: If the tree holds a value that cannot be serialized.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from astroid.nodes.serialization import dump
+
+        dump(self, fp)
+
     def block_range(self, lineno: int) -> tuple[int, int]:
         """Get a range from where this node starts to where this node ends.
 
@@ -449,16 +488,16 @@ class Module(LocalsDictNodeNG):
 
         :param use_cache: Whether to use the astroid_cache of modules.
 
-        :returns: The imported module ast.
+        :returns: The imported module ast, built by the manager which built this
+            module.
         """
         if relative_only and level is None:
             level = 0
         absmodname = self.relative_to_absolute_name(modname, level)
+        manager = AstroidManager.owner_of(self)
 
         try:
-            return AstroidManager().ast_from_module_name(
-                absmodname, use_cache=use_cache
-            )
+            return manager.ast_from_module_name(absmodname, use_cache=use_cache)
         except AstroidBuildingError:
             # we only want to import a sub module or package of this module,
             # skip here
@@ -468,7 +507,7 @@ class Module(LocalsDictNodeNG):
             # like "_winapi" or "nt" on POSIX systems.
             if modname == absmodname:
                 raise
-        return AstroidManager().ast_from_module_name(modname, use_cache=use_cache)
+        return manager.ast_from_module_name(modname, use_cache=use_cache)
 
     def relative_to_absolute_name(self, modname: str, level: int | None) -> str:
         """Get the absolute module name for a relative import.
@@ -602,6 +641,8 @@ class Module(LocalsDictNodeNG):
 
 
 class __SyntheticRoot(Module):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("__astroid_synthetic", pure_python=False)
 
@@ -618,6 +659,8 @@ class GeneratorExp(ComprehensionScope):
     <GeneratorExp l.1 at 0x...>
     """
 
+    __slots__ = ("elt", "generators", "locals")
+
     _astroid_fields = ("elt", "generators")
     _other_other_fields = ("locals",)
     elt: NodeNG
@@ -673,6 +716,8 @@ class DictComp(ComprehensionScope):
     <DictComp l.1 at 0x...>
     """
 
+    __slots__ = ("generators", "key", "locals", "value")
+
     _astroid_fields = ("key", "value", "generators")
     _other_other_fields = ("locals",)
     key: NodeNG
@@ -733,6 +778,8 @@ class SetComp(ComprehensionScope):
     <SetComp l.1 at 0x...>
     """
 
+    __slots__ = ("elt", "generators", "locals")
+
     _astroid_fields = ("elt", "generators")
     _other_other_fields = ("locals",)
     elt: NodeNG
@@ -789,6 +836,8 @@ class ListComp(ComprehensionScope):
     <ListComp l.1 at 0x...>
     """
 
+    __slots__ = ("elt", "generators", "locals")
+
     _astroid_fields = ("elt", "generators")
     _other_other_fields = ("locals",)
 
@@ -883,6 +932,8 @@ class Lambda(_base_nodes.FilterStmtsBaseNode, LocalsDictNodeNG):
     <Lambda.<lambda> l.1 at 0x...>
     """
 
+    __slots__ = ("args", "body", "instance_attrs", "locals")
+
     _astroid_fields: ClassVar[tuple[str, ...]] = ("args", "body")
     _other_other_fields: ClassVar[tuple[str, ...]] = ("locals",)
     name = "<lambda>"
@@ -1078,6 +1129,16 @@ class FunctionDef(
     <FunctionDef.my_func l.2 at 0x...>
     """
 
+    __slots__ = (
+        "args",
+        "body",
+        "decorators",
+        "doc_node",
+        "instance_attrs",
+        "locals",
+        "type_params",
+    )
+
     _astroid_fields = (
         "decorators",
         "args",
@@ -1129,6 +1190,9 @@ class FunctionDef(
 
     name = "<functiondef>"
 
+    _lazy_body: _LazyBody | None = None
+    """The body left to build on first access, when functions are built lazily."""
+
     special_attributes = FunctionModel()
     """The names of special attributes that this function has."""
 
@@ -1213,6 +1277,28 @@ class FunctionDef(
         self.doc_node = doc_node
         self.type_params = type_params or []
 
+    def __getattr__(self, name: str) -> Any:
+        # Only called for the attributes which are not set, such as the body
+        # and the locals of a function built lazily.
+        if name in {"body", "locals"}:
+            lazy_body = self._lazy_body
+            if lazy_body is not None:
+                return lazy_body.get(self, name)
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def _assign_nodes_in_scope(self) -> list[nodes.Assign]:
+        # Visiting a body built lazily would build it.
+        if self._lazy_body is not None:
+            return []
+        return list(
+            itertools.chain.from_iterable(
+                child_node._assign_nodes_in_scope for child_node in self.body
+            )
+        )
+
     @cached_property
     def extra_decorators(self) -> list[node_classes.Call]:
         """The extra decorators that this function can have.
@@ -1715,6 +1801,19 @@ class AsyncFunctionDef(FunctionDef):
     <AsyncFor l.3 at 0x...>
     """
 
+    __slots__ = ()
+
+
+def _attribute_counts(ancestors: Iterable[ClassDef], kind: str) -> tuple[int, ...]:
+    """Count the attributes of each ancestor an attribute table of *kind* is built from.
+
+    The table is still valid as long as the counts are the same: the classes
+    losing an attribute drop the tables depending on them instead.
+    """
+    if kind == "instance_attributes":
+        return tuple(len(ancestor.instance_attrs) for ancestor in ancestors)
+    return tuple(len(ancestor.locals) for ancestor in ancestors)
+
 
 def _is_metaclass(
     klass: ClassDef,
@@ -1824,6 +1923,18 @@ class ClassDef(
     <ClassDef.Thing l.2 at 0x...>
     """
 
+    __slots__ = (
+        "bases",
+        "body",
+        "doc_node",
+        "instance_attrs",
+        "is_dataclass",
+        "keywords",
+        "locals",
+        "name",
+        "type_params",
+    )
+
     # some of the attributes below are set by the builder module or
     # by a raw factories
 
@@ -2185,11 +2296,26 @@ class ClassDef(
 
         :returns: The base classes
         """
+        if context is not None:
+            # Only the ancestors found without a context are cached, as the path
+            # of a context can prevent some bases from being inferred.
+            yield from self._infer_ancestors(recurs, context)
+            return
+        kind = "ancestors" if recurs else "parents"
+        cached = _CLASS_CACHE.get(self, kind)
+        if cached is not None:
+            yield from cached
+            return
+        ancestors = tuple(self._infer_ancestors(recurs, InferenceContext()))
+        _CLASS_CACHE.set(self, kind, ancestors, ancestors)
+        yield from ancestors
+
+    def _infer_ancestors(
+        self, recurs: bool, context: InferenceContext
+    ) -> Generator[ClassDef]:
         # FIXME: should be possible to choose the resolution order
         # FIXME: inference make infinite loops possible here
         yielded = {self}
-        if context is None:
-            context = InferenceContext()
         if not self.bases and self.qname() != "builtins.object":
             # This should always be a ClassDef (which we don't assert for)
             yield builtin_lookup("object")[1][0]  # type: ignore[misc]
@@ -2234,10 +2360,17 @@ class ClassDef(
         # Look up in the mro if we can. This will result in the
         # attribute being looked up just as Python does it.
         try:
-            ancestors: Iterable[ClassDef] = self.mro(context)[1:]
+            table = self._attribute_table("mro_attributes")
         except MroError:
             # Fallback to use ancestors, we can't determine
             # a sane MRO.
+            table = self._attribute_table("attributes")
+        if table is not None:
+            yield from table.get(name, ())
+            return
+        try:
+            ancestors: Iterable[ClassDef] = self.mro(context)[1:]
+        except MroError:
             ancestors = self.ancestors(context=context)
         for astroid in ancestors:
             if name in astroid:
@@ -2253,10 +2386,63 @@ class ClassDef(
             an instance attribute.
         :rtype: Iterator[NodeNG]
         """
+        table = self._attribute_table("instance_attributes")
+        if table is not None:
+            yield from table.get(name, ())
+            return
         for astroid in self.ancestors(context=context):
             if name in astroid.instance_attrs:
                 yield astroid
 
+    def _attribute_table(self, kind: str) -> dict[str, tuple[ClassDef, ...]] | None:
+        """Map each attribute name to the ancestors defining it, in resolution order.
+
+        The table of the ``"attributes"`` kind is built from the ``locals`` of the
+        ancestors, the one of the ``"mro_attributes"`` kind from the ``locals``
+        of the classes of the MRO, and the one of the ``"instance_attributes"``
+        kind from the ``instance_attrs`` of the ancestors. Each table is built
+        from the ancestors found without a context, and built again when the
+        number of attributes of one of them changed, e.g. when a brain added
+        some to a class while inferring it.
+
+        :returns: The table, or ``None`` while it is being built.
+        :raises MroError: If the MRO is needed but cannot be computed.
+        """
+        cached = _CLASS_CACHE.get(self, kind)
+        if cached is not None:
+            table, ancestors, sizes = cached
+            if sizes == _attribute_counts(ancestors, kind):
+                return table
+        in_progress = _ATTRIBUTE_TABLES_IN_PROGRESS.tables
+        if (self, kind) in in_progress:
+            # Looking up the bases needed an attribute of this class.
+            return None
+        in_progress.add((self, kind))
+        try:
+            if kind == "mro_attributes":
+                ancestors = self.mro()[1:]
+            else:
+                ancestors = list(self.ancestors())
+        finally:
+            in_progress.discard((self, kind))
+        defining: dict[str, list[ClassDef]] = {}
+        for ancestor in ancestors:
+            attributes = (
+                ancestor.instance_attrs
+                if kind == "instance_attributes"
+                else ancestor.locals
+            )
+            for name in attributes:
+                defining.setdefault(name, []).append(ancestor)
+        table = {name: tuple(classes) for name, classes in defining.items()}
+        _CLASS_CACHE.set(
+            self,
+            kind,
+            (table, tuple(ancestors), _attribute_counts(ancestors, kind)),
+            ancestors,
+        )
+        return table
+
     def has_base(self, node) -> bool:
         """Whether this class directly inherits from the given node.
 
@@ -2360,8 +2546,13 @@ class ClassDef(
 
         # don't modify the list in self.locals!
         values: list[InferenceResult] = list(self.locals.get(name, []))
-        for classnode in self.ancestors(recurs=True, context=context):
-            values += classnode.locals.get(name, [])
+        table = self._attribute_table("attributes")
+        if table is not None:
+            for classnode in table.get(name, ()):
+                values += classnode.locals.get(name, [])
+        else:
+            for classnode in self.ancestors(recurs=True, context=context):
+                values += classnode.locals.get(name, [])
 
         if name in self.special_attributes and class_context and not values:
             special_attr = self.special_attributes.lookup(name)
@@ -2386,9 +2577,18 @@ class ClassDef(
 
         return result
 
-    @lru_cache(maxsize=1024)  # noqa
     def _metaclass_lookup_attribute(self, name, context):
         """Search the given name in the implicit and the explicit metaclass."""
+        if context is None:
+            return self._memoized_metaclass_lookup_attribute(name)
+        # Not memoized, as the results would be kept for each context.
+        return self._search_metaclasses(name, context)
+
+    @memoize("metaclass_lookup_attribute")
+    def _memoized_metaclass_lookup_attribute(self, name):
+        return self._search_metaclasses(name, None)
+
+    def _search_metaclasses(self, name, context):
         attrs = set()
         implicit_meta = self.implicit_metaclass()
         context = copy_context(context)
@@ -2924,7 +3124,15 @@ class ClassDef(
         :raises DuplicateBasesError: Duplicate bases in the same class base
         :raises InconsistentMroError: A class' MRO is inconsistent
         """
-        return self._compute_mro(context=context)
+        if context is not None:
+            # Only the MRO computed without a context is cached, like the ancestors.
+            return self._compute_mro(context=context)
+        cached = _CLASS_CACHE.get(self, "mro")
+        if cached is not None:
+            return list(cached)
+        mro = self._compute_mro(context=context)
+        _CLASS_CACHE.set(self, "mro", tuple(mro), mro)
+        return mro
 
     def bool_value(self, context: InferenceContext | None = None) -> Literal[True]:
         """Determine the boolean value of this node.
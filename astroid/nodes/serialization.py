@@ -0,0 +1,763 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Binary serialization of astroid trees.
+
+A serialized tree is a short header followed by a :mod:`marshal` payload. The
+payload holds a table of every object reachable from the serialized values: each
+entry refers to its class and to a *shape*, the names of its attributes, shared
+by all the objects of the same class with the same attributes. Attribute values
+are stored as they are when :mod:`marshal` supports them, and as small tagged
+tuples otherwise, e.g. references to other entries of the table.
+
+Loading creates every object of the table first and then fills their attributes,
+so parent links and ``locals`` are restored without rebuilding anything.
+
+Nodes of other modules found in the manager's cache are stored as a path from
+their module, along with a fingerprint of its source, and resolved through the
+manager when loading. Inference tips are stored by the inference function they
+wrap.
+
+.. warning::
+
+    Like :mod:`pickle`, loading imports the classes named in the data. Only
+    load data you trust.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import enum
+import functools
+import gc
+import hashlib
+import importlib
+import marshal
+import os
+import sys
+import types
+from collections.abc import Iterable
+from typing import IO, TYPE_CHECKING, Any
+
+from astroid import util
+from astroid.__pkginfo__ import __version__
+from astroid.context import _tree_root
+from astroid.memo import MEMO_PREFIX
+from astroid.nodes.node_ng import NodeNG, _instance_dict, _slots
+from astroid.nodes.scoped_nodes import SYNTHETIC_ROOT, FunctionDef, Module
+
+if TYPE_CHECKING:
+    from astroid.manager import AstroidManager
+    from astroid.typing import InferFn
+
+FORMAT_VERSION = 2
+"""Version of the serialization format, bumped on incompatible changes."""
+
+_MAGIC = b"ASTROID\x00"
+
+_NodePath = tuple[tuple[str, int], ...]
+
+_LOCALS_STEP = "locals."
+
+# Tags of the values marshal cannot store directly.
+_REF = 0
+_TUPLE = 1
+_SET = 2
+_FROZENSET = 3
+_FOREIGN_NODE = 4
+_UNINFERABLE = 5
+_SYNTHETIC_ROOT = 6
+_INFERENCE_TIP = 7
+_GLOBAL = 8
+_DICT = 9
+_TYPED_TUPLE = 10
+_ENUM = 11
+_WRAPPED_INFERENCE_TIP = 12
+_NOT_IMPLEMENTED = 13
+
+# Kinds of attribute values, see _Encoder._encode_attribute.
+_KIND_RAW = 0
+_KIND_REFERENCE = 1
+_KIND_REFERENCE_LIST = 2
+_KIND_REFERENCE_LISTS = 3
+_KIND_ENCODED = 4
+
+_MARSHALLABLE = frozenset(
+    {type(None), bool, int, float, complex, str, bytes, type(Ellipsis)}
+)
+
+
+class _UnaddressableNode(Exception):
+    """Raised when a node of another module cannot be referenced by path."""
+
+
+def _describe_callable(obj: Any, depth: int = 0) -> str:
+    """Get a description of a transform or predicate stable across processes."""
+    if obj is None or isinstance(obj, (str, int, float)):
+        return repr(obj)
+    if depth > 4:
+        return type(obj).__qualname__
+    if isinstance(obj, functools.partial):
+        args = [_describe_callable(arg, depth + 1) for arg in obj.args]
+        args += [
+            f"{key}={_describe_callable(value, depth + 1)}"
+            for key, value in obj.keywords.items()
+        ]
+        return f"partial({_describe_callable(obj.func, depth + 1)}, {', '.join(args)})"
+    if isinstance(obj, dict):
+        items = sorted(
+            f"{_describe_callable(key, depth + 1)}: {_describe_callable(value, depth + 1)}"
+            for key, value in obj.items()
+        )
+        return f"{{{', '.join(items)}}}"
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        items = [_describe_callable(item, depth + 1) for item in obj]
+        if isinstance(obj, (set, frozenset)):
+            items.sort()
+        return f"{type(obj).__name__}({', '.join(items)})"
+    qualname = getattr(obj, "__qualname__", None)
+    if qualname is None:
+        return type(obj).__qualname__
+    description = f"{getattr(obj, '__module__', '')}.{qualname}"
+    if isinstance(obj, types.FunctionType):
+        # Closures such as the one returned by ``inference_tip`` only differ
+        # by the values they close over or take as default argument.
+        captured = [*(obj.__defaults__ or ())]
+        for cell in obj.__closure__ or ():
+            with contextlib.suppress(ValueError):
+                captured.append(cell.cell_contents)
+        if captured:
+            described = ", ".join(
+                _describe_callable(value, depth + 1) for value in captured
+            )
+            description += f"[{described}]"
+    return description
+
+
+def _registered_inference_tips(
+    manager: AstroidManager,
+) -> dict[str, InferFn[Any] | None]:
+    """Map the description of each registered inference tip to its function.
+
+    Descriptions shared by different functions map to ``None``.
+    """
+    tips: dict[str, InferFn[Any] | None] = {}
+    for transforms in manager._transform.transforms.values():
+        for transform, _ in transforms:
+            infer_function = getattr(transform, "_inference_tip_function", None)
+            if infer_function is None:
+                continue
+            description = _describe_callable(infer_function)
+            if tips.setdefault(description, infer_function) is not infer_function:
+                tips[description] = None
+    return tips
+
+
+def _node_path(node: NodeNG) -> _NodePath:
+    """Get the path of fields and indexes leading from the root to the node.
+
+    Nodes only found in the locals of their parent, like the methods brains
+    add to classes, are reached through a ``locals.<name>`` step.
+    """
+    path: list[tuple[str, int]] = []
+    while node.parent is not None:
+        parent = node.parent
+        for field in parent._astroid_fields:
+            value = getattr(parent, field)
+            if value is node:
+                path.append((field, -1))
+                break
+            if isinstance(value, (list, tuple)):
+                index = next(
+                    (index for index, child in enumerate(value) if child is node), None
+                )
+                if index is not None:
+                    path.append((field, index))
+                    break
+        else:
+            name = getattr(node, "name", None)
+            values = getattr(parent, "locals", {}).get(name, ())
+            index = next(
+                (index for index, value in enumerate(values) if value is node), None
+            )
+            if index is None:
+                raise _UnaddressableNode(node)
+            path.append((_LOCALS_STEP + name, index))
+        node = parent
+    path.reverse()
+    return tuple(path)
+
+
+def _follow_path(root: Module, path: _NodePath) -> NodeNG:
+    node: NodeNG = root
+    for field, index in path:
+        if field.startswith(_LOCALS_STEP):
+            node = node.locals[field[len(_LOCALS_STEP) :]][index]
+            continue
+        value = getattr(node, field)
+        node = value if index == -1 else value[index]
+    return node
+
+
+def _source_fingerprint(module: Module) -> str | tuple[int, int] | None:
+    """Get a fingerprint of the source of *module*, which changes along with it.
+
+    It is the digest of the source of modules built from a string, and the
+    modification time and size of the file of the others. ``None`` for modules
+    without a source, like the ones built from living objects.
+    """
+    if module.file_bytes is not None:
+        source = module.file_bytes
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+        return hashlib.sha256(source).hexdigest()
+    if module.file:
+        try:
+            stat = os.stat(module.file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    return None
+
+
+def _import_global(module: str, qualname: str) -> Any:
+    obj: Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _global_name(obj: Any) -> tuple[str, str]:
+    """Get the module and qualified name under which *obj* can be imported."""
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if module is None or qualname is None or "<locals>" in qualname:
+        raise TypeError(f"Cannot serialize {obj!r}: it cannot be imported")
+    try:
+        found = _import_global(module, qualname)
+    except (ImportError, AttributeError) as exc:
+        raise TypeError(f"Cannot serialize {obj!r}: it cannot be imported") from exc
+    if found is not obj:
+        raise TypeError(f"Cannot serialize {obj!r}: it cannot be imported")
+    return module, qualname
+
+
+def _is_reference(encoded: Any) -> bool:
+    return type(encoded) is tuple and encoded[0] == _REF
+
+
+def _object_state(obj: Any) -> dict[str, Any]:
+    slots = _slots(type(obj))
+    if not slots:
+        try:
+            return obj.__dict__
+        except AttributeError:
+            raise TypeError(f"Cannot serialize {obj!r}: it has no __dict__") from None
+    state = {}
+    for name, descriptor in slots.items():
+        try:
+            state[name] = descriptor.__get__(obj)
+        except AttributeError:
+            pass
+    state.update(_instance_dict(obj))
+    return state
+
+
+def _set_object_state(obj: Any, names: Iterable[str], values: Iterable[Any]) -> None:
+    slots = _slots(type(obj))
+    if not slots:
+        obj.__dict__.update(zip(names, values))
+        return
+    for name, value in zip(names, values):
+        descriptor = slots.get(name)
+        if descriptor is None:
+            obj.__dict__[name] = value
+        else:
+            descriptor.__set__(obj, value)
+
+
+class _Encoder:
+    """Flatten values and the objects they reference into marshallable data."""
+
+    def __init__(
+        self,
+        manager: AstroidManager,
+        home: Module | None,
+        inference_tips: dict[str, InferFn[Any] | None],
+        shared_trees: bool = False,
+    ) -> None:
+        self._manager = manager
+        self._home = home
+        self._inference_tips = inference_tips
+        self._shared_trees = shared_trees
+        self._objects: list[Any] = []
+        self._object_index: dict[int, int] = {}
+        self._classes: list[tuple[str, str]] = []
+        self._class_index: dict[type, int] = {}
+        self._shapes: list[tuple[str, ...]] = []
+        self._shape_index: dict[tuple[str, ...], int] = {}
+        self._globals: dict[int, tuple[int, str, str]] = {}
+        self._fingerprints: dict[str, str | tuple[int, int] | None] = {}
+
+    def encode_values(self, values: tuple[Any, ...]) -> bytes:
+        encoded_values = tuple(self._encode(value) for value in values)
+        table = []
+        # The table grows while it is being encoded.
+        index = 0
+        while index < len(self._objects):
+            obj = self._objects[index]
+            if isinstance(obj, FunctionDef) and obj._lazy_body is not None:
+                obj._lazy_body.build(obj)
+            names = []
+            kinds = []
+            state = []
+            for name, value in _object_state(obj).items():
+                if name.startswith(MEMO_PREFIX):
+                    continue
+                kind, encoded = self._encode_attribute(value)
+                names.append(name)
+                kinds.append(kind)
+                state.append(encoded)
+            shape = (tuple(names), tuple(kinds))
+            shape_index = self._shape_index.get(shape)
+            if shape_index is None:
+                shape_index = self._shape_index[shape] = len(self._shapes)
+                self._shapes.append(shape)
+            table.append((self._class_of(obj), shape_index, state))
+            index += 1
+        payload = (
+            sys.version_info[:2],
+            __version__,
+            tuple(self._classes),
+            tuple(self._shapes),
+            table,
+            encoded_values,
+        )
+        return _MAGIC + bytes((FORMAT_VERSION,)) + marshal.dumps(payload)
+
+    def _encode_attribute(self, value: Any) -> tuple[int, Any]:
+        """Encode the value of an attribute, along with the kind of its encoding.
+
+        References to other objects of the table, and lists and dictionaries of
+        such references, are stored as indexes so that they can be resolved
+        without decoding every value.
+        """
+        encoded = self._encode(value)
+        encoded_type = type(encoded)
+        if encoded_type is tuple:
+            if encoded[0] == _REF:
+                return _KIND_REFERENCE, encoded[1]
+        elif encoded_type is list:
+            if encoded and all(_is_reference(item) for item in encoded):
+                return _KIND_REFERENCE_LIST, [item[1] for item in encoded]
+        elif encoded_type is dict:
+            if encoded and all(
+                type(item) is list and all(_is_reference(ref) for ref in item)
+                for item in encoded.values()
+            ):
+                return _KIND_REFERENCE_LISTS, {
+                    key: [ref[1] for ref in item] for key, item in encoded.items()
+                }
+        elif encoded_type in _MARSHALLABLE:
+            return _KIND_RAW, encoded
+        return _KIND_ENCODED, encoded
+
+    def _class_of(self, obj: Any) -> int:
+        cls = type(obj)
+        index = self._class_index.get(cls)
+        if index is None:
+            index = self._class_index[cls] = len(self._classes)
+            self._classes.append(_global_name(cls))
+        return index
+
+    def _reference(self, obj: Any) -> tuple[int, int]:
+        index = self._object_index.get(id(obj))
+        if index is None:
+            index = self._object_index[id(obj)] = len(self._objects)
+            self._objects.append(obj)
+        return (_REF, index)
+
+    def _encode(self, value: Any) -> Any:
+        # pylint: disable = too-many-return-statements
+        value_type = type(value)
+        if value_type in _MARSHALLABLE:
+            return value
+        if value_type is list:
+            return [self._encode(item) for item in value]
+        if value is util.Uninferable:
+            return (_UNINFERABLE,)
+        if value is SYNTHETIC_ROOT:
+            return (_SYNTHETIC_ROOT,)
+        if value is NotImplemented:
+            return (_NOT_IMPLEMENTED,)
+        if isinstance(value, NodeNG):
+            # Not root(), as nodes built by inference may be detached.
+            root = _tree_root(value)
+            if root is not self._home and root is not SYNTHETIC_ROOT:
+                if (
+                    isinstance(root, Module)
+                    and self._manager.astroid_cache.get(root.name) is root
+                ):
+                    try:
+                        path = _node_path(value)
+                    except _UnaddressableNode:
+                        if not self._shared_trees:
+                            raise
+                    else:
+                        if root.name not in self._fingerprints:
+                            self._fingerprints[root.name] = _source_fingerprint(root)
+                        return (
+                            _FOREIGN_NODE,
+                            root.name,
+                            tuple(field for step in path for field in step),
+                            value_type.__name__,
+                            self._fingerprints[root.name],
+                        )
+                elif self._shared_trees:
+                    raise _UnaddressableNode(value)
+            return self._reference(value)
+        if value_type is dict:
+            if all(type(key) is str for key in value):
+                return {key: self._encode(item) for key, item in value.items()}
+            return (
+                _DICT,
+                tuple((self._encode(k), self._encode(v)) for k, v in value.items()),
+            )
+        if value_type is tuple:
+            return (_TUPLE, *(self._encode(item) for item in value))
+        if value_type is set:
+            return (_SET, *(self._encode(item) for item in value))
+        if value_type is frozenset:
+            return (_FROZENSET, *(self._encode(item) for item in value))
+        if isinstance(value, tuple):
+            # Named tuples such as Position
+            return (
+                _TYPED_TUPLE,
+                self._encode_global(value_type),
+                tuple(self._encode(item) for item in value),
+            )
+        if isinstance(value, enum.Enum):
+            return (_ENUM, self._encode_global(value_type), value.name)
+        if isinstance(value, (type, types.BuiltinFunctionType)):
+            return self._encode_global(value)
+        if isinstance(value, (types.FunctionType, functools.partial)):
+            infer_function = getattr(value, "_inference_tip_function", None)
+            if infer_function is None:
+                return self._encode_global(value)
+            # Inference tips set by a registered transform are stored by
+            # description and taken from the same transform when loading.
+            description = _describe_callable(infer_function)
+            if self._inference_tips.get(description) is infer_function:
+                return (_INFERENCE_TIP, description)
+            return (_WRAPPED_INFERENCE_TIP, self._encode_global(infer_function))
+        return self._reference(value)
+
+    def _encode_global(self, obj: Any) -> tuple[int, str, str]:
+        encoded = self._globals.get(id(obj))
+        if encoded is None:
+            encoded = self._globals[id(obj)] = (_GLOBAL, *_global_name(obj))
+        return encoded
+
+
+class _Decoder:
+    def __init__(
+        self,
+        manager: AstroidManager,
+        inference_tips: dict[str, InferFn[Any] | None] | None,
+    ) -> None:
+        self._manager = manager
+        self._inference_tips = inference_tips
+        self._objects: list[Any] = []
+        self._modules: dict[str, Module] = {}
+
+    def decode_values(self, data: bytes) -> tuple[Any, ...]:
+        if data[: len(_MAGIC)] != _MAGIC:
+            raise ValueError("Not a serialized astroid tree")
+        if data[len(_MAGIC)] != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported serialization format version {data[len(_MAGIC)]}"
+            )
+        # Decoding only creates objects, collecting them would be wasted time.
+        # The references to other modules are resolved later, with the collector
+        # enabled, since resolving them may build these modules.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            payload = marshal.loads(data[len(_MAGIC) + 1 :])
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        python_version, astroid_version, classes, shapes, table, values = payload
+        if tuple(python_version) != sys.version_info[:2]:
+            raise ValueError(
+                "Tree serialized with Python {}.{}".format(*python_version)
+            )
+        if astroid_version != __version__:
+            raise ValueError(f"Tree serialized with astroid {astroid_version}")
+
+        resolved_classes = [_import_global(*name) for name in classes]
+        objects = self._objects = [
+            resolved_classes[class_index].__new__(resolved_classes[class_index])
+            for class_index, _, _ in table
+        ]
+        # For each shape, the indexes of the values of each kind but raw.
+        shape_kinds = [
+            (
+                names,
+                [i for i, kind in enumerate(kinds) if kind == _KIND_REFERENCE],
+                [i for i, kind in enumerate(kinds) if kind == _KIND_REFERENCE_LIST],
+                [i for i, kind in enumerate(kinds) if kind == _KIND_REFERENCE_LISTS],
+                [i for i, kind in enumerate(kinds) if kind == _KIND_ENCODED],
+            )
+            for names, kinds in shapes
+        ]
+        decode = self._decode
+        for obj, (_, shape_index, state) in zip(objects, table):
+            names, references, reference_lists, reference_dicts, encoded = shape_kinds[
+                shape_index
+            ]
+            for i in references:
+                state[i] = objects[state[i]]
+            for i in reference_lists:
+                state[i] = [objects[ref] for ref in state[i]]
+            for i in reference_dicts:
+                state[i] = {
+                    key: [objects[ref] for ref in refs]
+                    for key, refs in state[i].items()
+                }
+            for i in encoded:
+                state[i] = decode(state[i])
+            _set_object_state(obj, names, state)
+        return tuple(decode(value) for value in values)
+
+    def _decode(self, value: Any) -> Any:
+        # pylint: disable = too-many-return-statements
+        value_type = type(value)
+        if value_type is tuple:
+            tag = value[0]
+            if tag == _REF:
+                return self._objects[value[1]]
+            if tag == _TUPLE:
+                return tuple(map(self._decode, value[1:]))
+            if tag == _FOREIGN_NODE:
+                return self._decode_foreign_node(*value[1:])
+            if tag == _GLOBAL:
+                return _import_global(value[1], value[2])
+            if tag == _SET:
+                return set(map(self._decode, value[1:]))
+            if tag == _FROZENSET:
+                return frozenset(map(self._decode, value[1:]))
+            if tag == _UNINFERABLE:
+                return util.Uninferable
+            if tag == _SYNTHETIC_ROOT:
+                return SYNTHETIC_ROOT
+            if tag == _NOT_IMPLEMENTED:
+                return NotImplemented
+            if tag == _DICT:
+                return {self._decode(k): self._decode(v) for k, v in value[1]}
+            if tag == _TYPED_TUPLE:
+                return self._decode(value[1])(*map(self._decode, value[2]))
+            if tag == _ENUM:
+                return self._decode(value[1])[value[2]]
+            if tag == _INFERENCE_TIP:
+                return self._decode_inference_tip(value[1])
+            if tag == _WRAPPED_INFERENCE_TIP:
+                # pylint: disable-next=import-outside-toplevel
+                from astroid.inference_tip import _inference_tip_cached
+
+                return _inference_tip_cached(self._decode(value[1]))
+            raise ValueError(f"Unknown tag {tag}")
+        if value_type is list:
+            return list(map(self._decode, value))
+        if value_type is dict:
+            return {key: self._decode(item) for key, item in value.items()}
+        return value
+
+    def _decode_foreign_node(
+        self,
+        modname: str,
+        flat_path: tuple[Any, ...],
+        class_name: str,
+        fingerprint: str | tuple[int, int] | None,
+    ) -> NodeNG:
+        module = self._modules.get(modname)
+        if module is None:
+            module = self._manager.ast_from_module_name(modname)
+            if _source_fingerprint(module) != fingerprint:
+                raise ValueError(f"Module {modname} changed since it was serialized")
+            self._modules[modname] = module
+        path = tuple(zip(flat_path[::2], flat_path[1::2]))
+        node = _follow_path(module, path)
+        if type(node).__name__ != class_name:
+            raise ValueError(f"Module {modname} changed since it was serialized")
+        return node
+
+    def _decode_inference_tip(self, description: str) -> InferFn[Any]:
+        # pylint: disable-next=import-outside-toplevel
+        from astroid.inference_tip import _inference_tip_cached
+
+        if self._inference_tips is None:
+            self._inference_tips = _registered_inference_tips(self._manager)
+        infer_function = self._inference_tips.get(description)
+        if infer_function is None:
+            raise ValueError(f"Unknown inference tip {description}")
+        return _inference_tip_cached(infer_function)
+
+
+def _default_manager() -> AstroidManager:
+    # pylint: disable-next=import-outside-toplevel
+    from astroid.manager import AstroidManager
+
+    return AstroidManager()
+
+
+def _dumps(
+    values: Iterable[Any],
+    *,
+    home: Module | None = None,
+    manager: AstroidManager | None = None,
+    inference_tips: dict[str, InferFn[Any] | None] | None = None,
+    shared_trees: bool = False,
+) -> bytes:
+    """Serialize *values* together with every object they reference.
+
+    Nodes of *home* are stored by value, as well as nodes of modules that are not
+    in the cache of *manager*.
+
+    :param shared_trees: Whether the values are for a process sharing the trees
+        of this one, like a forked one. Nodes of cached modules which cannot be
+        reached from their module, such as the ones created by inference, are
+        stored by value then, while nodes of other modules cannot be stored.
+    :raises TypeError: If a value cannot be serialized.
+    """
+    manager = manager or _default_manager()
+    if inference_tips is None:
+        inference_tips = _registered_inference_tips(manager)
+    try:
+        return _Encoder(manager, home, inference_tips, shared_trees).encode_values(
+            tuple(values)
+        )
+    except _UnaddressableNode as exc:
+        raise TypeError(f"Cannot serialize a reference to {exc.args[0]!r}") from exc
+
+
+def _loads(
+    data: bytes,
+    *,
+    manager: AstroidManager | None = None,
+    inference_tips: dict[str, InferFn[Any] | None] | None = None,
+) -> tuple[Any, ...]:
+    """Load the values serialized by :func:`_dumps`.
+
+    :raises ValueError: If the data is invalid or was written by another version.
+    """
+    manager = manager or _default_manager()
+    try:
+        return _Decoder(manager, inference_tips).decode_values(data)
+    except (EOFError, TypeError, IndexError, KeyError, AttributeError) as exc:
+        # Paths to the nodes of modules which changed may not lead anywhere.
+        raise ValueError(f"Invalid serialized astroid tree: {exc}") from exc
+
+
+def _dumps_built_module(
+    module: Module,
+    *,
+    manager: AstroidManager,
+    inference_tips: dict[str, InferFn[Any] | None] | None = None,
+) -> bytes:
+    """Serialize a module built from source, to be loaded by :func:`_load_built_module`.
+
+    Building a module registers its attribute assignments as instance attributes
+    of the classes they are assigned to. The assignments to classes of other
+    modules are serialized too, so that they can be registered again.
+
+    :raises TypeError: If the tree holds a value that cannot be serialized.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from astroid.builder import _foreign_assignments
+
+    delayed_assattr = list(
+        dict.fromkeys(node for node, _ in _foreign_assignments(module))
+    )
+    return _dumps(
+        (module, delayed_assattr),
+        home=module,
+        manager=manager,
+        inference_tips=inference_tips,
+    )
+
+
+def _load_built_module(
+    data: bytes,
+    *,
+    manager: AstroidManager,
+    inference_tips: dict[str, InferFn[Any] | None] | None = None,
+) -> Module:
+    """Load a module serialized by :func:`_dumps_built_module` into the cache.
+
+    If a module of the same name was cached meanwhile, e.g. while resolving the
+    references of the data, that module is returned instead.
+
+    :raises ValueError: If the data is invalid or was written by another version.
+    """
+    module, delayed_assattr = _loads(
+        data, manager=manager, inference_tips=inference_tips
+    )
+    if not isinstance(module, Module):
+        raise ValueError("The data does not hold a module")
+    if (cached := manager.astroid_cache.get(module.name)) is not None:
+        return cached
+    # pylint: disable=import-outside-toplevel
+    from astroid.builder import AstroidBuilder
+    from astroid.import_graph import imported_module_names
+
+    manager.cache_module(module)
+    manager.import_graph.add_module(module.name, imported_module_names(module))
+
+    builder = AstroidBuilder(manager, apply_transforms=False)
+    for node in delayed_assattr:
+        builder.delayed_assattr(node)
+    return module
+
+
+def dumps(module: Module, *, manager: AstroidManager | None = None) -> bytes:
+    """Serialize *module* to bytes.
+
+    :raises TypeError: If the tree holds a value that cannot be serialized,
+        like a lambda set as inference function.
+    """
+    return _dumps((module,), home=module, manager=manager)
+
+
+def loads(data: bytes, *, manager: AstroidManager | None = None) -> Module:
+    """Load a module serialized by :func:`dumps`.
+
+    The module is not added to the cache of the manager, which is used to resolve
+    references to other modules.
+
+    :raises ValueError: If the data is invalid or was written by another version
+        of astroid or Python.
+    """
+    (module,) = _loads(data, manager=manager)
+    if not isinstance(module, Module):
+        raise ValueError("The data does not hold a module")
+    return module
+
+
+def dump(
+    module: Module, fp: IO[bytes], *, manager: AstroidManager | None = None
+) -> None:
+    """Serialize *module* to the binary file *fp*.
+
+    .. seealso:: :func:`dumps`
+    """
+    fp.write(dumps(module, manager=manager))
+
+
+def load(fp: IO[bytes], *, manager: AstroidManager | None = None) -> Module:
+    """Load a module serialized by :func:`dump` from the binary file *fp*.
+
+    .. seealso:: :func:`loads`
+    """
+    return loads(fp.read(), manager=manager)
@@ -15,11 +15,11 @@ from __future__ import annotations
 
 import sys
 from collections.abc import Generator, Iterator
-from functools import cached_property
 from typing import Literal, NoReturn
 
 from astroid import bases, util
 from astroid.context import InferenceContext
+from astroid.decorators import cached_property
 from astroid.exceptions import (
     AttributeInferenceError,
     InferenceError,
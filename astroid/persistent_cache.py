@@ -0,0 +1,512 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""On-disk cache of built modules.
+
+Building a module from source means parsing it, rebuilding the ``ast`` tree into
+astroid nodes and running every registered transform over the result. The
+persistent cache stores the resulting :class:`~astroid.nodes.Module` in a
+directory so that the next process can load it instead of building it again.
+
+Entries are keyed by the path of the source file and checked against its
+modification time, size and content hash, the Python and astroid versions, and
+a fingerprint of the registered transforms. An entry that does not match, or
+that cannot be read back, is ignored and rebuilt.
+
+The cache also holds a snapshot of the bootstrapped builtins module for the
+running interpreter, loaded instead of inspecting the live builtins again when
+they did not change.
+
+It also holds the modules that names resolved to, as found by
+:meth:`astroid.manager.AstroidManager.file_from_module_name`, and the names that
+could not be resolved. They are kept in a table for each search path, keyed by
+a fingerprint of the interpreter and of the modification times of the entries
+of the search path. Each resolution is also checked against the modification
+times of the directories it depends on: those of the context file, of the
+module found or of the package a submodule is missing from.
+
+The cache is opt-in, see :attr:`astroid.manager.AstroidManager.persistent_cache_dir`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import marshal
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from astroid import nodes
+from astroid.__pkginfo__ import __version__
+from astroid.interpreter._import import spec
+from astroid.interpreter._import.spec import _RACY_DELAY
+from astroid.nodes.serialization import (
+    _describe_callable,
+    _dumps_built_module,
+    _load_built_module,
+    _registered_inference_tips,
+)
+
+if TYPE_CHECKING:
+    from astroid.manager import AstroidManager
+    from astroid.typing import InferFn
+
+CACHE_FORMAT_VERSION = 2
+"""Version of the entry layout, bumped on incompatible changes."""
+
+_ENTRY_SUFFIX = ".astroid"
+
+_IMPORTS_PREFIX = "imports-"
+
+_UNSTORED_SPEC_TYPES = frozenset(
+    {spec.ModuleType.PY_NAMESPACE, spec.ModuleType.PY_ZIPMODULE}
+)
+"""Types of the specs found from the state of the process, which are not stored."""
+
+_ImportKey = tuple[str, str | None]
+_Dependencies = tuple[tuple[str, int], ...]
+
+
+def _mtime(path: str) -> int:
+    try:
+        return os.stat(path or os.curdir).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def search_path_fingerprint(search_path: Sequence[str] | None) -> str:
+    """Get a digest of the interpreter and of the state of the entries of
+    *search_path*, ``sys.path`` if ``None``.
+    """
+    parts = [
+        str(search_path is None),
+        str(CACHE_FORMAT_VERSION),
+        __version__,
+        sys.version,
+        sys.executable,
+        sys.implementation.cache_tag or "",
+    ]
+    parts.extend(
+        f"{os.path.abspath(entry)}:{_mtime(entry)}"
+        for entry in (sys.path if search_path is None else search_path)
+    )
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _is_racy(mtime: int) -> bool:
+    """Whether a directory changed too recently for its mtime to show a new change."""
+    return time.time_ns() - mtime < _RACY_DELAY
+
+
+def transforms_fingerprint(manager: AstroidManager) -> str:
+    """Get a digest of the transforms registered on the given manager.
+
+    The digest does not depend on the order in which the brains were registered.
+    """
+    entries = sorted(
+        f"{node_class.__qualname__}:{_describe_callable(transform)}"
+        f":{_describe_callable(predicate)}"
+        for node_class, transforms in manager._transform.transforms.items()
+        for transform, predicate in transforms
+    )
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+def _transforms_key(manager: AstroidManager) -> tuple[tuple[int, int, int], ...]:
+    """Get a cheap key identifying the registered transforms in this process."""
+    return tuple(
+        (id(node_class), id(transform), id(predicate))
+        for node_class, transforms in manager._transform.transforms.items()
+        for transform, predicate in transforms
+    )
+
+
+def _hash_file(path: str) -> str:
+    with open(path, "rb") as stream:
+        return hashlib.sha256(stream.read()).hexdigest()
+
+
+class PersistentModuleCache:
+    """A directory of modules built from source files, reused across processes."""
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = os.fspath(directory)
+        self.hits = 0
+        """Number of modules loaded from the cache."""
+        self.misses = 0
+        """Number of lookups that found no usable entry."""
+        self.import_hits = 0
+        """Number of module names resolved from the cache."""
+        self.import_misses = 0
+        """Number of module names that had no usable resolution in the cache."""
+        self._loading: set[str] = set()
+        self._lock = threading.Lock()
+        """Guards the counters of modules and the modules being loaded."""
+        self._import_tables: dict[
+            tuple[bool, tuple[str, ...]],
+            tuple[str | None, dict[_ImportKey, tuple[Any, _Dependencies]]],
+        ] = {}
+        self._imports_lock = threading.Lock()
+        self._transforms_key: tuple[tuple[int, int, int], ...] | None = None
+        self._transforms_fingerprint = ""
+        self._inference_tips: dict[str, InferFn[Any] | None] = {}
+
+    def _refresh_transforms(self, manager: AstroidManager) -> None:
+        """Describe the registered transforms again if they changed."""
+        key = _transforms_key(manager)
+        if key != self._transforms_key:
+            self._transforms_key = key
+            self._transforms_fingerprint = transforms_fingerprint(manager)
+            self._inference_tips = _registered_inference_tips(manager)
+
+    def _entry_path(self, path: str) -> str:
+        key = "\0".join((path, sys.implementation.cache_tag or "", __version__))
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + _ENTRY_SUFFIX)
+
+    def _header(
+        self, manager: AstroidManager, path: str, modname: str
+    ) -> dict[str, Any]:
+        stat = os.stat(path)
+        self._refresh_transforms(manager)
+        return {
+            "format": CACHE_FORMAT_VERSION,
+            "astroid": __version__,
+            "python": sys.version,
+            "path": path,
+            "modname": modname,
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "transforms": self._transforms_fingerprint,
+        }
+
+    def _is_fresh(
+        self, stored: dict[str, Any], current: dict[str, Any], path: str
+    ) -> bool:
+        """Check a stored header against the current state of the source file.
+
+        A file whose modification time changed but whose content is the same
+        (e.g. after a checkout) is still considered fresh.
+        """
+        if stored.get("content") is None:
+            return False
+        for key in ("format", "astroid", "python", "path", "modname", "transforms"):
+            if stored.get(key) != current[key]:
+                return False
+        if stored["mtime"] == current["mtime"] and stored["size"] == current["size"]:
+            return True
+        return stored["size"] == current["size"] and stored["content"] == _hash_file(
+            path
+        )
+
+    def load(
+        self, manager: AstroidManager, path: str, modname: str
+    ) -> nodes.Module | None:
+        """Load the module built from *path*, if a fresh entry exists.
+
+        The module is added to the manager's cache, and the instance
+        attributes it defines on classes of other modules are registered again.
+        """
+        path = os.path.abspath(path)
+        entry = self._entry_path(path)
+        with self._lock:
+            if modname in self._loading:
+                # The module is referenced by an entry it references itself.
+                return None
+            self._loading.add(modname)
+        try:
+            current = self._header(manager, path, modname)
+            with open(entry, "rb") as stream:
+                if not self._is_fresh(marshal.load(stream), current, path):
+                    self._count_miss()
+                    return None
+                data = stream.read()
+            module = _load_built_module(
+                data, manager=manager, inference_tips=self._inference_tips
+            )
+        except FileNotFoundError:
+            self._count_miss()
+            return None
+        except Exception:  # pylint: disable=broad-except
+            # Corrupt or unreadable entry: drop it so that it gets rebuilt.
+            self._count_miss()
+            with contextlib.suppress(OSError):
+                os.remove(entry)
+            return None
+        finally:
+            with self._lock:
+                self._loading.discard(modname)
+        with self._lock:
+            self.hits += 1
+        return module
+
+    def _count_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def store(self, manager: AstroidManager, module: nodes.Module) -> bool:
+        """Write *module*, built from its source file, to the cache.
+
+        Modules holding values that cannot be stored, like lambdas set as
+        inference functions, are skipped.
+
+        :returns: Whether the module was stored.
+        """
+        if module.file is None:
+            return False
+        try:
+            header = self._header(manager, module.file, module.name)
+            header["content"] = _hash_file(module.file)
+            data = _dumps_built_module(
+                module, manager=manager, inference_tips=self._inference_tips
+            )
+        except (OSError, TypeError, ValueError, RecursionError):
+            # ValueError is raised by marshal for too deeply nested values.
+            return False
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with self._atomic_write(self._entry_path(module.file)) as stream:
+                marshal.dump(header, stream)
+                stream.write(data)
+        except OSError:
+            return False
+        return True
+
+    def _builtins_path(self) -> str:
+        return os.path.join(
+            self.directory,
+            f"builtins-{sys.implementation.cache_tag}-{__version__}{_ENTRY_SUFFIX}",
+        )
+
+    def _builtins_header(self, fingerprint: str) -> dict[str, Any]:
+        return {
+            "format": CACHE_FORMAT_VERSION,
+            "astroid": __version__,
+            "python": sys.version,
+            "builtins": fingerprint,
+        }
+
+    def load_builtins(self, fingerprint: str) -> bytes | None:
+        """Get the snapshot of the builtins module, if it was taken for *fingerprint*.
+
+        The fingerprint describes the live builtins the snapshot was built from,
+        see :func:`astroid.raw_building._builtins_fingerprint`.
+        """
+        try:
+            with open(self._builtins_path(), "rb") as stream:
+                if marshal.load(stream) != self._builtins_header(fingerprint):
+                    return None
+                return stream.read()
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    def store_builtins(self, fingerprint: str, data: bytes) -> bool:
+        """Write the snapshot of the builtins module taken for *fingerprint*.
+
+        :returns: Whether the snapshot was stored.
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with self._atomic_write(self._builtins_path()) as stream:
+                marshal.dump(self._builtins_header(fingerprint), stream)
+                stream.write(data)
+        except OSError:
+            return False
+        return True
+
+    def _import_table(
+        self, search_path: Sequence[str] | None
+    ) -> tuple[str | None, dict[_ImportKey, tuple[Any, _Dependencies]]]:
+        """Get the path and the entries of the table of *search_path*.
+
+        The table is read once. Its path is ``None`` if an entry of the search
+        path changed too recently to tell whether it changes again.
+        """
+        entries_path = tuple(sys.path if search_path is None else search_path)
+        key = (search_path is None, entries_path)
+        table = self._import_tables.get(key)
+        if table is not None:
+            return table
+        path: str | None = os.path.join(
+            self.directory,
+            _IMPORTS_PREFIX + search_path_fingerprint(search_path) + _ENTRY_SUFFIX,
+        )
+        if any(_is_racy(_mtime(entry)) for entry in entries_path):
+            path = None
+        entries: dict[_ImportKey, tuple[Any, _Dependencies]] = {}
+        if path is not None:
+            try:
+                with open(path, "rb") as stream:
+                    while True:
+                        modname, context, value, dependencies = marshal.load(stream)
+                        entries[modname, context] = (value, dependencies)
+            except (OSError, EOFError, ValueError, TypeError):
+                # Missing table, or end of the table, whose last entry may
+                # be cut short if a process was writing it.
+                pass
+        table = self._import_tables[key] = (path, entries)
+        return table
+
+    def load_import(
+        self,
+        search_path: Sequence[str] | None,
+        modname: str,
+        context_file: str | None,
+    ) -> spec.ModuleSpec | ImportError | None:
+        """Get what *modname* resolved to from *context_file*, if a fresh entry
+        exists.
+
+        *search_path* is the path the module was searched in, ``sys.path`` if
+        ``None``.
+
+        :returns: The spec of the module, the error raised if it could not be
+            found, or ``None`` without a fresh entry.
+        """
+        key = (modname, _context_directory(context_file))
+        with self._imports_lock:
+            _, entries = self._import_table(search_path)
+            entry = entries.get(key)
+        if entry is None or any(
+            _mtime(directory) != mtime for directory, mtime in entry[1]
+        ):
+            with self._imports_lock:
+                self.import_misses += 1
+            return None
+        with self._imports_lock:
+            self.import_hits += 1
+        value = entry[0]
+        if isinstance(value, str):
+            return ImportError(value)
+        name, module_type, location, origin, search_locations = value
+        return spec.ModuleSpec(
+            name,
+            spec.ModuleType[module_type] if module_type is not None else None,
+            location,
+            origin,
+            list(search_locations) if search_locations is not None else None,
+        )
+
+    def store_import(
+        self,
+        search_path: Sequence[str] | None,
+        modname: str,
+        context_file: str | None,
+        found: spec.ModuleSpec | ImportError,
+    ) -> bool:
+        """Write what *modname* resolved to from *context_file* to the cache.
+
+        Specs of namespace packages and of modules in zip files depend on the
+        state of the process and are not stored, nor are resolutions depending
+        on directories which changed too recently.
+
+        :returns: Whether the resolution was stored.
+        """
+        context = _context_directory(context_file)
+        if isinstance(found, ImportError):
+            value: Any = str(found)
+            directories = _missing_module_directories(search_path, modname, context)
+        elif found.type in _UNSTORED_SPEC_TYPES:
+            return False
+        else:
+            value = (
+                found.name,
+                found.type.name if found.type is not None else None,
+                found.location,
+                found.origin,
+                (
+                    tuple(found.submodule_search_locations)
+                    if found.submodule_search_locations is not None
+                    else None
+                ),
+            )
+            directories = []
+            if found.location:
+                directories.append(os.path.dirname(os.path.abspath(found.location)))
+        if context is not None:
+            directories.append(context)
+        dependencies = tuple(
+            (directory, _mtime(directory)) for directory in directories
+        )
+        if any(_is_racy(mtime) for _, mtime in dependencies):
+            return False
+        with self._imports_lock:
+            path, entries = self._import_table(search_path)
+            if path is None:
+                return False
+            entries[modname, context] = (value, dependencies)
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(path, "ab") as stream:
+                    stream.write(marshal.dumps((modname, context, value, dependencies)))
+            except (OSError, ValueError):
+                return False
+        return True
+
+    def forget_imports(self) -> None:
+        """Read the tables of resolved module names again on their next use."""
+        with self._imports_lock:
+            self._import_tables.clear()
+
+    @contextlib.contextmanager
+    def _atomic_write(self, entry: str) -> Iterator[io.BufferedWriter]:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as stream:
+                yield stream
+            os.replace(tmp_path, entry)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        """Remove every entry from the cache directory."""
+        with contextlib.suppress(FileNotFoundError):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(_ENTRY_SUFFIX):
+                    with contextlib.suppress(OSError):
+                        os.remove(entry.path)
+
+
+def _context_directory(context_file: str | None) -> str | None:
+    if context_file is None:
+        return None
+    return os.path.dirname(os.path.abspath(context_file))
+
+
+def _missing_module_directories(
+    search_path: Sequence[str] | None, modname: str, context: str | None
+) -> list[str]:
+    """Get the directories where the missing module *modname* would appear.
+
+    For a submodule, this is the directory of the closest package it is
+    missing from. The entries of the search path are part of the fingerprint.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from astroid.modutils import file_info_from_modpath
+
+    parts = modname.split(".")
+    for index in range(len(parts) - 1, 0, -1):
+        try:
+            parent = file_info_from_modpath(
+                parts[:index],
+                path=search_path,
+                context_file=(
+                    os.path.join(context, "__init__.py") if context else None
+                ),
+            )
+        except ImportError:
+            continue
+        if parent.type == spec.ModuleType.PKG_DIRECTORY and parent.location:
+            return [os.path.abspath(parent.location)]
+        if parent.location:
+            return [os.path.dirname(os.path.abspath(parent.location))]
+        return []
+    return []
@@ -0,0 +1,304 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Opt-in instrumentation of the inference, to find out where its time goes.
+
+While profiling is enabled, the entry points of the inference, of the transforms
+and of the building of modules are replaced by timed wrappers, which are removed
+afterwards: profiling costs nothing when it is not enabled.
+
+.. sourcecode:: python
+
+    with astroid.profiling.profile() as stats:
+        list(node.infer())
+    print(stats.report())
+
+Times are wall clock times in seconds. The self time of an entry excludes the
+time spent in the other timed calls it makes. The cumulative time includes it,
+but only counts the outermost of recursive calls with the same entry.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import time
+from collections.abc import Callable, Generator, Iterator, Sequence
+from typing import Any
+
+from astroid import bases
+from astroid.context import InferenceCache, InferenceContext, _InferenceCacheKey
+from astroid.manager import AstroidManager
+from astroid.nodes import NodeNG, node_classes
+from astroid.transforms import TransformVisitor
+from astroid.typing import InferenceResult
+
+NODE = "node"
+"""Kind of the entries timing :meth:`NodeNG.infer`, by node class."""
+INFERENCE_TIP = "inference tip"
+"""Kind of the entries timing the inference tips, by inference function."""
+STATEMENTS = "statements"
+"""Kind of the entries timing the inference of statements, by frame class."""
+TRANSFORM = "transform"
+"""Kind of the entries timing the transforms, by node class."""
+MODULE = "module"
+"""Kind of the entries timing :meth:`AstroidManager.ast_from_module_name`."""
+
+_KINDS = (NODE, INFERENCE_TIP, STATEMENTS, TRANSFORM, MODULE)
+
+_profile: Profile | None = None
+
+
+class Timing:
+    """The measures of one entry of a profile."""
+
+    __slots__ = (
+        "cache_hits",
+        "cache_misses",
+        "calls",
+        "cumulative_time",
+        "max_depth",
+        "self_time",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cumulative_time = 0.0
+        self.self_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.max_depth = 0
+        """Longest inference path seen, see :attr:`InferenceContext.path`."""
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Share of the cache lookups which were hits, ``None`` without lookups."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else None
+
+    def __repr__(self) -> str:
+        return (
+            f"<Timing of {self.calls} calls, {self.cumulative_time:.6f}s "
+            f"cumulative, {self.self_time:.6f}s self>"
+        )
+
+
+class Profile:
+    """The timings collected by :func:`profile`, by kind and name."""
+
+    def __init__(self) -> None:
+        self.timings: dict[tuple[str, str], Timing] = {}
+        self.duration = 0.0
+        """Time spent with profiling enabled."""
+        self._stack: list[float] = []
+        self._active: collections.Counter[tuple[str, str]] = collections.Counter()
+
+    def timing(self, kind: str, name: str) -> Timing:
+        """Get the timing of an entry, created empty if needed."""
+        try:
+            return self.timings[kind, name]
+        except KeyError:
+            timing = self.timings[kind, name] = Timing()
+            return timing
+
+    def by_kind(self, kind: str) -> dict[str, Timing]:
+        """Get the timings of the given kind, by name."""
+        return {
+            name: timing
+            for (entry_kind, name), timing in self.timings.items()
+            if entry_kind == kind
+        }
+
+    def _start(self, key: tuple[str, str]) -> float:
+        self._stack.append(0.0)
+        self._active[key] += 1
+        return time.perf_counter()
+
+    def _stop(self, key: tuple[str, str], timing: Timing, start: float) -> None:
+        elapsed = time.perf_counter() - start
+        timing.self_time += elapsed - self._stack.pop()
+        self._active[key] -= 1
+        if not self._active[key]:
+            timing.cumulative_time += elapsed
+        if self._stack:
+            self._stack[-1] += elapsed
+
+    def _time_call(
+        self, kind: str, name: str, function: Callable[..., Any], *args: Any
+    ) -> Any:
+        key = (kind, name)
+        timing = self.timing(kind, name)
+        timing.calls += 1
+        start = self._start(key)
+        try:
+            return function(*args)
+        finally:
+            self._stop(key, timing, start)
+
+    def _time_generator(
+        self, kind: str, name: str, generator: Generator[InferenceResult]
+    ) -> Generator[InferenceResult]:
+        key = (kind, name)
+        timing = self.timing(kind, name)
+        try:
+            while True:
+                start = self._start(key)
+                try:
+                    value = next(generator)
+                except StopIteration:
+                    return
+                finally:
+                    self._stop(key, timing, start)
+                yield value
+        finally:
+            # Closes the wrapped generator right away when inference stops early.
+            generator.close()
+
+    def report(self, limit: int | None = 20, sort: str = "self_time") -> str:
+        """Format the timings as tables, one per kind.
+
+        :param limit: The maximum number of entries of each table.
+        :param sort: The attribute of :class:`Timing` ordering the entries,
+            in decreasing order.
+        """
+        lines = [f"Profiled {self.duration:.3f}s"]
+        for kind in _KINDS:
+            timings = sorted(
+                self.by_kind(kind).items(),
+                key=lambda item: getattr(item[1], sort),
+                reverse=True,
+            )
+            if not timings:
+                continue
+            lines += [
+                "",
+                f"By {kind}:",
+                f"{'calls':>9} {'cumulative':>11} {'self':>9} {'hits':>6} "
+                f"{'depth':>6}  name",
+            ]
+            for name, timing in timings[:limit]:
+                hit_rate = timing.hit_rate
+                hits = "" if hit_rate is None else f"{hit_rate:.0%}"
+                lines.append(
+                    f"{timing.calls:>9} {timing.cumulative_time:>11.4f} "
+                    f"{timing.self_time:>9.4f} {hits:>6} "
+                    f"{timing.max_depth or '':>6}  {name}"
+                )
+            if limit is not None and len(timings) > limit:
+                lines.append(f"{'':>9} ... {len(timings) - limit} more")
+        return "\n".join(lines)
+
+
+def _function_name(function: Callable[..., Any]) -> str:
+    function = getattr(function, "_inference_tip_function", function)
+    module = getattr(function, "__module__", None)
+    qualname = getattr(function, "__qualname__", repr(function))
+    return f"{module}.{qualname}" if module else qualname
+
+
+def _patches(
+    stats: Profile,
+) -> list[tuple[object, str, Callable[..., Any]]]:
+    """Get the timed replacements of the entry points, with their owners."""
+    infer = NodeNG.infer
+    get = InferenceCache.get
+    infer_stmts = bases._infer_stmts
+    transform = TransformVisitor._transform
+    ast_from_module_name = AstroidManager.ast_from_module_name
+
+    def timed_infer(
+        node: NodeNG, context: InferenceContext | None = None
+    ) -> Generator[InferenceResult]:
+        name = type(node).__name__
+        timing = stats.timing(NODE, name)
+        timing.calls += 1
+        results = infer(node, context)
+        if context is not None:
+            context = context.extra_context.get(node, context)
+            timing.max_depth = max(timing.max_depth, len(context.path))
+        if node._explicit_inference is not None:
+            tip = _function_name(node._explicit_inference)
+            stats.timing(INFERENCE_TIP, tip).calls += 1
+            results = stats._time_generator(INFERENCE_TIP, tip, results)
+        return stats._time_generator(NODE, name, results)
+
+    def counted_get(
+        cache: InferenceCache, key: _InferenceCacheKey
+    ) -> Sequence[InferenceResult] | None:
+        # The lookups of NodeNG.infer, counted by the class of the inferred node.
+        results = get(cache, key)
+        timing = stats.timing(NODE, type(key[0]).__name__)
+        if results is None:
+            timing.cache_misses += 1
+        else:
+            timing.cache_hits += 1
+        return results
+
+    def timed_infer_stmts(
+        stmts: Any, context: InferenceContext | None, frame: Any = None
+    ) -> Generator[InferenceResult]:
+        name = type(frame).__name__ if frame is not None else "-"
+        stats.timing(STATEMENTS, name).calls += 1
+        return stats._time_generator(
+            STATEMENTS, name, infer_stmts(stmts, context, frame)
+        )
+
+    def timed_transform(visitor: TransformVisitor, node: Any) -> Any:
+        return stats._time_call(
+            TRANSFORM, type(node).__name__, transform, visitor, node
+        )
+
+    def timed_ast_from_module_name(
+        manager: AstroidManager,
+        modname: str | None,
+        context_file: str | None = None,
+        use_cache: bool = True,
+    ) -> Any:
+        timing = stats.timing(MODULE, str(modname))
+        if use_cache and modname in manager.astroid_cache:
+            timing.cache_hits += 1
+        else:
+            timing.cache_misses += 1
+        return stats._time_call(
+            MODULE,
+            str(modname),
+            ast_from_module_name,
+            manager,
+            modname,
+            context_file,
+            use_cache,
+        )
+
+    return [
+        (NodeNG, "infer", timed_infer),
+        (InferenceCache, "get", counted_get),
+        (bases, "_infer_stmts", timed_infer_stmts),
+        (node_classes, "_infer_stmts", timed_infer_stmts),
+        (TransformVisitor, "_transform", timed_transform),
+        (AstroidManager, "ast_from_module_name", timed_ast_from_module_name),
+    ]
+
+
+@contextlib.contextmanager
+def profile() -> Iterator[Profile]:
+    """Profile the inference done in the body of the ``with`` statement.
+
+    :raises RuntimeError: If profiling is already enabled.
+    """
+    global _profile  # pylint: disable=global-statement
+    if _profile is not None:
+        raise RuntimeError("Profiling is already enabled.")
+    stats = _profile = Profile()
+    originals = []
+    for owner, attribute, replacement in _patches(stats):
+        originals.append((owner, attribute, owner.__dict__[attribute]))
+        setattr(owner, attribute, replacement)
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.duration = time.perf_counter() - start
+        for owner, attribute, original in originals:
+            setattr(owner, attribute, original)
+        _profile = None
@@ -9,6 +9,7 @@
 from __future__ import annotations
 
 import builtins
+import hashlib
 import inspect
 import io
 import os
@@ -25,6 +26,7 @@ from astroid.nodes import node_classes
 
 if TYPE_CHECKING:
     from astroid.manager import AstroidManager
+    from astroid.persistent_cache import PersistentModuleCache
 
 
 _FunctionTypes = (
@@ -614,17 +616,53 @@ def _set_proxied(const) -> nodes.ClassDef:
     return _CONST_PROXY[const.value.__class__]
 
 
-def _astroid_bootstrapping() -> None:
-    """astroid bootstrapping the builtins module"""
-    # this boot strapping is necessary since we need the Const nodes to
-    # inspect_build builtins, and then we can proxy Const
+def _set_const_proxies(proxies: Iterable[nodes.ClassDef]) -> None:
+    """Proxy the constants of each type of ``CONST_CLS`` to the given classes."""
+    for (cls, node_cls), proxy in zip(node_classes.CONST_CLS.items(), proxies):
+        if cls in (dict, list, set, tuple):
+            node_cls._proxied = proxy
+        else:
+            _CONST_PROXY[cls] = proxy
+
+    # Set the builtin module as parent for some builtins.
+    nodes.Const._proxied = property(_set_proxied)
+
+
+def _astroid_bootstrapping(snapshot_cache: PersistentModuleCache | None = None) -> None:
+    """astroid bootstrapping the builtins module
+
+    If *snapshot_cache* is given, the builtins module is loaded from the
+    snapshot it holds for this interpreter. Without a matching snapshot, the
+    module is built from the live builtins and a new snapshot is stored.
+    """
     # pylint: disable-next=import-outside-toplevel
     from astroid.manager import AstroidManager
 
-    builder = InspectBuilder(AstroidManager())
+    manager = AstroidManager()
+    if snapshot_cache is None or not _load_builtins_snapshot(manager, snapshot_cache):
+        builder = InspectBuilder(manager)
+        _inspect_builtins(builder)
+        if snapshot_cache is not None:
+            _store_builtins_snapshot(manager, builder, snapshot_cache)
+
+    InspectBuilder.bootstrapped = True
+
+    # pylint: disable-next=import-outside-toplevel
+    from astroid.brain.brain_builtin_inference import on_bootstrap
+
+    # Instantiates an AstroidBuilder(), which is where
+    # InspectBuilder.bootstrapped is checked, so place after bootstrapped=True.
+    on_bootstrap()
+
+
+def _inspect_builtins(builder: InspectBuilder) -> None:
+    """Build the builtins module from the live one."""
+    # this boot strapping is necessary since we need the Const nodes to
+    # inspect_build builtins, and then we can proxy Const
     astroid_builtin = builder.inspect_build(builtins)
 
-    for cls, node_cls in node_classes.CONST_CLS.items():
+    proxies = []
+    for cls in node_classes.CONST_CLS:
         if cls is TYPE_NONE:
             proxy = build_class("NoneType", astroid_builtin)
         elif cls is TYPE_NOTIMPLEMENTED:
@@ -634,13 +672,8 @@ def _astroid_bootstrapping() -> None:
         else:
             proxy = astroid_builtin.getattr(cls.__name__)[0]
             assert isinstance(proxy, nodes.ClassDef)
-        if cls in (dict, list, set, tuple):
-            node_cls._proxied = proxy
-        else:
-            _CONST_PROXY[cls] = proxy
-
-    # Set the builtin module as parent for some builtins.
-    nodes.Const._proxied = property(_set_proxied)
+        proxies.append(proxy)
+    _set_const_proxies(proxies)
 
     _GeneratorType = nodes.ClassDef(
         types.GeneratorType.__name__,
@@ -744,11 +777,166 @@ def _astroid_bootstrapping() -> None:
             builder.object_build(klass, _type)
             astroid_builtin[_type.__name__] = klass
 
-    InspectBuilder.bootstrapped = True
 
+# builtins snapshot ##########################################################
+
+_OWNER_MODULES = (builtins, types)
+"""Modules holding the live objects that the scopes of builtins are built from."""
+
+
+def _builtins_fingerprint() -> str:
+    """Get a digest of the names and types of the live builtins."""
+    entries = [
+        f"{name}:{type(getattr(builtins, name)).__qualname__}"
+        for name in sorted(dir(builtins))
+    ]
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+def _owner_name(owner: types.ModuleType | type) -> tuple[str, str] | None:
+    """Get the module and attribute under which a live object can be found.
+
+    The attribute is empty for modules.
+    """
+    for module in _OWNER_MODULES:
+        if owner is module:
+            return module.__name__, ""
+        for name, value in vars(module).items():
+            if value is owner:
+                return module.__name__, name
+    return None
+
+
+def _store_builtins_snapshot(
+    manager: AstroidManager, builder: InspectBuilder, cache: PersistentModuleCache
+) -> bool:
+    """Store a snapshot of the builtins module built by *builder*.
+
+    Empty nodes hold the live objects they were built from, which cannot be
+    serialized. They are stored as the attribute of the live object of their
+    scope, and looked up again when loading.
+
+    :returns: Whether the snapshot was stored.
+    """
     # pylint: disable-next=import-outside-toplevel
-    from astroid.brain.brain_builtin_inference import on_bootstrap
+    from astroid.nodes.serialization import _dumps
+
+    astroid_builtin = manager.builtins_module
+    live_scopes = {id(node): obj for obj, node in builder._done.items()}
+    owners: list[tuple[str, str]] = []
+    owner_indexes: dict[int, int] = {}
+    empty_nodes: dict[int, nodes.EmptyNode] = {}
+    live_members: list[tuple[nodes.EmptyNode, int, str]] = []
+    proxied = [
+        bases.Generator._proxied,
+        getattr(bases.AsyncGenerator, "_proxied", None),
+        getattr(bases.UnionType, "_proxied", None),
+    ]
+    # Some classes are only found in the locals of the module, not in its body,
+    # and the proxy of UnionType in neither.
+    scopes = [astroid_builtin, *(cls for cls in proxied if cls is not None)]
+    seen_scopes = {id(scope) for scope in scopes}
+    for scope in scopes:
+        for alias, local_nodes in scope.locals.items():
+            for node in local_nodes:
+                if isinstance(node, nodes.ClassDef) and id(node) not in seen_scopes:
+                    seen_scopes.add(id(node))
+                    scopes.append(node)
+                if not isinstance(node, nodes.EmptyNode) or id(node) in empty_nodes:
+                    continue
+                empty_nodes[id(node)] = node
+                if not node.has_underlying_object():
+                    continue
+                owner = live_scopes.get(id(scope))
+                if owner is None or alias not in dir(owner):
+                    return False
+                if id(owner) not in owner_indexes:
+                    owner_name = _owner_name(owner)
+                    if owner_name is None:
+                        return False
+                    owner_indexes[id(owner)] = len(owners)
+                    owners.append(owner_name)
+                live_members.append((node, owner_indexes[id(owner)], alias))
+
+    const_proxies = [
+        _CONST_PROXY.get(cls) or node_cls._proxied
+        for cls, node_cls in node_classes.CONST_CLS.items()
+    ]
+    dummies = [
+        node for node in empty_nodes.values() if node.object is _EMPTY_OBJECT_MARKER
+    ]
+    objects = [
+        (node, node.__dict__.pop("object"))
+        for node in empty_nodes.values()
+        if "object" in node.__dict__
+    ]
+    try:
+        data = _dumps(
+            (
+                astroid_builtin,
+                const_proxies,
+                *proxied,
+                dummies,
+                live_members,
+                owners,
+            ),
+            home=astroid_builtin,
+            manager=manager,
+            inference_tips={},
+        )
+    except (TypeError, ValueError, RecursionError):
+        return False
+    finally:
+        for node, obj in objects:
+            node.object = obj
+    return cache.store_builtins(_builtins_fingerprint(), data)
 
-    # Instantiates an AstroidBuilder(), which is where
-    # InspectBuilder.bootstrapped is checked, so place after bootstrapped=True.
-    on_bootstrap()
+
+def _load_builtins_snapshot(
+    manager: AstroidManager, cache: PersistentModuleCache
+) -> bool:
+    """Load the builtins module from its snapshot, if it matches the live builtins.
+
+    :returns: Whether the snapshot was loaded.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from astroid.nodes.serialization import _loads
+
+    data = cache.load_builtins(_builtins_fingerprint())
+    if data is None:
+        return False
+    try:
+        (
+            astroid_builtin,
+            const_proxies,
+            generator,
+            async_generator,
+            union_type,
+            dummies,
+            live_members,
+            owners,
+        ) = _loads(data, manager=manager, inference_tips={})
+        live_owners = [
+            sys.modules[modname] if not name else getattr(sys.modules[modname], name)
+            for modname, name in owners
+        ]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            members = [
+                getattr(live_owners[index], alias) for _, index, alias in live_members
+            ]
+    except Exception:  # pylint: disable=broad-except
+        return False
+
+    for node in dummies:
+        node.object = _EMPTY_OBJECT_MARKER
+    for (node, _, _), member in zip(live_members, members):
+        node.object = member
+    manager.cache_module(astroid_builtin)
+    _set_const_proxies(const_proxies)
+    bases.Generator._proxied = generator
+    if async_generator is not None:
+        bases.AsyncGenerator._proxied = async_generator
+    if union_type is not None:
+        bases.UnionType._proxied = union_type
+    return True
@@ -11,11 +11,12 @@ from __future__ import annotations
 import ast
 import itertools
 import sys
+import threading
 import token
 from collections.abc import Callable, Collection, Generator
 from io import StringIO
 from tokenize import TokenError, TokenInfo, generate_tokens
-from typing import TYPE_CHECKING, Final, TypeVar, cast, overload
+from typing import TYPE_CHECKING, Any, Final, TypeVar, cast, overload
 
 from astroid import nodes
 from astroid._ast import (
@@ -56,6 +57,113 @@ REDIRECT: Final[dict[str, str]] = {
 }
 
 
+def _has_effects_outside(statements: list[ast.stmt]) -> bool:
+    """Whether building *statements* registers anything outside of them.
+
+    ``global`` statements register names in the module, imports are recorded
+    in the import graph, and assignments to attributes may register attributes
+    of classes.
+    """
+    for statement in statements:
+        for node in ast.walk(statement):
+            if isinstance(node, (ast.Global, ast.Import, ast.ImportFrom)) or (
+                isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Store)
+            ):
+                return True
+    return False
+
+
+class _LazyBodies:
+    """The bodies of the functions of a module, built on first access."""
+
+    def __init__(self, rebuilder: TreeRebuilder) -> None:
+        self.rebuilder = rebuilder
+        self.transform: Callable[[nodes.NodeNG], nodes.NodeNG] | None = None
+        """The transforms of the module, once they started being applied."""
+        self.transforming = False
+        """Whether the transforms are being applied to the module, which leaves
+        out the bodies that are not built yet.
+        """
+        self._built_while_transforming: list[nodes.FunctionDef] = []
+
+    def start_transforms(
+        self, transform: Callable[[nodes.NodeNG], nodes.NodeNG]
+    ) -> None:
+        self.transform = transform
+        self.transforming = True
+
+    def finish_transforms(self) -> None:
+        self.transforming = False
+        for function in self._built_while_transforming:
+            del function._lazy_body
+        self._built_while_transforming.clear()
+
+
+class _LazyBody:
+    """The body of a function, left unbuilt until it is needed.
+
+    The statements are parsed again from the source of the function when it
+    is available, so that its ``ast`` subtree does not have to be kept.
+    """
+
+    __slots__ = ("bodies", "body", "builder", "locals", "span", "statements")
+
+    def __init__(
+        self,
+        bodies: _LazyBodies,
+        node: ast.FunctionDef | ast.AsyncFunctionDef,
+        function: nodes.FunctionDef,
+    ) -> None:
+        self.bodies = bodies
+        self.span = bodies.rebuilder._source_span(node)
+        self.statements = node.body if self.span is None else None
+        # Holds the arguments of the function until the body is built.
+        self.locals = function.locals
+        self.body: list[nodes.NodeNG] | None = None
+        self.builder: int | None = None
+        """The thread building the body, which alone sees it before it is done."""
+        del function.locals, function.body
+
+    def get(self, function: nodes.FunctionDef, name: str) -> Any:
+        """Get the body or the locals of *function*, building them if needed."""
+        if self.builder != threading.get_ident():
+            self.build(function)
+            return getattr(function, name)
+        return self.body if name == "body" else self.locals
+
+    def build(self, function: nodes.FunctionDef) -> None:
+        """Build the body and the locals of *function*, and transform them.
+
+        They are only set on *function* once transformed. Threads accessing them
+        meanwhile wait for the build to be over.
+        """
+        bodies = self.bodies
+        rebuilder = bodies.rebuilder
+        with rebuilder._manager._build_lock:
+            if self.statements is None and self.span is None:
+                return  # Built by another thread.
+            self.builder = threading.get_ident()
+            try:
+                statements = self.statements
+                if statements is None:
+                    assert self.span is not None
+                    statements = rebuilder._parse_body(*self.span)
+                self.body = body = rebuilder._visit_lazy_body(statements, function)
+                if bodies.transform is not None:
+                    for index, child in enumerate(body):
+                        body[index] = bodies.transform(child)
+            finally:
+                self.builder = None
+            function.locals = self.locals
+            function.body = body
+            self.statements = self.span = self.body = None
+            if bodies.transforming:
+                # Keeps the transforms of the module from visiting the body again.
+                bodies._built_while_transforming.append(function)
+            else:
+                del function._lazy_body
+
+
 # noinspection PyMethodMayBeStatic
 class TreeRebuilder:
     """Rebuilds the _ast tree to become an Astroid tree."""
@@ -64,12 +172,18 @@ class TreeRebuilder:
         self,
         manager: AstroidManager,
         data: str | None = None,
+        lazy_function_bodies: bool = False,
+        type_comments: bool = True,
     ) -> None:
         self._manager = manager
         self._data = data.split("\n") if data else None
+        self._type_comments = type_comments
+        """Whether the type comments of *data* were parsed."""
         self._global_names: list[dict[str, list[nodes.Global]]] = []
         self._import_from_nodes: list[tuple[nodes.ImportFrom, Collection[str]]] = []
+        self._import_nodes: list[nodes.Import] = []
         self._delayed_assattr: list[nodes.AssignAttr] = []
+        self._lazy_bodies = _LazyBodies(self) if lazy_function_bodies else None
         self._visit_meths: dict[
             type[ast.AST], Callable[[ast.AST, nodes.NodeNG], nodes.NodeNG]
         ] = {}
@@ -1195,9 +1309,10 @@ class TreeRebuilder:
         type_comment_annotation = self.check_function_type_comment(node, newnode)
         if type_comment_annotation:
             type_comment_returns, type_comment_args = type_comment_annotation
+        lazy = self._lazy_bodies is not None and not _has_effects_outside(node.body)
         newnode.postinit(
             args=self.visit(node.args, newnode),
-            body=[self.visit(child, newnode) for child in node.body],
+            body=[] if lazy else [self.visit(child, newnode) for child in node.body],
             decorators=decorators,
             returns=returns,
             type_comment_returns=type_comment_returns,
@@ -1211,9 +1326,59 @@ class TreeRebuilder:
             ),
         )
         self._global_names.pop()
+        if lazy:
+            assert self._lazy_bodies is not None
+            newnode._lazy_body = _LazyBody(self._lazy_bodies, node, newnode)
         parent.set_local(newnode.name, newnode)
         return newnode
 
+    def _source_span(
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef
+    ) -> tuple[int, int, int] | None:
+        """Return the lines and the column from which *node* can be parsed again.
+
+        ``None`` is returned when the source is not available, or when its lines
+        do not match the ones of the AST, e.g. when they end with a carriage return.
+        """
+        if not self._data or node.end_lineno is None:
+            return None
+        if node.end_lineno > len(self._data):
+            return None
+        line = self._data[node.lineno - 1]
+        if line[: node.col_offset].strip() or not line[node.col_offset :].startswith(
+            ("def", "async")
+        ):
+            return None
+        return node.lineno, node.end_lineno, node.col_offset
+
+    def _parse_body(
+        self, lineno: int, end_lineno: int, col_offset: int
+    ) -> list[ast.stmt]:
+        """Parse again the statements of the body of a function, without its
+        docstring, from its source lines, as the module was parsed.
+        """
+        assert self._data is not None
+        source = "\n".join(self._data[lineno - 1 : end_lineno]) + "\n"
+        if col_offset:
+            # An indented function is parsed as the body of a statement.
+            source = "if 1:\n" + source
+        module = ast.parse(source, type_comments=self._type_comments)
+        node = module.body[0]
+        if col_offset:
+            node = node.body[0]
+        ast.increment_lineno(node, lineno - node.lineno)
+        return self._get_doc(node)[0].body
+
+    def _visit_lazy_body(
+        self, statements: list[ast.stmt], function: nodes.FunctionDef
+    ) -> list[nodes.NodeNG]:
+        """Visit the statements of the body of a function built lazily."""
+        self._global_names.append({})
+        try:
+            return [self.visit(child, function) for child in statements]
+        finally:
+            self._global_names.pop()
+
     def visit_functiondef(
         self, node: ast.FunctionDef, parent: nodes.NodeNG
     ) -> nodes.FunctionDef:
@@ -1339,6 +1504,7 @@ class TreeRebuilder:
             parent=parent,
             is_lazy=node.is_lazy if sys.version_info >= (3, 15) else 0,
         )
+        self._import_nodes.append(newnode)
         # save import names in parent's locals:
         for name, asname in newnode.names:
             name = (asname or name).split(".")[0]
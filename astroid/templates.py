@@ -0,0 +1,85 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Code parsed once and copied for each use.
+
+Brains build many of the nodes they infer from code, e.g. the class of each
+``namedtuple()`` call. Parsing that code again for every inference costs far
+more than copying the nodes it gives, so a :class:`Template` parses its code
+the first time it is used and then hands out copies of the resulting node,
+with the placeholder names of the code replaced.
+"""
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+from astroid.nodes.node_ng import NodeNG, _copy_tree
+
+if TYPE_CHECKING:
+    from astroid.transforms import TransformVisitor
+
+
+class Template:
+    """Code designating a single node, parsed once and copied for each use.
+
+    The code is parsed as with :func:`~astroid.builder.extract_node`, when the
+    template is first used with the transforms of the active manager, and once
+    more for each manager with transforms of its own. Each copy gets its own copy
+    of the module of the code as its root, and so resolves the other names the
+    code defines, unless it is given another parent.
+    """
+
+    def __init__(self, code: str) -> None:
+        self.code = code
+        self._parsed_by: weakref.WeakKeyDictionary[
+            TransformVisitor, tuple[list[NodeNG], int, int]
+        ] = weakref.WeakKeyDictionary()
+        """The module of the code followed by its descendants, with the bounds of
+        the node of the code and its descendants among them, by the transforms
+        they were parsed with.
+        """
+
+    def _parsed(self) -> tuple[list[NodeNG], int, int]:
+        # pylint: disable=import-outside-toplevel
+        from astroid.builder import extract_node
+        from astroid.manager import AstroidManager
+
+        transforms = AstroidManager()._transform
+        parsed = self._parsed_by.get(transforms)
+        if parsed is None:
+            node = extract_node(self.code)
+            if isinstance(node, list):
+                raise ValueError(f"The code of {self!r} designates several nodes")
+            # Also builds the lazy bodies of functions, which copies could not share.
+            nodes = list(node.root().nodes_of_class(NodeNG))
+            start = next(index for index, item in enumerate(nodes) if item is node)
+            end = start + sum(1 for _ in node.nodes_of_class(NodeNG))
+            parsed = self._parsed_by[transforms] = (nodes, start, end)
+        return parsed
+
+    def copy(
+        self,
+        parent: NodeNG | None = None,
+        names: Mapping[str, str] | None = None,
+    ) -> NodeNG:
+        """Get a new copy of the node of the template.
+
+        :param parent: The parent of the copy, instead of a copy of the module
+            of the code.
+        :param names: The names replacing the placeholders of the code. Variables,
+            attributes and arguments named after a placeholder are renamed, with
+            the name normalized to NFKC as the parser does. String constants are
+            left as they are.
+        :raises AstroidSyntaxError: If the code cannot be parsed.
+        """
+        nodes, start, end = self._parsed()
+        if parent is not None:
+            return _copy_tree(nodes[start:end], parent, names=names)
+        return _copy_tree(nodes, names=names, index=start)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.code.strip().splitlines()[0]!r}>"
@@ -9,6 +9,7 @@ from __future__ import annotations
 import contextlib
 import functools
 import sys
+import threading
 import warnings
 from collections.abc import Callable
 
@@ -69,10 +70,12 @@ def brainless_manager():
     # avoid caching into the AstroidManager borg since we get problems
     # with other tests :
     m.__dict__ = {}
+    m._brain = manager.AstroidManager.brain
     m._failed_import_hooks = []
     m.astroid_cache = {}
     m._mod_file_cache = {}
     m._transform = transforms.TransformVisitor()
+    m._build_lock = threading.RLock()
     m.extension_package_whitelist = set()
     m.module_denylist = set()
     return m
@@ -9,7 +9,7 @@ from collections import defaultdict
 from collections.abc import Callable
 from typing import TYPE_CHECKING, TypeVar, Union, cast, overload
 
-from astroid.context import _invalidate_cache
+from astroid.context import _INFERENCE_CACHE, _tree_root
 from astroid.typing import SuccessfulInferenceResult, TransformFn
 
 if TYPE_CHECKING:
@@ -69,7 +69,7 @@ class TransformVisitor:
                 # if the transformation function returns something, it's
                 # expected to be a replacement for the node
                 if ret is not None:
-                    _invalidate_cache()
+                    _INFERENCE_CACHE.invalidate_root(_tree_root(node))
                     node = ret
                 if ret.__class__ != cls:
                     # Can no longer apply the rest of the transforms.
@@ -77,7 +77,11 @@ class TransformVisitor:
         return node
 
     def _visit(self, node: nodes.NodeNG) -> SuccessfulInferenceResult:
+        # Bodies of functions built lazily are transformed once built.
+        lazy = node.is_function and node._lazy_body is not None
         for name in node._astroid_fields:
+            if lazy and name == "body":
+                continue
             value = getattr(node, name)
             if TYPE_CHECKING:
                 value = cast(_Vistables, value)
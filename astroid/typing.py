@@ -15,11 +15,14 @@ from typing import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    import threading
+    from collections.abc import Iterator, MutableMapping
 
     from astroid import bases, exceptions, nodes, transforms, util
     from astroid.context import InferenceContext
+    from astroid.import_graph import ImportGraph
     from astroid.interpreter._import import spec
+    from astroid.persistent_cache import PersistentModuleCache
 
 
 class InferenceErrorInfo(TypedDict):
@@ -34,7 +37,8 @@ class InferenceErrorInfo(TypedDict):
 class AstroidManagerBrain(TypedDict):
     """Dictionary to store relevant information for a AstroidManager class."""
 
-    astroid_cache: dict[str, nodes.Module]
+    astroid_cache: MutableMapping[str, nodes.Module]
+    import_graph: ImportGraph
     _mod_file_cache: dict[
         tuple[str, str | None], spec.ModuleSpec | exceptions.AstroidImportError
     ]
@@ -43,7 +47,12 @@ class AstroidManagerBrain(TypedDict):
     optimize_ast: bool
     max_inferable_values: int
     extension_package_whitelist: set[str]
+    lazy_function_bodies: bool
+    project_roots: tuple[str, ...]
+    search_path: tuple[str, ...] | None
     _transform: transforms.TransformVisitor
+    _build_lock: threading.RLock
+    persistent_cache: PersistentModuleCache | None
 
 
 # pylint: disable=consider-alternative-union-syntax
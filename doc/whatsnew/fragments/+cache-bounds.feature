@@ -0,0 +1,4 @@
+``AstroidManager.astroid_cache`` can now be bounded with its ``max_entries``
+and ``max_memory`` settings. Evicted modules are dropped along with the results
+inferred from them. The inference cache is now bounded per module and as a
+whole.
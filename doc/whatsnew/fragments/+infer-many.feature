@@ -0,0 +1,4 @@
+Add ``AstroidManager.infer_many()``, which infers many nodes as ``safe_infer``
+does in forked worker processes, and ``AstroidManager.ast_from_files()``, which
+builds many files in worker processes. Both fall back to this process when it
+cannot be forked safely.
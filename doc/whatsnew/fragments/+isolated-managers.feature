@@ -0,0 +1,3 @@
+Add ``AstroidManager.isolated()`` to create a manager with its own module cache,
+transforms and settings. ``AstroidManager()`` still refers to the shared state
+by default, or to the isolated manager while it builds modules.
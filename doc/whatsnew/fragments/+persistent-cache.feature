@@ -0,0 +1,5 @@
+Add an opt-in on-disk cache of the modules built from source files, enabled by
+setting ``AstroidManager.persistent_cache_dir``. Entries are checked against
+the source file, the Python and astroid versions and the registered transforms.
+The cache also holds a snapshot of the bootstrapped builtins module and the
+module name resolutions of previous runs.
@@ -0,0 +1,4 @@
+Add ``python -m astroid profile FILE`` and ``astroid.profiling.profile()``. They
+report the time spent inferring each type of node, running the transforms and
+building the imported modules, along with the calls of each inference tip and
+the hit rate of the inference cache.
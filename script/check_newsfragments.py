@@ -40,6 +40,11 @@ VALID_CHANGELOG_PATTERN = (
 VALID_CHANGELOG_COMPILED_PATTERN: Pattern[str] = re.compile(
     VALID_CHANGELOG_PATTERN, flags=re.MULTILINE
 )
+ORPHAN_PREFIX = "+"
+"""Prefix of the fragments of changes without an issue, as in towncrier."""
+VALID_ORPHAN_CHANGELOG_COMPILED_PATTERN: Pattern[str] = re.compile(
+    r"(?P<description>(.*\n)*(.*\.\n))\Z", flags=re.MULTILINE
+)
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -62,9 +67,13 @@ def check_file(file: Path, verbose: bool) -> bool:
     """Check that a file contains a valid changelog entry."""
     with open(file, encoding="utf8") as f:
         content = f.read()
-    match = VALID_CHANGELOG_COMPILED_PATTERN.match(content)
+    orphan = file.name.startswith(ORPHAN_PREFIX)
+    if orphan:
+        match = VALID_ORPHAN_CHANGELOG_COMPILED_PATTERN.match(content)
+    else:
+        match = VALID_CHANGELOG_COMPILED_PATTERN.match(content)
     if match:
-        issue = match.group("issue")
+        issue = file.stem if orphan else match.group("issue")
         if file.stem != issue:
             echo(
                 f"{file} must be named '{issue}.<fragmenttype>', after the issue it references."
@@ -96,6 +105,9 @@ The standard format is:
 
 Where <issue reference> can be one of: {', '.join(VALID_ISSUES_KEYWORDS)}
 
+A change without an issue goes in a fragment named
+'{ORPHAN_PREFIX}<name>.<fragmenttype>', holding the text alone.
+
 The regex used is '{VALID_CHANGELOG_COMPILED_PATTERN}'.
 
 For example:
@@ -0,0 +1,362 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Offline microbenchmarks timing each stage of astroid separately.
+
+Unlike the end-to-end benchmarks, these need neither network access nor
+``pytest-codspeed``. The corpus is made of generated modules and of the
+single-file modules of ``tests/testdata``, plus any file given on the command
+line. Each stage is timed over several runs, and its peak memory is measured
+with ``tracemalloc`` over one more run. The memory held by the trees of the
+corpus is measured as well, per node. Results are written as JSON, so that runs
+of different releases can be compared::
+
+    python -m tests.benchmarks.microbench --output before.json
+    python -m tests.benchmarks.microbench --output after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from astroid import nodes
+from astroid.__pkginfo__ import __version__
+from astroid.builder import AstroidBuilder, _parse_string
+from astroid.class_cache import _CLASS_CACHE
+from astroid.context import _invalidate_cache
+from astroid.exceptions import AstroidError
+from astroid.inference_tip import clear_inference_tip_cache
+from astroid.manager import AstroidManager
+from astroid.memo import memos
+from astroid.rebuilder import TreeRebuilder
+
+VENDORED_CORPUS = Path(__file__).parent.parent / "testdata" / "python3" / "data"
+
+
+class Source(NamedTuple):
+    modname: str
+    code: str
+
+
+class Stage(NamedTuple):
+    """A step of astroid to time.
+
+    *prepare* runs before each run, untimed, and its result is given to *run*,
+    which returns the number of operations it made.
+    """
+
+    prepare: Callable[[], Any]
+    run: Callable[[Any], int]
+
+
+def synthetic_module(index: int, classes: int = 10) -> Source:
+    """Generate a module with class hierarchies, methods, calls and attributes."""
+    lines = ["import collections", "import os.path", ""]
+    for number in range(classes):
+        base = f"Class{number - 1}" if number else "object"
+        lines += [
+            f"class Class{number}({base}):",
+            f"    attribute = {number}",
+            "",
+            "    def __init__(self, value=None):",
+            "        self.value = value or collections.OrderedDict()",
+            "",
+            f"    def method{number}(self, other):",
+            "        result = self.value.get(other, self.attribute)",
+            "        return os.path.join(str(result), str(other))",
+            "",
+        ]
+    lines += [
+        "def main():",
+        f"    instance = Class{classes - 1}()",
+        *(
+            f"    value{number} = instance.method{number}(instance.attribute)"
+            for number in range(classes)
+        ),
+        "    return instance.value",
+        "",
+    ]
+    return Source(f"bench_synthetic_{index}", "\n".join(lines))
+
+
+def default_corpus(synthetic: int = 10, vendored: bool = True) -> list[Source]:
+    corpus = [synthetic_module(index) for index in range(synthetic)]
+    if vendored:
+        corpus += [
+            Source(f"bench_vendored_{path.stem}", path.read_text(encoding="utf-8"))
+            for path in sorted(VENDORED_CORPUS.glob("*.py"))
+            if _parses(path)
+        ]
+    return corpus
+
+
+def _parses(path: Path) -> bool:
+    try:
+        ast.parse(path.read_text(encoding="utf-8"))
+    except (SyntaxError, UnicodeDecodeError, ValueError):
+        return False
+    return True
+
+
+def _clear_inference_caches() -> None:
+    _invalidate_cache()
+    _CLASS_CACHE.clear()
+    clear_inference_tip_cache()
+    for memo in memos().values():
+        memo.invalidate()
+
+
+def _infer(nodes_to_infer: list[nodes.NodeNG]) -> int:
+    for node in nodes_to_infer:
+        try:
+            list(node.infer())
+        except AstroidError:
+            pass
+    return len(nodes_to_infer)
+
+
+def _infer_trees(modules: list[nodes.Module]) -> int:
+    return _infer(
+        [
+            node
+            for module in modules
+            for node in module.nodes_of_class((nodes.Name, nodes.Attribute, nodes.Call))
+        ]
+    )
+
+
+def _mro(classes: list[nodes.ClassDef]) -> int:
+    for cls in classes:
+        try:
+            cls.mro()
+        except AstroidError:
+            pass
+    return len(classes)
+
+
+def stages(manager: AstroidManager, corpus: Sequence[Source]) -> dict[str, Stage]:
+    """Get the stages to time over the corpus, by name."""
+    trees = [_parse_string(source.code, modname=source.modname) for source in corpus]
+    builder = AstroidBuilder(manager)
+    modules = [builder.string_build(source.code, source.modname) for source in corpus]
+
+    def of_class(*classes: type[nodes.NodeNG]) -> list[Any]:
+        return [node for module in modules for node in module.nodes_of_class(classes)]
+
+    def rebuild() -> list[nodes.Module]:
+        return [
+            TreeRebuilder(manager, source.code).visit_module(
+                tree, source.modname, "<bench>", False
+            )
+            for source, tree in zip(corpus, trees)
+        ]
+
+    return {
+        "parse": Stage(
+            lambda: None,
+            lambda _: len(
+                [
+                    _parse_string(source.code, modname=source.modname)
+                    for source in corpus
+                ]
+            ),
+        ),
+        "rebuild": Stage(lambda: None, lambda _: len(rebuild())),
+        "transforms": Stage(
+            rebuild,
+            lambda fresh: len([manager.visit_transforms(module) for module in fresh]),
+        ),
+        "lookup": Stage(
+            _clear_inference_caches,
+            lambda _: len([node.lookup(node.name) for node in of_class(nodes.Name)]),
+        ),
+        "mro": Stage(_clear_inference_caches, lambda _: _mro(of_class(nodes.ClassDef))),
+        "infer_call": Stage(
+            _clear_inference_caches, lambda _: _infer(of_class(nodes.Call))
+        ),
+        "infer_attribute": Stage(
+            _clear_inference_caches, lambda _: _infer(of_class(nodes.Attribute))
+        ),
+        "infer_name": Stage(
+            _clear_inference_caches, lambda _: _infer(of_class(nodes.Name))
+        ),
+        "as_string": Stage(
+            lambda: None, lambda _: len([module.as_string() for module in modules])
+        ),
+        "bootstrap": Stage(lambda: None, lambda _: manager.bootstrap() or 1),
+    }
+
+
+def tree_memory(manager: AstroidManager, corpus: Sequence[Source]) -> dict[str, Any]:
+    """Measure the memory held by the trees built from the corpus, then once
+    more after inferring their names, attributes and calls, which counts what
+    inference memoizes on the nodes and caches.
+
+    The corpus is built and inferred once beforehand, so that the modules the
+    transforms and inference may import are not counted.
+    """
+    builder = AstroidBuilder(manager)
+    _infer_trees(
+        [builder.string_build(source.code, source.modname) for source in corpus]
+    )
+    gc.collect()
+    tracemalloc.start()
+    try:
+        modules = [
+            builder.string_build(source.code, source.modname) for source in corpus
+        ]
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+        _infer_trees(modules)
+        gc.collect()
+        inferred_size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    count = sum(1 for module in modules for _ in module.nodes_of_class(nodes.NodeNG))
+    return {
+        "nodes": count,
+        "bytes": size,
+        "bytes_per_node": size / count,
+        "inferred_bytes": inferred_size,
+        "inferred_bytes_per_node": inferred_size / count,
+    }
+
+
+def measure(stage: Stage, repeat: int, warmup: int = 1) -> dict[str, Any]:
+    """Time the runs of a stage, then measure its peak memory over one more run."""
+    for _ in range(warmup):
+        stage.run(stage.prepare())
+    timings = []
+    operations = 0
+    for _ in range(repeat):
+        state = stage.prepare()
+        start = time.perf_counter()
+        operations = stage.run(state)
+        timings.append(time.perf_counter() - start)
+
+    state = stage.prepare()
+    tracemalloc.start()
+    try:
+        stage.run(state)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "operations": operations,
+        "best": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "peak_memory": peak_memory,
+    }
+
+
+def run(
+    corpus: Sequence[Source],
+    repeat: int = 5,
+    warmup: int = 1,
+    only: Sequence[str] | None = None,
+) -> dict[str, Any]:
+    """Run the benchmarks over the corpus and get their results."""
+    manager = AstroidManager()
+    manager.clear_cache()
+    try:
+        memory = tree_memory(manager, corpus)
+        selected = stages(manager, corpus)
+        results = {
+            name: measure(stage, repeat, warmup)
+            for name, stage in selected.items()
+            if only is None or name in only
+        }
+    finally:
+        # The bootstrap stage replaces the builtins module under the feet of
+        # the modules built before.
+        manager.clear_cache()
+    return {
+        "astroid": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "repeat": repeat,
+        "corpus": {
+            "modules": len(corpus),
+            "lines": sum(source.code.count("\n") + 1 for source in corpus),
+        },
+        "trees": memory,
+        "stages": results,
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> str:
+    """Format the best times of two runs side by side."""
+    lines = [
+        f"{'stage':<16} {'baseline':>10} {'current':>10} {'ratio':>7}",
+    ]
+    for name, stage in results["stages"].items():
+        before = baseline["stages"].get(name)
+        if before is None:
+            lines.append(f"{name:<16} {'-':>10} {stage['best']:>10.4f}")
+            continue
+        ratio = stage["best"] / before["best"] if before["best"] else float("nan")
+        lines.append(
+            f"{name:<16} {before['best']:>10.4f} {stage['best']:>10.4f} {ratio:>7.2f}"
+        )
+    for key, label in (
+        ("bytes_per_node", "bytes per node"),
+        ("inferred_bytes_per_node", "after inference"),
+    ):
+        before = baseline.get("trees", {}).get(key)
+        if before:
+            after = results["trees"][key]
+            lines.append(
+                f"{label:<16} {before:>10.1f} {after:>10.1f} {after / before:>7.2f}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", "-o", type=Path, help="JSON file of the results")
+    parser.add_argument("--compare", type=Path, help="JSON results to compare to")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per stage")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs first")
+    parser.add_argument(
+        "--synthetic", type=int, default=10, help="Number of generated modules"
+    )
+    parser.add_argument(
+        "--no-vendored", action="store_true", help="Leave out tests/testdata"
+    )
+    parser.add_argument("--stage", action="append", help="Only run these stages")
+    parser.add_argument("files", nargs="*", type=Path, help="More files to include")
+    args = parser.parse_args(argv)
+
+    corpus = default_corpus(args.synthetic, not args.no_vendored)
+    corpus += [
+        Source(f"bench_file_{index}", path.read_text(encoding="utf-8"))
+        for index, path in enumerate(args.files)
+    ]
+    results = run(corpus, args.repeat, args.warmup, args.stage)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(compare(results, baseline))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
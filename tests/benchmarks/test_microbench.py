@@ -0,0 +1,71 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Keep the offline microbenchmarks runnable, on a tiny corpus."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from astroid.manager import AstroidManager
+from tests.benchmarks import microbench
+
+
+def test_microbench_stages() -> None:
+    corpus = microbench.default_corpus(1, False)
+    assert set(microbench.stages(AstroidManager(), corpus)) == {
+        "parse",
+        "rebuild",
+        "transforms",
+        "lookup",
+        "mro",
+        "infer_call",
+        "infer_attribute",
+        "infer_name",
+        "as_string",
+        "bootstrap",
+    }
+
+
+def test_microbench_writes_json_results(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps(
+            {
+                "stages": {"parse": {"best": 1.0}},
+                "trees": {"bytes_per_node": 1.0, "inferred_bytes_per_node": 1.0},
+            }
+        ),
+        encoding="utf-8",
+    )
+    output = tmp_path / "results.json"
+    argv = ["--synthetic", "1", "--no-vendored", "--repeat", "1", "--warmup", "0"]
+    argv += ["--stage", "parse", "--stage", "infer_name"]
+    assert (
+        microbench.main([*argv, "--output", str(output), "--compare", str(baseline)])
+        == 0
+    )
+
+    results = json.loads(output.read_text(encoding="utf-8"))
+    assert results["corpus"]["modules"] == 1
+    assert set(results["stages"]) == {"parse", "infer_name"}
+    assert results["trees"]["bytes_per_node"] > 0
+    assert (
+        results["trees"]["inferred_bytes_per_node"] > results["trees"]["bytes_per_node"]
+    )
+    for stage in results["stages"].values():
+        assert stage["operations"] > 0
+        assert stage["best"] <= stage["median"]
+        assert stage["peak_memory"] > 0
+
+    comparison = capsys.readouterr().out.splitlines()[-4:]
+    assert comparison[0].startswith("parse")
+    assert comparison[1].startswith("infer_name")
+    assert comparison[2].startswith("bytes per node")
+    assert comparison[3].startswith("after inference")
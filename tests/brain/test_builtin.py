@@ -33,6 +33,18 @@ class BuiltinsTest(unittest.TestCase):
         )
         self.assertTrue(hasattr(inferred_property, "args"))
 
+    def test_getattr_keeps_the_position_of_nodes_of_other_modules(self):
+        first, second = extract_node("""
+        import sys
+        getattr(sys, "maxsize") #@
+        getattr(sys, "maxsize") #@
+        """)
+        maxsize = next(first.infer())
+        self.assertIsNot(maxsize.root(), first.root())
+        self.assertIs(next(second.infer()), maxsize)
+        self.assertIsNone(maxsize.lineno)
+        self.assertIsNone(maxsize.col_offset)
+
 
 class TestStringNodes:
     @pytest.mark.parametrize(
@@ -290,3 +290,22 @@ class NamedTupleTest(unittest.TestCase):
         assert isinstance(good_node_two_inferred, nodes.ClassDef)
         bad_node_inferred = next(bad_node.infer())
         assert bad_node_inferred == util.Uninferable
+
+    def test_namedtuples_with_as_many_fields(self) -> None:
+        first, second = builder.extract_node("""
+        from collections import namedtuple
+        Point = namedtuple("Point", "x y")
+        Size = namedtuple("Size", "width height")
+        Point(1, 2) #@
+        Size(3, 4) #@
+        """)
+        point = next(first.infer())
+        size = next(second.infer())
+        self.assertEqual(next(point.igetattr("_fields")).as_string(), "('x', 'y')")
+        self.assertEqual(
+            next(size.igetattr("_fields")).as_string(), "('width', 'height')"
+        )
+        replace = point.getattr("_replace")[0]
+        self.assertEqual([arg.name for arg in replace.args.args], ["self", "x", "y"])
+        self.assertIn("width", size._proxied.locals)
+        self.assertNotIn("width", point._proxied.locals)
@@ -937,3 +937,90 @@ class HermeticInterpreterTest(unittest.TestCase):
                 my_builder.module_build(
                     self.imported_module, modname=self.imported_module_path.stem
                 )
+
+
+class LazyFunctionBodiesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = AstroidManager()
+        self.manager.lazy_function_bodies = True
+        self.addCleanup(setattr, self.manager, "lazy_function_bodies", False)
+        self.builder = builder.AstroidBuilder(self.manager)
+
+    def test_body_built_on_access(self) -> None:
+        module = self.builder.string_build(textwrap.dedent('''
+            class A:
+                def method(self, arg):
+                    """Docstring."""
+                    value = arg + 1
+                    return value
+            '''))
+        method = module["A"]["method"]
+        self.assertIsNotNone(method._lazy_body)
+        self.assertEqual(method.doc_node.value, "Docstring.")
+        self.assertEqual(method.argnames(), ["self", "arg"])
+        self.assertEqual(sorted(method.locals), ["arg", "self", "value"])
+        self.assertIsNone(method._lazy_body)
+        self.assertEqual(
+            [type(node) for node in method.body], [nodes.Assign, nodes.Return]
+        )
+        self.assertEqual(method.body[0].lineno, 5)
+        self.assertEqual(method.body[0].col_offset, 8)
+        self.assertIs(method.body[0].parent, method)
+        inferred = next(method.body[1].value.infer())
+        self.assertIs(inferred, util.Uninferable)
+
+    def test_body_with_effects_outside_built_eagerly(self) -> None:
+        module = self.builder.string_build(textwrap.dedent("""
+            class A:
+                def __init__(self):
+                    self.attr = 1
+
+            def function():
+                global CONSTANT
+                CONSTANT = 1
+            """))
+        self.assertIsNone(module["A"]["__init__"]._lazy_body)
+        self.assertIsNone(module["function"]._lazy_body)
+        self.assertIn("attr", module["A"].instance_attrs)
+        self.assertIn("CONSTANT", module.locals)
+
+    def test_body_parsed_as_the_module(self) -> None:
+        source = textwrap.dedent("""
+            def function():
+                value = 1  # type: int
+                return value
+
+            def misplaced(arg):
+                pass
+                # type: (int) -> None
+            """)
+        module = self.builder.string_build(source)
+        self.assertIsNotNone(module["function"]._lazy_body)
+        # The type comments of the module are misplaced, so none is parsed.
+        self.assertIsNone(module["function"].body[0].type_annotation)
+        self.assertIsInstance(module["misplaced"].body[0], nodes.Pass)
+
+    def test_assignments_of_built_bodies_in_scope(self) -> None:
+        module = self.builder.string_build(textwrap.dedent("""
+            class A:
+                def method(self):
+                    pass
+
+                def other(self):
+                    method = staticmethod(method)
+            """))
+        cls = module["A"]
+        self.assertEqual(cls._assign_nodes_in_scope, [])
+        other = cls["other"]
+        other._lazy_body.build(other)
+        self.assertEqual(other._assign_nodes_in_scope, [other.body[0]])
+
+    def test_transforms_applied_to_lazy_body(self) -> None:
+        def transform(node: nodes.Const) -> None:
+            node.value *= 2
+
+        self.manager.register_transform(nodes.Const, transform)
+        self.addCleanup(self.manager.unregister_transform, nodes.Const, transform)
+        module = self.builder.string_build("X = 1\ndef function():\n    return 2\n")
+        self.assertEqual(module.body[0].value.value, 2)
+        self.assertEqual(module["function"].body[0].value.value, 4)
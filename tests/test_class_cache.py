@@ -0,0 +1,156 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Tests for the cache of class hierarchies."""
+
+# pylint: disable=redefined-outer-name
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from astroid import nodes
+from astroid.builder import AstroidBuilder
+from astroid.class_cache import _CLASS_CACHE
+from astroid.context import InferenceContext
+from astroid.manager import AstroidManager
+from astroid.nodes.scoped_nodes.scoped_nodes import _ATTRIBUTE_TABLES_IN_PROGRESS
+
+
+@pytest.fixture
+def manager() -> Iterator[AstroidManager]:
+    mgr = AstroidManager()
+    _CLASS_CACHE.clear()
+    try:
+        yield mgr
+    finally:
+        for modname in ("class_cache_base", "class_cache_user"):
+            mgr.astroid_cache.pop(modname, None)
+        _CLASS_CACHE.clear()
+
+
+@pytest.fixture
+def child(manager: AstroidManager) -> nodes.ClassDef:
+    builder = AstroidBuilder(manager)
+    builder.string_build(
+        "class Base:\n    def value(self):\n        return 1\n", "class_cache_base"
+    )
+    user = builder.string_build(
+        "from class_cache_base import Base\nclass Child(Base):\n    pass\n",
+        "class_cache_user",
+    )
+    return user["Child"]
+
+
+def test_mro_is_cached(child: nodes.ClassDef) -> None:
+    mro = child.mro()
+    assert [cls.name for cls in mro] == ["Child", "Base", "object"]
+    hits, misses = _CLASS_CACHE.hits, _CLASS_CACHE.misses
+    with mock.patch.object(nodes.ClassDef, "_compute_mro") as compute_mro:
+        assert child.mro() == mro
+    compute_mro.assert_not_called()
+    assert (_CLASS_CACHE.hits, _CLASS_CACHE.misses) == (hits + 1, misses)
+
+
+def test_ancestors_are_cached(child: nodes.ClassDef) -> None:
+    ancestors = list(child.ancestors())
+    assert [cls.name for cls in ancestors] == ["Base", "object"]
+    assert [cls.name for cls in child.ancestors(recurs=False)] == ["Base"]
+    hits = _CLASS_CACHE.hits
+    with mock.patch.object(nodes.ClassDef, "_infer_ancestors") as infer_ancestors:
+        assert list(child.ancestors()) == ancestors
+    infer_ancestors.assert_not_called()
+    assert _CLASS_CACHE.hits == hits + 1
+
+
+def test_results_with_a_context_are_not_stored(child: nodes.ClassDef) -> None:
+    # Transforms may have looked at the class while it was built.
+    _CLASS_CACHE.clear()
+    list(child.ancestors(context=InferenceContext()))
+    assert _CLASS_CACHE.get(child, "ancestors") is None
+    child.mro(InferenceContext())
+    assert _CLASS_CACHE.get(child, "mro") is None
+
+
+def test_results_with_a_context_are_not_read(child: nodes.ClassDef) -> None:
+    mro = child.mro()
+    ancestors = list(child.ancestors())
+    with mock.patch.object(_CLASS_CACHE, "get") as get:
+        assert child.mro(InferenceContext()) == mro
+        assert list(child.ancestors(context=InferenceContext())) == ancestors
+    get.assert_not_called()
+
+
+def test_invalidating_a_base_module(
+    manager: AstroidManager, child: nodes.ClassDef
+) -> None:
+    base = child.mro()[1]
+    list(base.ancestors())
+    list(child.ancestors())
+    assert len(_CLASS_CACHE) == 3
+
+    _CLASS_CACHE.invalidate({"other"})
+    assert len(_CLASS_CACHE) == 3
+    # The subclass depends on the base class too.
+    manager.invalidate_module("class_cache_base")
+    assert len(_CLASS_CACHE) == 0
+
+
+def test_invalidated_classes_are_not_tracked(child: nodes.ClassDef) -> None:
+    builtin_object = child.mro()[-1]
+    assert (child, "mro") in _CLASS_CACHE._dependents[builtin_object]
+    _CLASS_CACHE.invalidate_root(child.root())
+    # The dependents of the classes of other modules do not keep it alive.
+    assert all(
+        key[0].root() is not child.root()
+        for dependents in _CLASS_CACHE._dependents.values()
+        for key in dependents
+    )
+
+
+def test_attribute_tables(child: nodes.ClassDef) -> None:
+    base, builtin_object = child.mro()[1:]
+    assert list(child.local_attr_ancestors("value")) == [base]
+    table = child._attribute_table("attributes")
+    assert table["value"] == (base,)
+    assert table["__init__"] == (builtin_object,)
+    assert child.getattr("value")[0].parent is base
+
+
+def test_new_attribute_invalidates_attribute_tables(
+    manager: AstroidManager, child: nodes.ClassDef
+) -> None:
+    assert not list(child.instance_attr_ancestors("added"))
+    AstroidBuilder(manager).string_build(
+        "from class_cache_base import Base\nBase().added = 1\nBase.shared = 2\n"
+    )
+    assert [cls.name for cls in child.instance_attr_ancestors("added")] == ["Base"]
+    assert [cls.name for cls in child.local_attr_ancestors("shared")] == ["Base"]
+
+
+def test_attributes_added_to_locals_invalidate_attribute_tables(
+    child: nodes.ClassDef,
+) -> None:
+    base = child.mro()[1]
+    assert not list(child.local_attr_ancestors("added"))
+    # As brains do when inferring a class, e.g. the members of an enum.
+    base.locals["added"] = [nodes.Const(1, parent=base)]
+    assert list(child.local_attr_ancestors("added")) == [base]
+    assert child.getattr("added") == base.locals["added"]
+
+
+def test_attribute_tables_in_progress_per_thread(child: nodes.ClassDef) -> None:
+    _ATTRIBUTE_TABLES_IN_PROGRESS.tables.add((child, "attributes"))
+    try:
+        assert child._attribute_table("attributes") is None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            table = executor.submit(child._attribute_table, "attributes").result()
+    finally:
+        _ATTRIBUTE_TABLES_IN_PROGRESS.tables.discard((child, "attributes"))
+    assert table is not None
+    assert table["value"] == (child.mro()[1],)
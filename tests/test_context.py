@@ -2,7 +2,7 @@
 # For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
 # Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
 
-"""Tests for ``astroid.context.InferenceContext``.
+"""Tests for ``astroid.context.InferenceContext`` and the inference cache.
 
 The hot-path ``clone()`` implementation bypasses ``__init__`` and writes
 slots directly. These tests pin down each field's clone semantics so a
@@ -14,8 +14,10 @@ from __future__ import annotations
 
 import pytest
 
-from astroid import extract_node, nodes
-from astroid.context import CallContext, InferenceContext
+import astroid
+from astroid import extract_node, nodes, parse
+from astroid.context import CallContext, InferenceCache, InferenceContext
+from astroid.transforms import TransformVisitor
 
 
 def _populated_context() -> InferenceContext:
@@ -171,3 +173,94 @@ def test_clone_keeps_inference_working(node_source: str) -> None:
     clone = ctx.clone()
     inferred = next(node.infer(context=clone))
     assert isinstance(inferred, (nodes.Const, nodes.FunctionDef, nodes.NodeNG))
+
+
+class TestInferenceCache:
+    """The inference cache is partitioned by module, and bounded per module."""
+
+    @staticmethod
+    def _names(source: str, modname: str) -> list[nodes.Name]:
+        module = parse(source, modname)
+        return list(module.nodes_of_class(nodes.Name))
+
+    def test_counts_hits_and_misses(self) -> None:
+        cache = InferenceCache()
+        node = extract_node("x = 1; x #@")
+        key = (node, None, None, None)
+        assert key not in cache
+        assert cache.get(key) is None
+        cache[key] = ("result",)
+        assert key in cache
+        assert cache[key] == ("result",)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_partitions_are_bounded(self) -> None:
+        cache = InferenceCache(max_entries_per_module=2)
+        first = self._names("a; b; c", "first")
+        second = self._names("d", "second")
+        for node in (*first, *second):
+            cache[(node, None, None, None)] = ()
+        # Only the least recently used entry of the full module is evicted.
+        assert cache.evictions == 1
+        assert cache.sizes() == {"first": 2, "second": 1}
+        assert (first[0], None, None, None) not in cache
+        assert (second[0], None, None, None) in cache
+
+    def test_invalidate_modules(self) -> None:
+        cache = InferenceCache()
+        [kept] = self._names("kept", "kept")
+        [dropped] = self._names("dropped", "dropped")
+        [referencing] = self._names("referencing", "referencing")
+        cache[(kept, None, None, None)] = ()
+        cache[(dropped, None, None, None)] = ()
+        cache[(referencing, None, None, None)] = (dropped,)
+        cache.invalidate({"dropped"})
+        assert list(cache) == [(kept, None, None, None)]
+
+    def test_transform_invalidates_its_module_only(self) -> None:
+        node = extract_node("x = 1\nx #@")
+        other = extract_node("y = 1\ny #@")
+        node.inferred()
+        other.inferred()
+        roots = {key[0].root() for key in astroid.MANAGER.inference_cache}
+        assert {node.root(), other.root()} <= roots
+
+        visitor = TransformVisitor()
+        visitor.register_transform(nodes.Const, lambda const: const)
+        visitor.visit(node.root())
+        roots = {key[0].root() for key in astroid.MANAGER.inference_cache}
+        assert node.root() not in roots
+        assert other.root() in roots
+
+    def test_total_entries_are_bounded(self) -> None:
+        cache = InferenceCache(max_entries=3)
+        first = self._names("a; b", "first")
+        second = self._names("c", "second")
+        third = self._names("d", "third")
+        for node in (*first, *second):
+            cache[(node, None, None, None)] = ()
+        assert cache.get((first[0], None, None, None)) == ()
+        cache[(third[0], None, None, None)] = ()
+        # The least recently used partition loses its oldest entry.
+        assert cache.evictions == 1
+        assert cache.sizes() == {"first": 2, "third": 1}
+        assert len(cache) == 3
+
+    def test_partitions_do_not_write_on_nodes(self) -> None:
+        cache = InferenceCache()
+        [node] = self._names("x", "untouched")
+        attributes = (dict(node.__dict__), dict(node.root().__dict__))
+        cache[(node, None, None, None)] = ()
+        assert cache.get((node, None, None, None)) == ()
+        assert (node.__dict__, node.root().__dict__) == attributes
+
+    def test_attached_tree_gets_its_new_root(self) -> None:
+        cache = InferenceCache()
+        [node] = self._names("x", "detached")
+        node.parent.parent = None
+        key = (node, None, None, None)
+        cache[key] = ()
+        assert cache.sizes() == {"": 1}
+        node.parent.parent = parse("", "attached")
+        cache[key] = ()
+        assert cache.sizes() == {"": 1, "attached": 1}
@@ -2,7 +2,7 @@
 # For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
 # Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
 
-from astroid.builder import extract_node
+from astroid.builder import extract_node, parse
 from astroid.filter_statements import _filter_stmts
 from astroid.nodes import EmptyNode
 
@@ -13,3 +13,33 @@ def test_empty_node() -> None:
     empty.is_statement = True
     filtered_statements = _filter_stmts(empty, [empty.statement()], empty.frame(), 0)
     assert filtered_statements[0] is empty
+
+
+def test_rebound_name() -> None:
+    module = parse(
+        "\n".join(f"x = {i}\nif x:\n    x = -{i}\ny{i} = x" for i in range(50))
+    )
+    name = module.body[-1].value
+    _, assignments = name.lookup("x")
+    assert [node.statement().lineno for node in assignments] == [197, 199]
+    first = module.body[1].test
+    _, assignments = first.lookup("x")
+    assert [node.statement().lineno for node in assignments] == [1]
+
+
+def test_statement_index_refreshed() -> None:
+    module = parse("x = 1\nprint(x)\nx = 2")
+    name = module.body[1].value.args[0]
+    assignments = module.locals["x"]
+    assert _filter_stmts(name, assignments, module, 0) == assignments[:1]
+    assignments.insert(0, assignments[-1])
+    assert not _filter_stmts(name, assignments, module, 0)
+
+
+def test_statement_index_of_other_lists() -> None:
+    module = parse("x = 1\nprint(x)\nx = 2\nx = 3")
+    name = module.body[1].value.args[0]
+    first, second, third = module.locals["x"]
+    for _ in range(10):
+        assert _filter_stmts(name, [first, third], module, 0) == [first]
+        assert not _filter_stmts(name, [second, third], module, 0)
@@ -0,0 +1,137 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Tests for the graph of the imports between modules."""
+
+from __future__ import annotations
+
+import gc
+import textwrap
+from pathlib import Path
+
+from astroid import builder, test_utils
+from astroid.import_graph import ImportGraph, imported_module_names
+from astroid.manager import AstroidManager
+from astroid.module_cache import ModuleCache
+
+
+def _graph(edges: dict[str, set[str]]) -> ImportGraph:
+    graph = ImportGraph()
+    for modname, imported in edges.items():
+        graph.add_module(modname, imported)
+    return graph
+
+
+def test_imported_module_names(tmp_path: Path) -> None:
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    path = package / "module.py"
+    path.write_text(
+        textwrap.dedent("""
+            import os.path
+            from . import sibling
+            from .sub import name as alias
+
+            def func():
+                import json
+            """),
+        encoding="utf-8",
+    )
+    module = builder.AstroidBuilder(test_utils.brainless_manager()).file_build(
+        str(path), "pkg.module"
+    )
+    assert imported_module_names(module) == {
+        "os",
+        "os.path",
+        "pkg",
+        "pkg.sibling",
+        "pkg.sub",
+        "pkg.sub.name",
+        "json",
+    }
+
+
+def test_edges() -> None:
+    graph = _graph({"a": {"b", "c", "os"}, "b": {"c"}, "c": set()})
+    # Names which are not modules of the graph are left out.
+    assert graph.imports("a") == {"b", "c"}
+    assert graph.importers("c") == {"a", "b"}
+    assert graph.dependencies("a") == {"b", "c"}
+    assert graph.dependents("c") == {"a", "b"}
+
+    graph.add_module("a", {"b"})
+    assert graph.importers("c") == {"b"}
+    graph.remove_module("b")
+    assert "b" not in graph
+    assert graph.imports("a") == set()
+    assert graph.importers("c") == set()
+
+
+def test_components_and_topological_order() -> None:
+    graph = _graph(
+        {
+            "app": {"models", "views"},
+            "views": {"models", "utils"},
+            "models": {"utils", "signals"},
+            "signals": {"models"},
+            "utils": set(),
+        }
+    )
+    components = graph.strongly_connected_components()
+    assert sorted(components, key=len)[-1] == {"models", "signals"}
+    assert len(components) == 4
+
+    order = graph.topological_order()
+    assert sorted(order) == sorted(graph)
+    for modname in order:
+        for imported in graph.imports(modname) - {"models", "signals"}:
+            assert order.index(imported) < order.index(modname)
+    assert abs(order.index("models") - order.index("signals")) == 1
+    assert graph.topological_order(["app", "utils", "unknown"]) == [
+        "unknown",
+        "utils",
+        "app",
+    ]
+
+
+def test_manager_records_imports() -> None:
+    manager = AstroidManager()
+    module = manager.ast_from_string(
+        "import collections\nfrom os import path\n", "graph_importer"
+    )
+    try:
+        assert "graph_importer" in manager.import_graph.importers("collections")
+        assert "os.path" in manager.import_graph._imports["graph_importer"]
+        manager.invalidate_module(module.name)
+        assert "graph_importer" not in manager.import_graph
+    finally:
+        manager.astroid_cache.pop("graph_importer", None)
+
+
+def test_manager_keeps_the_imports_of_the_cached_module() -> None:
+    manager = AstroidManager()
+    cached = manager.ast_from_string("import collections\n", "graph_duplicate")
+    try:
+        duplicate = manager.ast_from_string("import json\n", "graph_duplicate")
+        assert duplicate is not cached
+        assert manager.astroid_cache["graph_duplicate"] is cached
+        assert manager.import_graph._imports["graph_duplicate"] == {"collections"}
+    finally:
+        manager.astroid_cache.pop("graph_duplicate", None)
+
+
+def test_collected_evicted_modules_leave_the_graph() -> None:
+    graph = ImportGraph()
+    cache = ModuleCache(max_entries=1, on_discard=graph.remove_module)
+    for name in ("first", "second"):
+        module = builder.AstroidBuilder(test_utils.brainless_manager()).string_build(
+            "import os", name
+        )
+        cache[name] = module
+        graph.add_module(name, imported_module_names(module))
+    del module
+    gc.collect()
+    assert cache.evictions == 1
+    assert list(graph) == ["second"]
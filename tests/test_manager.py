@@ -2,15 +2,22 @@
 # For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
 # Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
 
+import concurrent.futures
 import os
+import random
 import re
 import sys
+import tempfile
+import threading
 import time
 import types
 import unittest
 import warnings
 from collections.abc import Iterator
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from typing import Any
 from unittest import mock
 
 import pytest
@@ -18,12 +25,13 @@ import pytest
 import astroid
 from astroid import manager, nodes, test_utils
 from astroid.const import IS_JYTHON, IS_PYPY, PY312_PLUS
+from astroid.context import _INFERENCE_CACHE, _in_trees
 from astroid.exceptions import (
     AstroidBuildingError,
     AstroidImportError,
     AttributeInferenceError,
 )
-from astroid.interpreter._import import util
+from astroid.interpreter._import import spec, util
 from astroid.modutils import EXT_LIB_DIRS, module_in_path
 from astroid.nodes import Const
 from astroid.nodes.scoped_nodes import ClassDef, Module
@@ -112,6 +120,51 @@ class AstroidManagerTest(resources.SysPathSetup, unittest.TestCase):
             AstroidBuildingError, self.manager.ast_from_file, "unhandledName"
         )
 
+    def test_ast_from_files(self) -> None:
+        # Imports are resolved by the shared manager.
+        manager = astroid.MANAGER
+        self.addCleanup(manager.clear_cache)
+        paths = [resources.find("data/module.py"), resources.find("data/module2.py")]
+        module, module2 = manager.ast_from_files(paths, workers=2)
+        self.assertEqual([module.name, module2.name], ["data.module", "data.module2"])
+        self.assertIs(manager.astroid_cache["data.module"], module)
+        self.assertIs(manager.astroid_cache["data.module2"], module2)
+        # Imports between the files resolve to the cached modules.
+        ancestors = module2["Specialization"].ancestors(recurs=False)
+        self.assertEqual(
+            {ancestor.root() for ancestor in ancestors if ancestor.name != "object"},
+            {module},
+        )
+        self.assertEqual(
+            manager.ast_from_files(paths[::-1], workers=2), [module2, module]
+        )
+
+    def test_ast_from_files_without_fork(self) -> None:
+        mgr = manager.AstroidManager.isolated()
+        paths = [resources.find("data/module.py"), resources.find("data/module2.py")]
+        with mock.patch.object(manager, "_can_fork", return_value=False):
+            module, module2 = mgr.ast_from_files(paths, workers=2)
+        self.assertEqual([module.name, module2.name], ["data.module", "data.module2"])
+        self.assertIs(mgr.astroid_cache["data.module"], module)
+
+    def test_ast_from_files_warns_about_unknown_transforms(self) -> None:
+        mgr = manager.AstroidManager.isolated()
+        mgr.register_transform(nodes.Const, lambda node: node)
+        paths = [resources.find("data/module.py"), resources.find("data/module2.py")]
+        with mock.patch.object(manager, "_can_fork", return_value=False):
+            with mock.patch("concurrent.futures.ProcessPoolExecutor") as pool:
+                with self.assertWarns(UserWarning):
+                    modules = mgr.ast_from_files(paths, workers=2)
+        pool.assert_not_called()
+        self.assertEqual(
+            [module.name for module in modules], ["data.module", "data.module2"]
+        )
+
+    def test_ast_from_files_reports_errors(self) -> None:
+        paths = [resources.find("data/module.py"), "unhandledName"]
+        with self.assertRaises(AstroidBuildingError):
+            self.manager.ast_from_files(paths, workers=2)
+
     def test_ast_from_string(self) -> None:
         filepath = unittest.__file__
         dirname = os.path.dirname(filepath)
@@ -498,29 +551,120 @@ class BorgAstroidManagerTC(unittest.TestCase):
         self.assertEqual(manager.AstroidManager.brain["max_inferable_values"], 4)
 
 
+class IndependentManagersTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.projects = []
+        for value in ("1", "'one'"):
+            # pylint: disable-next=consider-using-with
+            tmp_dir = tempfile.TemporaryDirectory()
+            self.addCleanup(tmp_dir.cleanup)
+            with open(
+                os.path.join(tmp_dir.name, "tenant.py"), "w", encoding="utf-8"
+            ) as stream:
+                stream.write(f"VALUE = {value}\n")
+            self.projects.append(tmp_dir.name)
+        self.first = manager.AstroidManager.isolated()
+        self.second = manager.AstroidManager.isolated()
+        self.first.search_path = [self.projects[0]]
+        self.second.search_path = [self.projects[1]]
+
+    @staticmethod
+    def _infer_value(mgr: manager.AstroidManager, activate: bool = True) -> object:
+        module = mgr.ast_from_string("import tenant\ntenant.VALUE * 1", "tenant_user")
+        with mgr.activate() if activate else nullcontext():
+            return next(module.body[1].value.infer()).value
+
+    def test_separate_caches(self) -> None:
+        self.assertEqual(self._infer_value(self.first), 1)
+        self.assertEqual(self._infer_value(self.second), "one")
+        first_tenant = self.first.astroid_cache["tenant"]
+        self.assertIsNot(first_tenant, self.second.astroid_cache["tenant"])
+        self.assertNotIn("tenant", astroid.MANAGER.astroid_cache)
+        # Each manager stays warm while the other one is used.
+        self.assertIs(self.first.ast_from_module_name("tenant"), first_tenant)
+        self.assertIs(self.first.builtins_module, astroid.MANAGER.builtins_module)
+        self.assertIs(self.second.builtins_module, astroid.MANAGER.builtins_module)
+
+    def test_search_path_finds_builtin_modules(self) -> None:
+        found = self.first.file_from_module_name("sys", None)
+        self.assertEqual(found.type.name, "C_BUILTIN")
+
+    def test_search_path_finds_installed_modules(self) -> None:
+        module = self.first.ast_from_string(
+            "import collections\ncollections.OrderedDict()", "tenant_user"
+        )
+        with self.first.activate():
+            inferred = next(module.body[1].value.infer())
+        self.assertEqual(inferred.qname(), "collections.OrderedDict")
+        self.assertIn("collections", self.first.astroid_cache)
+
+    def test_nodes_import_through_their_manager(self) -> None:
+        default_modules = set(astroid.MANAGER.astroid_cache)
+        self.assertEqual(self._infer_value(self.first, activate=False), 1)
+        self.assertEqual(self._infer_value(self.second, activate=False), "one")
+        self.assertIs(
+            manager.AstroidManager.owner_of(self.first.astroid_cache["tenant"])._brain,
+            self.first._brain,
+        )
+        self.assertLessEqual(set(astroid.MANAGER.astroid_cache), default_modules)
+
+    def test_separate_settings(self) -> None:
+        self.first.max_inferable_values = 4
+        self.first.module_denylist.add("tenant")
+        self.assertEqual(self.second.max_inferable_values, 100)
+        self.assertEqual(astroid.MANAGER.max_inferable_values, 100)
+        self.assertNotIn("tenant", self.second.module_denylist)
+        with self.first.activate():
+            self.assertEqual(manager.AstroidManager().max_inferable_values, 4)
+        self.assertEqual(manager.AstroidManager().max_inferable_values, 100)
+
+    def test_clear_cache(self) -> None:
+        self._infer_value(self.first)
+        self._infer_value(self.second)
+        second_tenant = self.second.astroid_cache["tenant"]
+        builtins_module = astroid.MANAGER.builtins_module
+
+        first_user = self.first.astroid_cache["tenant_user"]
+
+        self.first.clear_cache()
+        self.assertNotIn("tenant", self.first.astroid_cache)
+        self.assertFalse(
+            any(
+                _in_trees(value, {first_user})
+                for key in _INFERENCE_CACHE
+                for value in (key[0], key[3], *_INFERENCE_CACHE[key])
+            )
+        )
+        self.assertIs(self.first.builtins_module, builtins_module)
+        self.assertIs(self.second.astroid_cache["tenant"], second_tenant)
+        roots = {key[0].root() for key in astroid.context._INFERENCE_CACHE}
+        self.assertIn(self.second.astroid_cache["tenant_user"], roots)
+        self.assertEqual(self._infer_value(self.first), 1)
+
+
 class ClearCacheTest(unittest.TestCase):
     def test_clear_cache_clears_other_lru_caches(self) -> None:
         lrus = (
-            astroid.nodes._base_nodes.LookupMixIn.lookup,
             astroid.modutils._cache_normalize_path_,
             util.is_namespace,
-            astroid.interpreter.objectmodel.ObjectModel.attributes,
-            ClassDef._metaclass_lookup_attribute,
         )
+        memos = astroid.MANAGER.memos.values()
 
         # Get a baseline for the size of the cache after simply calling bootstrap()
         baseline_cache_infos = [lru.cache_info() for lru in lrus]
+        baseline_memo_infos = [memo.info() for memo in memos]
 
         # Generate some hits and misses
         module = Module("", file="", path=[], package=False)
-        ClassDef(
+        cls = ClassDef(
             "",
             lineno=0,
             col_offset=0,
             end_lineno=0,
             end_col_offset=0,
             parent=module,
-        ).lookup("garbage")
+        )
+        cls.lookup("garbage")
         module_in_path("unittest", "garbage_path")
         util.is_namespace("unittest")
         astroid.interpreter.objectmodel.ObjectModel().attributes()
@@ -544,10 +688,13 @@ class ClearCacheTest(unittest.TestCase):
                     incremented_cache.hits + incremented_cache.misses,
                     baseline_cache.hits + baseline_cache.misses,
                 )
+        for memo, baseline_info in zip(memos, baseline_memo_infos):
+            with self.subTest(memo=memo):
+                self.assertGreater(sum(memo.info()), sum(baseline_info))
 
         astroid.MANAGER.clear_cache()  # also calls bootstrap()
 
-        self.assertEqual(astroid.context._INFERENCE_CACHE, {})
+        self.assertEqual(len(astroid.context._INFERENCE_CACHE), 0)
 
         # The cache sizes are now as low or lower than the original baseline
         cleared_cache_infos = [lru.cache_info() for lru in lrus]
@@ -558,6 +705,12 @@ class ClearCacheTest(unittest.TestCase):
                 # less equal because the "baseline" might have had multiple calls to bootstrap()
                 self.assertLessEqual(cleared_cache.currsize, baseline_cache.currsize)
 
+        # The results memoized before are not used anymore
+        lookup_memo = astroid.MANAGER.memos["lookup"]
+        misses = lookup_memo.misses
+        cls.lookup("garbage")
+        self.assertEqual(lookup_memo.misses, misses + 1)
+
     def test_file_cache_after_clear_cache(self) -> None:
         """Test to mimic the behavior of how pylint lints file and
         ensure clear cache clears everything stored in the cache.
@@ -604,6 +757,396 @@ class ClearCacheTest(unittest.TestCase):
         self.assertIs(inferred.value, True)
 
 
+class InvalidateModuleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = manager.AstroidManager()
+        self.addCleanup(self.manager.clear_cache)
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        sys.path.insert(0, tmp_dir.name)
+        self.addCleanup(sys.path.remove, tmp_dir.name)
+        self.base_path = os.path.join(tmp_dir.name, "invalidated_base.py")
+        self._write(
+            self.base_path, "class Base:\n    def value(self):\n        return 1\n"
+        )
+        self._write(
+            os.path.join(tmp_dir.name, "invalidated_user.py"),
+            "from invalidated_base import Base\n"
+            "class Child(Base):\n"
+            "    def setup(self):\n"
+            "        self.child_attr = 1\n"
+            "base = Base()\n"
+            "base.user_attr = 2\n"
+            "value = Child().value()\n",
+        )
+        self._write(
+            os.path.join(tmp_dir.name, "invalidated_other.py"), "other = 1 + 1\n"
+        )
+
+    @staticmethod
+    def _write(path: str, source: str) -> None:
+        with open(path, "w", encoding="utf-8") as stream:
+            stream.write(source)
+        # Make sure the change is seen even with a coarse mtime resolution.
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_invalidate_module(self) -> None:
+        base = self.manager.ast_from_module_name("invalidated_base")
+        user = self.manager.ast_from_module_name("invalidated_user")
+        other = self.manager.ast_from_module_name("invalidated_other")
+        self.assertEqual(next(user["value"].infer()).value, 1)
+        self.assertEqual(next(other["other"].infer()).value, 2)
+        self.assertIn("user_attr", base["Base"].instance_attrs)
+        lookup = self.manager.memos["lookup"]
+        other["other"].lookup("other")
+
+        with mock.patch.object(nodes.NodeNG, "infer") as infer:
+            self.manager.invalidate_module("invalidated_user")
+        infer.assert_not_called()
+        self.assertNotIn("invalidated_user", self.manager.astroid_cache)
+        self.assertIs(self.manager.astroid_cache["invalidated_base"], base)
+        # Assignments to other modules are unregistered.
+        self.assertNotIn("user_attr", base["Base"].instance_attrs)
+        # Other modules stay warm.
+        roots = {key[0].root() for key in astroid.context._INFERENCE_CACHE}
+        self.assertIn(other, roots)
+        self.assertNotIn(user, roots)
+        hits = lookup.hits
+        other["other"].lookup("other")
+        self.assertEqual(lookup.hits, hits + 1)
+
+    def test_reload_file(self) -> None:
+        self.manager.ast_from_module_name("invalidated_base")
+        user = self.manager.ast_from_module_name("invalidated_user")
+        self.assertEqual(next(user["value"].infer()).value, 1)
+
+        self._write(
+            self.base_path, "class Base:\n    def value(self):\n        return 2\n"
+        )
+        base = self.manager.reload_file(self.base_path)
+        self.assertIs(self.manager.astroid_cache["invalidated_base"], base)
+        # Inference results of the importers were dropped.
+        self.assertEqual(next(user["value"].infer()).value, 2)
+        # Assignments of the importers are registered on the new module.
+        self.assertIn("user_attr", base["Base"].instance_attrs)
+
+
+class InterfaceBuildTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = manager.AstroidManager()
+        self.addCleanup(self.manager.clear_cache)
+        self.addCleanup(setattr, self.manager, "project_roots", ())
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        self.project = os.path.join(tmp_dir.name, "project")
+        self.dependency = os.path.join(tmp_dir.name, "dependency")
+        for directory in (self.project, self.dependency):
+            os.mkdir(directory)
+            with open(
+                os.path.join(directory, "module.py"), "w", encoding="utf-8"
+            ) as stream:
+                stream.write("def function(arg: int) -> int:\n    return arg\n")
+
+    def test_builds_interface(self) -> None:
+        self.assertFalse(self.manager.builds_interface(self.dependency))
+        self.manager.project_roots = [self.project]
+        self.assertFalse(self.manager.builds_interface(self.project))
+        self.assertFalse(
+            self.manager.builds_interface(os.path.join(self.project, "module.py"))
+        )
+        self.assertTrue(
+            self.manager.builds_interface(os.path.join(self.dependency, "module.py"))
+        )
+        self.assertTrue(self.manager.builds_interface(self.project + "_other"))
+        self.assertFalse(self.manager.builds_interface(None))
+
+    def test_modules_outside_of_project_built_as_interfaces(self) -> None:
+        self.manager.project_roots = [self.project]
+        project = self.manager.ast_from_file(
+            os.path.join(self.project, "module.py"), "project_module"
+        )
+        dependency = self.manager.ast_from_file(
+            os.path.join(self.dependency, "module.py"), "dependency_module"
+        )
+        self.assertIsNone(project["function"]._lazy_body)
+        function = dependency["function"]
+        self.assertIsNotNone(function._lazy_body)
+        self.assertEqual(function.args.annotations[0].name, "int")
+        # The body is built when walked into.
+        self.assertIsInstance(function.body[0], nodes.Return)
+        self.assertIsNone(function._lazy_body)
+
+
+class InferManyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = manager.AstroidManager()
+        self.addCleanup(self.manager.clear_cache)
+        self.module = self.manager.ast_from_string(
+            "import collections\n"
+            "class A:\n"
+            "    def method(self):\n"
+            "        return 1 + 2\n"
+            "a = A()\n"
+            "a.method()\n"
+            "a.method\n"
+            "collections.OrderedDict\n"
+            "''.join([])\n"
+            "undefined\n",
+            "infer_many_module",
+        )
+        self.nodes = list(
+            self.module.nodes_of_class((nodes.Call, nodes.Attribute, nodes.Name))
+        )
+
+    @staticmethod
+    def _proxied_node(value):
+        while not isinstance(value, nodes.NodeNG):
+            value = value._proxied
+        return value
+
+    def _assert_same_results(self, results: list) -> None:
+        self.assertEqual(len(results), len(self.nodes))
+        for node, result in zip(self.nodes, results):
+            expected = astroid.util.safe_infer(node)
+            with self.subTest(node=node.as_string()):
+                self.assertIs(type(result), type(expected))
+                if isinstance(expected, Const):
+                    self.assertEqual(result.value, expected.value)
+                    self.assertIs(result.parent, expected.parent)
+                elif expected is not None:
+                    # Instances and bound methods are created by each inference.
+                    self.assertIs(
+                        self._proxied_node(result), self._proxied_node(expected)
+                    )
+
+    @pytest.mark.skipif(
+        not hasattr(os, "fork"), reason="Workers are forked from this process"
+    )
+    def test_infer_many_in_workers(self) -> None:
+        with mock.patch(
+            "concurrent.futures.ProcessPoolExecutor",
+            wraps=concurrent.futures.ProcessPoolExecutor,
+        ) as pool:
+            self._assert_same_results(self.manager.infer_many(self.nodes, workers=2))
+        pool.assert_called_once()
+
+    def test_infer_many_in_process(self) -> None:
+        self._assert_same_results(self.manager.infer_many(self.nodes, workers=1))
+
+    @pytest.mark.skipif(
+        not hasattr(os, "fork"), reason="Workers are forked from this process"
+    )
+    def test_infer_many_same_as_serial(self) -> None:
+        module = self.manager.ast_from_string(
+            "import sys\n"
+            "class A:\n"
+            "    pass\n"
+            "class B(A):\n"
+            "    pass\n"
+            "A.mro()\n"
+            "B.mro()\n"
+            "getattr(sys, 'maxsize', 0)\n"
+            "getattr(sys, 'maxsize', 0)\n",
+            "infer_many_serial_module",
+        )
+        calls = list(module.nodes_of_class(nodes.Call))
+
+        def describe(result):
+            if isinstance(result, nodes.Tuple):
+                return [self._proxied_node(elt) for elt in result.elts]
+            return (result, result.lineno, result.col_offset)
+
+        # Described right away, as inference in this process may change them.
+        parallel = [describe(value) for value in self.manager.infer_many(calls, 2)]
+        serial = [describe(astroid.util.safe_infer(call)) for call in calls]
+        self.assertEqual(parallel, serial)
+
+    @pytest.mark.skipif(
+        not hasattr(os, "fork"), reason="Workers are forked from this process"
+    )
+    def test_infer_many_from_threads(self) -> None:
+        halves = [self.nodes[::2], self.nodes[1::2]]
+        with mock.patch("concurrent.futures.ProcessPoolExecutor") as pool:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(
+                    executor.map(lambda half: self.manager.infer_many(half, 2), halves)
+                )
+        # Forking while the other thread holds a lock would deadlock the workers.
+        pool.assert_not_called()
+        for half, half_results in zip(halves, results):
+            for node, result in zip(half, half_results):
+                expected = astroid.util.safe_infer(node)
+                with self.subTest(node=node.as_string()):
+                    self.assertIs(type(result), type(expected))
+
+
+class ConcurrentInferenceTest(unittest.TestCase):
+    """Threads inferring the same modules at the same time, from empty caches."""
+
+    SOURCE = """
+import argparse
+import collections
+import textwrap
+from functools import partial
+
+class Base:
+    def method(self):
+        return textwrap.dedent("  text")
+
+class Child(Base, collections.OrderedDict):
+    Point = collections.namedtuple("Point", "x y")
+
+    def other(self, value=1):
+        return self.method(), value + 1
+
+child = Child()
+child.method()
+child.other()
+child.Point(1, 2).y
+Child.mro()
+parser = argparse.ArgumentParser()
+parser.add_argument("--flag")
+partial(len, "abc")()
+[number * 2 for number in range(3)]
+"""
+
+    def setUp(self) -> None:
+        self.manager = manager.AstroidManager()
+        self.manager.clear_cache()
+        self.addCleanup(self.manager.clear_cache)
+        self.manager.lazy_function_bodies = True
+        self.addCleanup(setattr, self.manager, "lazy_function_bodies", False)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+        self.addCleanup(sys.setswitchinterval, interval)
+        self.module = self.manager.ast_from_string(self.SOURCE, "concurrent_module")
+        self.nodes = list(
+            self.module.nodes_of_class((nodes.Call, nodes.Attribute, nodes.Name))
+        )
+
+    @staticmethod
+    def _summary(value):
+        if value is None or isinstance(value, astroid.util.UninferableBase):
+            return value
+        if isinstance(value, Const):
+            return (Const, value.value)
+        while not isinstance(value, nodes.NodeNG):
+            value = value._proxied
+        return (type(value), value.qname() if hasattr(value, "qname") else value)
+
+    def test_concurrent_inference(self) -> None:
+        threads = 8
+        barrier = threading.Barrier(threads)
+
+        def infer_all(seed: int) -> dict[nodes.NodeNG, object]:
+            order = list(self.nodes)
+            random.Random(seed).shuffle(order)
+            barrier.wait()
+            return {
+                node: self._summary(astroid.util.safe_infer(node)) for node in order
+            }
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(infer_all, range(threads)))
+
+        expected = {
+            node: self._summary(astroid.util.safe_infer(node)) for node in self.nodes
+        }
+        for result in results:
+            self.assertEqual(result, expected)
+
+
+class ConcurrentImportResolutionTest(unittest.TestCase):
+    """Threads resolving imports relative to different context files."""
+
+    def setUp(self) -> None:
+        self.manager = manager.AstroidManager()
+        self.manager.clear_cache()
+        self.addCleanup(self.manager.clear_cache)
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        self.context_files = []
+        for index in range(16):
+            directory = os.path.join(tmp_dir.name, f"project_{index}")
+            os.mkdir(directory)
+            for name, source in (
+                ("context_sibling.py", f"VALUE = {index}\n"),
+                (f"context_sibling_{index}.py", f"VALUE = {index}\n"),
+                ("context_user.py", "import context_sibling\n"),
+            ):
+                with open(
+                    os.path.join(directory, name), "w", encoding="utf-8"
+                ) as stream:
+                    stream.write(source)
+            self.context_files.append(os.path.join(directory, "context_user.py"))
+
+    def test_concurrent_resolution(self) -> None:
+        threads = 8
+        barrier = threading.Barrier(threads)
+        cwd = os.getcwd()
+
+        def resolve(context_file: str) -> tuple[str | None, str | None]:
+            barrier.wait()
+            found = self.manager.file_from_module_name("context_sibling", context_file)
+            index = os.path.basename(os.path.dirname(context_file)).split("_")[1]
+            module = self.manager.ast_from_module_name(
+                f"context_sibling_{index}", context_file
+            )
+            return found.location, module.file
+
+        with mock.patch.object(os, "chdir", side_effect=AssertionError):
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                results = list(executor.map(resolve, self.context_files))
+
+        self.assertEqual(os.getcwd(), cwd)
+        for context_file, (location, module_file) in zip(self.context_files, results):
+            directory = os.path.dirname(context_file)
+            self.assertEqual(os.path.dirname(location), directory)
+            self.assertEqual(os.path.dirname(module_file), directory)
+
+    def test_imports_resolved_in_parallel(self) -> None:
+        threads = 4
+        barrier = threading.Barrier(threads, timeout=10)
+        file_info_from_modpath = manager.file_info_from_modpath
+
+        def resolve_together(*args: Any, **kwargs: Any) -> spec.ModuleSpec:
+            # Breaks if the threads cannot all be resolving at the same time.
+            barrier.wait()
+            return file_info_from_modpath(*args, **kwargs)
+
+        with mock.patch.object(
+            manager, "file_info_from_modpath", side_effect=resolve_together
+        ):
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                modules = list(
+                    executor.map(
+                        partial(self.manager.ast_from_module_name, "context_sibling"),
+                        self.context_files[:threads],
+                    )
+                )
+        self.assertEqual({module.name for module in modules}, {"context_sibling"})
+
+    def test_relative_search_path_entry(self) -> None:
+        directory = os.path.dirname(self.context_files[0])
+        os.mkdir(os.path.join(directory, "relative"))
+        with open(
+            os.path.join(directory, "relative", "relative_module.py"),
+            "w",
+            encoding="utf-8",
+        ) as stream:
+            stream.write("VALUE = 1\n")
+        sys.path.append("relative")
+        self.addCleanup(sys.path.remove, "relative")
+
+        module = self.manager.ast_from_module_name(
+            "relative_module", self.context_files[0]
+        )
+        self.assertEqual(
+            module.file, os.path.join(directory, "relative", "relative_module.py")
+        )
+
+
 class NamespacePthParserTest(unittest.TestCase):
     """Direct coverage for the .pth parsing helpers used by namespace tests."""
 
@@ -0,0 +1,82 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+import concurrent.futures
+import gc
+import weakref
+
+from astroid import MANAGER, extract_node, parse
+from astroid.context import InferenceContext
+from astroid.memo import MemoInfo, NodeMemo
+
+
+def test_lookup_memoized_on_node() -> None:
+    name = extract_node("x = 1\nx #@")
+    memo = MANAGER.memos["lookup"]
+    info = memo.info()
+    first = name.lookup("x")
+    assert name.lookup("x") is first
+    assert memo.info() == MemoInfo(info.hits + 1, info.misses + 1)
+    assert name._memo_results[memo, ("x",)] is first
+    assert "_memo_lookup" not in name.__dict__
+
+
+def test_memoized_results_released_with_tree() -> None:
+    module = parse("def f(): pass\nf")
+    module.body[-1].value.lookup("f")
+    ref = weakref.ref(module)
+    del module
+    gc.collect()
+    assert ref() is None
+
+
+def test_invalidate_ignores_previous_results() -> None:
+    memo = NodeMemo("test")
+    obj = type("Obj", (), {})()
+    memo.set(obj, "key", 1)
+    assert memo.get(obj, "key") == 1
+    memo.invalidate()
+    assert memo.get(obj, "key") != 1
+    assert memo.info() == MemoInfo(1, 1)
+    memo.clear()
+    assert memo.info() == MemoInfo(0, 0)
+
+
+def test_metaclass_lookup_memo_bounded() -> None:
+    cls = extract_node("class Meta(type):\n    attr = 1\nclass A(metaclass=Meta): pass")
+    for _ in range(10):
+        cls.getattr("attr", context=InferenceContext(), class_context=True)
+        cls.getattr("attr", class_context=True)
+    memo = MANAGER.memos["metaclass_lookup_attribute"]
+    assert (
+        len([key for key in cls._memo_results if type(key) is tuple and key[0] is memo])
+        == 1
+    )
+
+
+def test_invalidate_roots_drops_results_of_their_trees() -> None:
+    memo = NodeMemo("test")
+    first = extract_node("x = 1\nx #@")
+    second = extract_node("y = 1\ny #@")
+    memo.set(first, "key", 1)
+    memo.set(second, "key", 2)
+    memo.invalidate([first.root()])
+    assert memo.get(first, "key") != 1
+    assert memo.get(second, "key") == 2
+
+
+def test_counters_of_threads_add_up() -> None:
+    memo = NodeMemo("test")
+    obj = type("Obj", (), {})()
+    memo.set(obj, "key", 1)
+
+    def get() -> None:
+        for _ in range(10_000):
+            memo.get(obj, "key")
+            memo.get(obj, "other")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [executor.submit(get) for _ in range(8)]:
+            future.result()
+    assert memo.info() == MemoInfo(80_000, 80_000)
@@ -0,0 +1,106 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Tests for the bounded cache of modules."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+
+from astroid import builder, nodes, test_utils
+from astroid.module_cache import ModuleCache, estimate_module_size
+
+
+def _module(name: str, lines: int = 1) -> nodes.Module:
+    return builder.AstroidBuilder(test_utils.brainless_manager()).string_build(
+        "x = 1\n" * lines, name
+    )
+
+
+def _module_with_classes(name: str) -> nodes.Module:
+    return builder.AstroidBuilder(test_utils.brainless_manager()).string_build(
+        "class B: pass\nclass C(B): pass\nx = C()\nx\n", name
+    )
+
+
+def test_unbounded_by_default() -> None:
+    cache = ModuleCache()
+    modules = [_module(f"mod{index}") for index in range(10)]
+    for module in modules:
+        cache[module.name] = module
+    assert len(cache) == 10
+    assert cache.evictions == 0
+    assert list(cache) == [module.name for module in modules]
+
+
+def test_evicts_least_recently_used() -> None:
+    cache = ModuleCache(max_entries=2)
+    first, second, third = (_module(name) for name in ("first", "second", "third"))
+    cache["first"] = first
+    cache["second"] = second
+    assert cache["first"] is first
+    cache["third"] = third
+    assert cache.evictions == 1
+    assert list(cache._modules) == ["first", "third"]
+
+
+def test_evicted_modules_are_kept_while_alive() -> None:
+    cache = ModuleCache(max_entries=1)
+    cache["first"] = first = _module("first")
+    cache["second"] = _module("second")
+    assert cache.evictions == 1
+    # Still referenced, so the same module is found again.
+    assert "first" in cache
+    assert cache["first"] is first
+    assert cache.evictions == 2
+
+    del first
+    gc.collect()
+    assert "second" not in cache
+    assert cache.get("second") is None
+
+
+def test_memory_budget() -> None:
+    small, big = _module("small", lines=10), _module("big", lines=100)
+    cache = ModuleCache(max_memory=estimate_module_size(big))
+    cache["small"] = small
+    cache["big"] = big
+    assert cache.evictions == 1
+    assert list(cache._modules) == ["big"]
+    assert cache.memory == estimate_module_size(big)
+
+    cache.max_memory = None
+    cache["small"] = small
+    assert cache.memory == estimate_module_size(small) + estimate_module_size(big)
+
+
+def test_pinned_modules_are_not_evicted() -> None:
+    cache = ModuleCache()
+    cache["builtins"] = _module("builtins")
+    cache["pinned"] = _module("pinned")
+    cache.pin("pinned")
+    cache["other"] = _module("other")
+    cache.max_entries = 1
+    assert list(cache._modules) == ["builtins", "pinned"]
+    assert cache.evictions == 1
+
+    cache.unpin("pinned")
+    cache.unpin("builtins")
+    cache["other"] = _module("other")
+    assert list(cache._modules) == ["builtins"]
+
+
+def test_evicted_modules_are_freed() -> None:
+    cache = ModuleCache(max_entries=1)
+    cache["first"] = first = _module_with_classes("first")
+    for node in first.nodes_of_class(nodes.Name):
+        node.inferred()
+    first["C"].mro()
+    ref = weakref.ref(first)
+    cache["second"] = _module("second")
+    del first, node
+    gc.collect()
+    assert ref() is None
+    assert "first" not in cache
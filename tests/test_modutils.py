@@ -13,6 +13,7 @@ import tempfile
 import unittest
 import xml
 from pathlib import Path
+from unittest import mock
 from xml.etree import ElementTree
 
 import pytest
@@ -336,6 +337,74 @@ class FileFromModPathTest(resources.SysPathSetup, unittest.TestCase):
         modutils.file_from_modpath(["data", "unicode_package", "core"])
 
 
+class DirectoryListingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(tmp_dir.cleanup)
+        self.directory = tmp_dir.name
+        os.mkdir(os.path.join(self.directory, "listed_package"))
+        self._touch("listed_package", "__init__.py")
+        self._touch("listed_module.py")
+        self._age(self.directory)
+        spec.clear_directory_listings()
+        self.addCleanup(spec.clear_directory_listings)
+
+    def _touch(self, *parts: str) -> None:
+        with open(os.path.join(self.directory, *parts), "w", encoding="utf-8"):
+            pass
+
+    @staticmethod
+    def _age(path: str, seconds: int = 10) -> None:
+        stat = os.stat(path)
+        os.utime(
+            path,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000),
+        )
+
+    def _find(self, modname: str) -> spec.ModuleSpec | None:
+        return spec.ImportlibFinder.find_module.__wrapped__(
+            modname, (modname,), (), (self.directory,)
+        )
+
+    def test_find_module(self) -> None:
+        found = self._find("listed_package")
+        self.assertEqual(found.type, spec.ModuleType.PKG_DIRECTORY)
+        self.assertEqual(found.location, os.path.join(self.directory, "listed_package"))
+        found = self._find("listed_module")
+        self.assertEqual(found.type, spec.ModuleType.PY_SOURCE)
+        self.assertEqual(
+            found.location, os.path.join(self.directory, "listed_module.py")
+        )
+        self.assertIsNone(self._find("unlisted_module"))
+
+    def test_directory_listed_once(self) -> None:
+        with mock.patch.object(spec.os, "scandir", wraps=os.scandir) as scandir:
+            self._find("listed_module")
+            self._find("unlisted_module")
+            self._find("listed_module")
+        self.assertEqual(scandir.call_count, 1)
+
+    def test_listing_refreshed(self) -> None:
+        self.assertIsNone(self._find("unlisted_module"))
+        stat = os.stat(self.directory)
+        self._touch("unlisted_module.py")
+        # The directory is only listed again once its modification time changes.
+        os.utime(self.directory, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertIsNone(self._find("unlisted_module"))
+        os.utime(self.directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        found = self._find("unlisted_module")
+        self.assertEqual(found.type, spec.ModuleType.PY_SOURCE)
+
+    def test_recently_modified_directory_listed_again(self) -> None:
+        self._touch("recent_module.py")
+        stat = os.stat(self.directory)
+        self.assertIsNotNone(self._find("recent_module"))
+        self._touch("unlisted_module.py")
+        os.utime(self.directory, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        found = self._find("unlisted_module")
+        self.assertEqual(found.type, spec.ModuleType.PY_SOURCE)
+
+
 class GetSourceFileTest(unittest.TestCase):
     def test(self) -> None:
         filename = _get_file_from_object(os.path)
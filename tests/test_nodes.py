@@ -2411,3 +2411,101 @@ def test_self_inferring_nodes_have_a_type() -> None:
         ]
 
     assert not missing
+
+
+@pytest.mark.skipif(not PY311_PLUS, reason="Needs object.__getstate__")
+def test_nodes_store_their_fields_in_slots() -> None:
+    """Node fields live in slots, and the ``__dict__`` is only created for
+    other attributes, such as cached properties.
+    """
+    node = extract_node("a.b(c, 1) #@")
+    for child in (node, node.func, node.func.expr, *node.args):
+        dict_state, slots_state = object.__getstate__(child)
+        assert dict_state is None
+        assert slots_state["parent"] is child.parent
+    node.other = 1
+    assert node.__dict__ == {"other": 1}
+    copied = copy.copy(node)
+    assert copied.func is node.func and copied.other == 1
+
+
+CLONED_CODE = """
+import os
+
+class Counter:
+    start = os.sep
+
+    def __init__(self, step=1):
+        self.count = 0
+        self.step = step
+
+    def increment(self):
+        total = self.count + self.step
+        return total
+"""
+
+
+def test_clone_copies_the_tree() -> None:
+    module = builder.parse(CLONED_CODE)
+    klass = module["Counter"]
+    clone = klass.clone()
+
+    assert clone.as_string() == klass.as_string()
+    assert clone.parent is module
+    assert clone.root() is module
+    originals = list(klass.nodes_of_class(nodes.NodeNG))
+    copies = list(clone.nodes_of_class(nodes.NodeNG))
+    assert [type(node) for node in copies] == [type(node) for node in originals]
+    assert not {id(node) for node in copies} & {id(node) for node in originals}
+    for original, copy_ in zip(originals, copies):
+        for attr in (
+            "position",
+            "lineno",
+            "col_offset",
+            "end_lineno",
+            "end_col_offset",
+        ):
+            assert getattr(copy_, attr) == getattr(original, attr)
+        for child in copy_.get_children():
+            assert child.parent is copy_
+
+    assert clone.locals["increment"] == [clone.body[2]]
+    assert [attr.parent for attr in clone.instance_attrs["count"]] == [
+        clone.body[1].body[0]
+    ]
+    increment = clone.body[2]
+    assert increment.locals["total"] == [increment.body[0].targets[0]]
+    # Nodes outside of the clone are shared: the import is that of the module.
+    assert clone.body[0].value.expr.lookup("os")[1] == module.locals["os"]
+
+    clone.locals["extra"] = []
+    clone.body.pop()
+    assert "extra" not in klass.locals
+    assert len(klass.body) == 3
+
+
+def test_clone_keeps_inference_tips() -> None:
+    call = extract_node("f(1)")
+    call._explicit_inference = lambda node, context=None: iter([nodes.Const(2)])
+    clone = call.clone()
+    assert clone._explicit_inference is call._explicit_inference
+    assert next(clone.infer()).value == 2
+
+
+def test_clone_parent() -> None:
+    function = extract_node("def method(self, value): return value")
+    owner = extract_node("class Owner: pass")
+    clone = function.clone(parent=owner)
+    assert clone.parent is owner
+    assert clone.is_method()
+    assert clone.body[0].value.lookup("value")[1] == [clone.args.args[1]]
+
+
+def test_shallow_clone() -> None:
+    function = extract_node("def method(self, value): return value")
+    clone = function.clone(deep=False)
+    assert clone is not function
+    assert clone.args is function.args
+    assert clone.body is not function.body and clone.body == function.body
+    assert clone.body[0].parent is function
+    assert clone.locals == function.locals and clone.locals is not function.locals
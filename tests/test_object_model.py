@@ -2,6 +2,7 @@
 # For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
 # Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
 
+import concurrent.futures
 import unittest
 import xml
 
@@ -1097,3 +1098,27 @@ def test_getattr_on_property_fset_with_annassign_does_not_crash() -> None:
             getattr(Base.x, "fset", None)  #@
     """)
     next(node.infer())
+
+
+def test_instance_of_model_kept_per_thread() -> None:
+    first, second = builder.extract_node("""
+    def first(): pass
+    def second(): pass
+    first #@
+    second #@
+    """)
+    first, second = next(first.infer()), next(second.infer())
+    model = first.special_attributes
+    assert model._instance is first
+
+    def access() -> tuple[object, object]:
+        before = model._instance
+        return before, second.special_attributes._instance
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        before, after = executor.submit(access).result()
+    # The thread did not see the instance of this one, and did not change it.
+    assert before is None
+    assert after is second
+    assert model._instance is first
+    assert second.special_attributes is model
@@ -0,0 +1,288 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Tests for the on-disk module cache."""
+
+# pylint: disable=redefined-outer-name
+
+from __future__ import annotations
+
+import os
+import textwrap
+from collections.abc import Iterator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from astroid import extract_node, nodes
+from astroid.exceptions import AstroidImportError
+from astroid.manager import AstroidManager
+from astroid.persistent_cache import PersistentModuleCache, transforms_fingerprint
+from astroid.raw_building import InspectBuilder
+
+SOURCE = textwrap.dedent("""
+    import collections
+
+    class Point:
+        def __init__(self, x):
+            self.x = x
+
+    Pair = collections.namedtuple("Pair", "left right")
+    point = Point(1)
+    """)
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> Iterator[AstroidManager]:
+    mgr = AstroidManager()
+    mgr.persistent_cache_dir = tmp_path / "cache"
+    try:
+        yield mgr
+    finally:
+        mgr.persistent_cache_dir = None
+        mgr.clear_cache()
+
+
+@pytest.fixture
+def module_file(tmp_path: Path) -> Path:
+    path = tmp_path / "cached_module.py"
+    path.write_text(SOURCE, encoding="utf-8")
+    return path
+
+
+def _build(manager: AstroidManager, path: Path) -> nodes.Module:
+    manager.astroid_cache.pop("cached_module", None)
+    return manager.ast_from_file(str(path), "cached_module")
+
+
+def test_hit_skips_parsing_and_transforms(
+    manager: AstroidManager, module_file: Path
+) -> None:
+    built = _build(manager, module_file)
+    cache = manager.persistent_cache
+    assert cache is not None
+    assert cache.misses == 1
+
+    with (
+        mock.patch("astroid.builder._parse_source") as parse,
+        mock.patch.object(manager._transform, "visit") as visit,
+    ):
+        loaded = _build(manager, module_file)
+    parse.assert_not_called()
+    visit.assert_not_called()
+    assert cache.hits == 1
+    assert loaded is not built
+    assert manager.astroid_cache["cached_module"] is loaded
+    assert loaded.as_string() == built.as_string()
+
+
+def test_loaded_module_infers(manager: AstroidManager, module_file: Path) -> None:
+    _build(manager, module_file)
+    loaded = _build(manager, module_file)
+    assert manager.persistent_cache.hits == 1
+
+    point = next(loaded["point"].infer())
+    assert point.name == "Point"
+    assert [n.attrname for n in point.instance_attrs["x"]] == ["x"]
+    # The namedtuple brain tip survived the round trip.
+    pair = next(loaded["Pair"].infer())
+    assert isinstance(pair, nodes.ClassDef)
+    assert {"left", "right"} <= set(pair.instance_attrs)
+
+
+def test_attributes_assigned_to_other_modules_are_registered(
+    tmp_path: Path, manager: AstroidManager, module_file: Path
+) -> None:
+    point = _build(manager, module_file)["Point"]
+    user_file = tmp_path / "cached_user.py"
+    user_file.write_text("import cached_module\ncached_module.point.y = 2\n")
+    built = manager.ast_from_file(str(user_file), "cached_user")
+    assert point.instance_attrs["y"] == [built.body[1].targets[0]]
+
+    # Storing reuses the assignments registered when building the module.
+    with mock.patch.object(nodes.Attribute, "infer") as infer:
+        assert manager.persistent_cache.store(manager, built)
+    infer.assert_not_called()
+
+    del point.instance_attrs["y"]
+    del manager.astroid_cache["cached_user"]
+    loaded = manager.ast_from_file(str(user_file), "cached_user")
+    assert manager.persistent_cache.hits == 1
+    assert point.instance_attrs["y"] == [loaded.body[1].targets[0]]
+
+
+def test_modified_source_is_rebuilt(manager: AstroidManager, module_file: Path) -> None:
+    _build(manager, module_file)
+    module_file.write_text(SOURCE + "\nextra = 1\n", encoding="utf-8")
+    stat = module_file.stat()
+    os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    module = _build(manager, module_file)
+    assert manager.persistent_cache.hits == 0
+    assert "extra" in module.locals
+
+
+def test_touched_but_unchanged_source_hits(
+    manager: AstroidManager, module_file: Path
+) -> None:
+    _build(manager, module_file)
+    stat = module_file.stat()
+    os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    _build(manager, module_file)
+    assert manager.persistent_cache.hits == 1
+
+
+def test_corrupt_entry_is_rebuilt(manager: AstroidManager, module_file: Path) -> None:
+    _build(manager, module_file)
+    cache = manager.persistent_cache
+    (entry,) = Path(cache.directory).iterdir()
+    entry.write_bytes(entry.read_bytes()[:100])
+
+    module = _build(manager, module_file)
+    assert cache.hits == 0
+    assert "Point" in module.locals
+    # The entry was written again and is usable.
+    _build(manager, module_file)
+    assert cache.hits == 1
+
+
+def test_transforms_change_invalidates(
+    manager: AstroidManager, module_file: Path
+) -> None:
+    _build(manager, module_file)
+    before = transforms_fingerprint(manager)
+
+    def transform(node: nodes.Const) -> None:
+        return None
+
+    manager.register_transform(nodes.Const, transform)
+    try:
+        assert transforms_fingerprint(manager) != before
+        _build(manager, module_file)
+        assert manager.persistent_cache.hits == 0
+    finally:
+        manager.unregister_transform(nodes.Const, transform)
+
+
+def test_unserializable_module_is_not_stored(
+    tmp_path: Path, manager: AstroidManager, module_file: Path
+) -> None:
+    cache = PersistentModuleCache(tmp_path / "other")
+    module = _build(manager, module_file)
+    module.body[0]._explicit_inference = lambda node, context: iter([node])
+    assert not cache.store(manager, module)
+    assert not (tmp_path / "other").exists()
+
+
+def test_builtins_snapshot_skips_inspection(manager: AstroidManager) -> None:
+    manager.clear_cache()
+    live = manager.builtins_module
+    assert any(Path(manager.persistent_cache_dir).glob("builtins-*"))
+
+    with mock.patch.object(InspectBuilder, "inspect_build") as inspect_build:
+        manager.clear_cache()
+    inspect_build.assert_not_called()
+    loaded = manager.builtins_module
+    assert loaded is not live
+    assert set(loaded.locals) == set(live.locals)
+    assert loaded["int"].locals["__init_subclass__"][0].object == int.__init_subclass__
+
+    const = extract_node("'a'.upper()")
+    assert next(const.infer()).pytype() == "builtins.str"
+    generator = extract_node("def gen():\n    yield 1\ngen() #@")
+    assert next(generator.infer())._proxied is loaded["generator"]
+
+
+def test_builtins_snapshot_mismatch_inspects_live_builtins(
+    manager: AstroidManager,
+) -> None:
+    manager.clear_cache()
+    with (
+        mock.patch("astroid.raw_building._builtins_fingerprint", return_value="0"),
+        mock.patch.object(
+            InspectBuilder,
+            "inspect_build",
+            autospec=True,
+            side_effect=InspectBuilder.inspect_build,
+        ) as inspect_build,
+    ):
+        manager.clear_cache()
+    inspect_build.assert_called_once()
+    assert "int" in manager.builtins_module
+
+
+def _set_mtime(path: Path, seconds_ago: int) -> None:
+    """Set the mtime of *path* in the past, where it is not too recent to trust."""
+    mtime = os.stat(path).st_mtime_ns - seconds_ago * 1_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def project(tmp_path: Path, manager: AstroidManager) -> Iterator[Path]:
+    project = tmp_path / "project"
+    package = project / "resolved_package"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (project / "resolved_module.py").write_text("", encoding="utf-8")
+    _set_mtime(package, 10)
+    _set_mtime(project, 10)
+    manager.search_path = [str(project)]
+    try:
+        yield project
+    finally:
+        manager.search_path = None
+
+
+def _resolve_in_new_process(manager: AstroidManager, modname: str) -> object:
+    """Resolve *modname* as a new process using the same cache directory would."""
+    manager.clear_cache()
+    manager.persistent_cache_dir = manager.persistent_cache_dir
+    try:
+        return manager.file_from_module_name(modname, None)
+    except AstroidImportError as exc:
+        return exc
+
+
+@pytest.mark.usefixtures("project")
+def test_import_resolution_reused(manager: AstroidManager) -> None:
+    found = manager.file_from_module_name("resolved_module", None)
+    with pytest.raises(AstroidImportError):
+        manager.file_from_module_name("missing_module", None)
+
+    with mock.patch("astroid.manager.file_info_from_modpath") as resolve:
+        assert _resolve_in_new_process(manager, "resolved_module") == found
+        missing = _resolve_in_new_process(manager, "missing_module")
+    resolve.assert_not_called()
+    assert isinstance(missing, AstroidImportError)
+    assert "missing_module" in str(missing)
+    assert manager.persistent_cache.import_hits == 1
+
+
+def test_changed_search_path_invalidates(
+    manager: AstroidManager, project: Path
+) -> None:
+    with pytest.raises(AstroidImportError):
+        manager.file_from_module_name("missing_module", None)
+    (project / "missing_module.py").write_text("", encoding="utf-8")
+    _set_mtime(project, 5)
+
+    found = _resolve_in_new_process(manager, "missing_module")
+    assert found.location == str(project / "missing_module.py")
+    assert manager.persistent_cache.import_misses == 1
+
+
+def test_changed_package_invalidates_submodules(
+    manager: AstroidManager, project: Path
+) -> None:
+    with pytest.raises(AstroidImportError):
+        manager.file_from_module_name("resolved_package.missing_module", None)
+    package = project / "resolved_package"
+    (package / "missing_module.py").write_text("", encoding="utf-8")
+    _set_mtime(package, 5)
+
+    found = _resolve_in_new_process(manager, "resolved_package.missing_module")
+    assert found.location == str(package / "missing_module.py")
+    assert manager.persistent_cache.import_misses == 1
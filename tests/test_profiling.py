@@ -0,0 +1,95 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Tests for the profiling of the inference."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from astroid import bases, extract_node, profiling
+from astroid.__main__ import main
+from astroid.context import _INFERENCE_CACHE
+from astroid.manager import AstroidManager
+from astroid.nodes import NodeNG, node_classes
+from astroid.transforms import TransformVisitor
+
+
+@pytest.fixture
+def cleared_caches() -> Iterator[None]:
+    # The cache hits counted depend on what the previous tests inferred.
+    AstroidManager().clear_cache()
+    yield
+    AstroidManager().clear_cache()
+
+
+@pytest.mark.usefixtures("cleared_caches")
+def test_profile_collects_timings() -> None:
+    hits, misses = _INFERENCE_CACHE.hits, _INFERENCE_CACHE.misses
+    with profiling.profile() as stats:
+        node = extract_node("""
+        import collections
+        Point = collections.namedtuple("Point", "x y")
+        Point(1, 2).x #@
+        """)
+        node.inferred()
+        node.inferred()
+
+    attribute = stats.timing(profiling.NODE, "Attribute")
+    assert attribute.calls >= 2
+    assert attribute.cache_hits >= 1
+    node_timings = stats.by_kind(profiling.NODE).values()
+    assert sum(timing.cache_hits for timing in node_timings) == (
+        _INFERENCE_CACHE.hits - hits
+    )
+    assert sum(timing.cache_misses for timing in node_timings) == (
+        _INFERENCE_CACHE.misses - misses
+    )
+    assert 0 <= attribute.self_time <= attribute.cumulative_time <= stats.duration
+    assert "astroid.brain.brain_namedtuple_enum.infer_named_tuple" in stats.by_kind(
+        profiling.INFERENCE_TIP
+    )
+    assert stats.by_kind(profiling.TRANSFORM)
+    assert stats.timing(profiling.MODULE, "collections").calls >= 1
+    assert max(timing.max_depth for timing in stats.by_kind(profiling.NODE).values())
+
+    report = stats.report(limit=1)
+    assert "By node:" in report
+    assert "more" in report
+
+
+def test_profile_restores_entry_points() -> None:
+    originals = (
+        NodeNG.infer,
+        bases._infer_stmts,
+        node_classes._infer_stmts,
+        TransformVisitor._transform,
+        AstroidManager.ast_from_module_name,
+    )
+    with profiling.profile():
+        assert NodeNG.infer is not originals[0]
+        with pytest.raises(RuntimeError):
+            with profiling.profile():
+                pass
+    assert (
+        NodeNG.infer,
+        bases._infer_stmts,
+        node_classes._infer_stmts,
+        TransformVisitor._transform,
+        AstroidManager.ast_from_module_name,
+    ) == originals
+
+
+def test_profile_command(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    file = tmp_path / "profiled.py"
+    file.write_text("import os\nos.path.join('a', 'b')\n", encoding="utf-8")
+    assert main(["profile", str(file), "--limit", "3"]) == 0
+    output = capsys.readouterr().out
+    assert output.startswith("Profiled")
+    assert "By module:" in output
+
+    assert main(["profile", str(tmp_path / "missing.py")]) == 1
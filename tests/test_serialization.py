@@ -0,0 +1,154 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Tests for the binary serialization of trees."""
+
+from __future__ import annotations
+
+import io
+import textwrap
+from typing import Any
+
+import pytest
+
+from astroid import builder, nodes, test_utils
+from astroid.nodes import serialization
+
+SOURCE = textwrap.dedent("""
+    import collections
+    from os import path as os_path
+
+    class Point:
+        '''A point.'''
+
+        def __init__(self, x: int, y: int = 0) -> None:
+            self.x = x
+            self.y = y
+
+        @property
+        def norm(self):
+            return (self.x ** 2 + self.y ** 2) ** 0.5
+
+    Pair = collections.namedtuple("Pair", "left right")
+    point = Point(1, y=2)
+    values = {1: "one", (2, 3): b"two", "key": {1.5, 2j}}
+    text = f"{point!r:>10}"
+    with open(__file__) as stream:
+        lines = [line for line in stream if line]
+    """)
+
+
+@pytest.fixture
+def module() -> nodes.Module:
+    return builder.parse(SOURCE, module_name="serialized")
+
+
+def _round_trip(module: nodes.Module) -> nodes.Module:
+    stream = io.BytesIO()
+    module.dump(stream)
+    stream.seek(0)
+    return nodes.load(stream)
+
+
+def test_round_trip_keeps_the_tree(module: nodes.Module) -> None:
+    loaded = _round_trip(module)
+    assert loaded is not module
+    assert loaded.as_string() == module.as_string()
+    assert loaded.repr_tree() == module.repr_tree()
+
+    originals = list(module.nodes_of_class(nodes.NodeNG))
+    copies = list(loaded.nodes_of_class(nodes.NodeNG))
+    assert len(copies) == len(originals)
+    for original, copy in zip(originals, copies):
+        assert type(copy) is type(original)
+        assert copy.position == original.position
+        assert (copy.lineno, copy.col_offset) == (original.lineno, original.col_offset)
+        assert (copy.end_lineno, copy.end_col_offset) == (
+            original.end_lineno,
+            original.end_col_offset,
+        )
+        for child in copy.get_children():
+            assert child.parent is copy
+
+
+def test_round_trip_keeps_locals(module: nodes.Module) -> None:
+    loaded = _round_trip(module)
+    assert set(loaded.locals) == set(module.locals)
+    for name, assignments in loaded.locals.items():
+        for assignment in assignments:
+            assert assignment.root() is loaded, name
+    point = loaded["Point"]
+    assert point.parent is loaded
+    assert point.doc_node.value == "A point."
+    assert [n.parent for n in point.locals["__init__"]] == [point]
+    assert [n.attrname for n in point.instance_attrs["x"]] == ["x"]
+
+
+def test_loaded_module_infers(module: nodes.Module) -> None:
+    loaded = _round_trip(module)
+    point = next(loaded["point"].infer())
+    assert point.pytype() == "serialized.Point"
+    assert point._proxied is loaded["Point"]
+    pair = next(loaded["Pair"].infer())
+    assert isinstance(pair, nodes.ClassDef)
+    assert {"left", "right"} <= set(pair.instance_attrs)
+    assert next(loaded.igetattr("os_path")).name in {"posixpath", "ntpath"}
+
+
+def test_loads_rejects_other_versions(module: nodes.Module) -> None:
+    data = nodes.dumps(module)
+    with pytest.raises(ValueError, match="version"):
+        nodes.loads(data[:8] + bytes((serialization.FORMAT_VERSION + 1,)) + data[9:])
+    with pytest.raises(ValueError):
+        nodes.loads(b"not a tree")
+    with pytest.raises(ValueError):
+        nodes.loads(data[:100])
+
+
+def _reference_to_other_module(
+    source: str, with_source: bool = True
+) -> tuple[Any, bytes]:
+    """Serialize a reference to a node of a cached module built from *source*."""
+    manager = test_utils.brainless_manager()
+    other = builder.AstroidBuilder(manager).string_build(source, "other")
+    if not with_source:
+        other.file_bytes = None
+    return manager, serialization._dumps((other.body[0].value,), manager=manager)
+
+
+def _replace_other_module(manager: Any, source: str, with_source: bool = True) -> None:
+    other = builder.AstroidBuilder(manager).string_build(source, "replaced")
+    other.name = "other"
+    if not with_source:
+        other.file_bytes = None
+    manager.astroid_cache["other"] = other
+
+
+def test_loads_resolves_references_to_other_modules() -> None:
+    manager, data = _reference_to_other_module("x = 1\n")
+    other = manager.astroid_cache["other"]
+    assert serialization._loads(data, manager=manager) == (other.body[0].value,)
+
+
+def test_loads_rejects_changed_modules() -> None:
+    manager, data = _reference_to_other_module("x = 1\n")
+    # The path still leads to a constant, but the source changed.
+    _replace_other_module(manager, "x = 2\n")
+    with pytest.raises(ValueError, match="changed"):
+        serialization._loads(data, manager=manager)
+
+
+def test_loads_rejects_stale_paths() -> None:
+    # Modules without a source cannot be told apart, but the path to the
+    # constant does not lead anywhere in the new one.
+    manager, data = _reference_to_other_module("x = 1\n", with_source=False)
+    _replace_other_module(manager, "pass\n", with_source=False)
+    with pytest.raises(ValueError, match="Invalid"):
+        serialization._loads(data, manager=manager)
+
+
+def test_dumps_rejects_unserializable_values(module: nodes.Module) -> None:
+    module.body[0]._explicit_inference = lambda node, context: iter([node])
+    with pytest.raises(TypeError):
+        nodes.dumps(module)
@@ -0,0 +1,111 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/pylint-dev/astroid/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/astroid/blob/main/CONTRIBUTORS.txt
+
+"""Tests for the templates of nodes, parsed once and copied for each use."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+from astroid import builder, nodes
+from astroid.manager import AstroidManager
+from astroid.templates import Template
+
+POINT = Template("""
+class _Point(tuple):
+    _fields = ('_x', '_y')
+    def _replace(self, _x=None, _y=None):
+        return self
+    _x = property(lambda self: self[0])
+    _y = property(lambda self: self[1])
+""")
+
+
+def test_parses_once() -> None:
+    template = Template("def method(self): return self")
+    with mock.patch.object(
+        builder, "extract_node", wraps=builder.extract_node
+    ) as extract_node:
+        first = template.copy()
+        second = template.copy()
+    assert extract_node.call_count == 1
+    assert first is not second
+    assert first.as_string() == second.as_string()
+
+
+def test_copies_are_independent() -> None:
+    first = POINT.copy()
+    second = POINT.copy()
+    first.locals["extra"] = [nodes.Const(1)]
+    first.body[1].args.args.pop()
+    assert "extra" not in second.locals
+    assert [arg.name for arg in second.body[1].args.args] == ["self", "_x", "_y"]
+    assert not {id(node) for node in first.nodes_of_class(nodes.NodeNG)} & {
+        id(node) for node in second.nodes_of_class(nodes.NodeNG)
+    }
+
+
+def test_copy_links() -> None:
+    copy = POINT.copy()
+    for node in copy.nodes_of_class(nodes.NodeNG):
+        for child in node.get_children():
+            assert child.parent is node
+    assert copy.locals["_replace"] == [copy.body[1]]
+    assert copy.body[1].locals["_x"] == [copy.body[1].args.args[1]]
+    # Each copy gets a copy of the module of the code, so names defined by the
+    # code of the template still resolve.
+    assert isinstance(copy.parent, nodes.Module)
+    assert copy.parent is not POINT.copy().parent
+    assert copy.parent.locals["_Point"] == [copy]
+
+
+def test_copy_uses_other_names_of_the_code() -> None:
+    template = Template("import collections; collections.namedtuple")
+    first = template.copy()
+    second = template.copy()
+    assert first.root() is not second.root()
+    assert next(first.infer()).qname() == "collections.namedtuple"
+    assert next(second.expr.infer()).name == "collections"
+
+
+def test_substitutes_names() -> None:
+    copy = POINT.copy(names={"_Point": "Point", "_x": "x", "_y": "µ"})
+    assert copy.name == "Point"
+    assert list(copy.locals) == [
+        "__module__",
+        "__qualname__",
+        "__annotations__",
+        "_fields",
+        "_replace",
+        "x",
+        # Identifiers are normalized as the parser does.
+        "μ",
+    ]
+    assert [arg.name for arg in copy.body[1].args.args] == ["self", "x", "μ"]
+    assert copy.locals["x"][0].name == "x"
+    # String constants are left alone, even when equal to a placeholder.
+    fields = next(copy.igetattr("_fields"))
+    assert [elt.value for elt in fields.elts] == ["_x", "_y"]
+    assert POINT.copy().name == "_Point"
+
+
+def test_parsed_for_each_manager() -> None:
+    template = Template("def method(self): return self")
+    with mock.patch.object(
+        builder, "extract_node", wraps=builder.extract_node
+    ) as extract_node:
+        template.copy()
+        with AstroidManager.isolated().activate():
+            template.copy()
+            template.copy()
+        template.copy()
+    assert extract_node.call_count == 2
+
+
+def test_copy_parent() -> None:
+    parent = builder.extract_node("class Owner: pass")
+    copy = Template("def method(self): return self").copy(parent=parent)
+    assert copy.parent is parent
+    assert copy.scope().parent is parent
+    assert copy.body[0].value.lookup("self")[1] == [copy.args.args[0]]